@@ -15,7 +15,9 @@ import logging
 import os
 from pathlib import Path
 
-from decouple import config
+from decouple import Csv, config
+
+from core_utils.utils.logging_utils import configure_queue_logging
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -37,13 +39,20 @@ ALLOWED_HOSTS = ["*"]
 logger = logging.getLogger(__name__)
 syslog = logging.StreamHandler()
 formatter = logging.Formatter(
-    "INFO => AT: %(asctime)s API/FUNC: %(app_name)s MSG: %(message)s"
+    "%(levelname)s => AT: %(asctime)s ID: %(correlation_id)s API/FUNC: %(app_name)s MSG: %(message)s"
 )
 syslog.setFormatter(formatter)
-logger.addHandler(syslog)
-
-logging.basicConfig(filename="app.log")
-logger.setLevel(logging.DEBUG)
+logfile = logging.FileHandler("app.log")
+logfile.setFormatter(formatter)
+
+# ? records are written by a listener thread, see core_utils.utils.logging_utils
+configure_queue_logging(
+    logger=logger,
+    handlers=[syslog, logfile],
+    level=config("LOG_LEVEL", "INFO"),
+    # Keep 1 of this many DEBUG records per logger
+    debug_sample_rate=config("LOG_DEBUG_SAMPLE_RATE", 1, cast=int),
+)
 # Application definition
 
 CUSTOM_APPS = [
@@ -98,6 +107,8 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = "user_auth.UserModel"
 
 MIDDLEWARE = [
+    "core_utils.utils.middlewares.CorrelationIdMiddleware",
+    "core_utils.utils.middlewares.PerformanceProfilerMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -260,6 +271,99 @@ AUTO_REGISTER_MODEL_APPS = []
 
 DISABLE_MULTI_LOGIN = True
 
+# ? allocation file upload settings
+# Files at least this large (bytes) are read in row chunks from disk, 0 disables streaming
+ALLOCATION_FILE_STREAMING_MIN_FILE_SIZE = config(
+    "ALLOCATION_FILE_STREAMING_MIN_FILE_SIZE", 20 * 1024 * 1024, cast=int
+)
+# Rows validated and persisted per chunk during allocation upload/reupload
+ALLOCATION_FILE_CHUNK_SIZE = config("ALLOCATION_FILE_CHUNK_SIZE", 5000, cast=int)
+# Rows per bulk_create batch when creating allocation cases
+ALLOCATION_CASE_BULK_BATCH_SIZE = config(
+    "ALLOCATION_CASE_BULK_BATCH_SIZE", 2000, cast=int
+)
+# Use COPY into a staging table on Postgres instead of bulk_create
+ALLOCATION_CASE_COPY_ENABLED = config("ALLOCATION_CASE_COPY_ENABLED", True, cast=bool)
+
+# ? background job settings
+# Run allocation uploads/reuploads in the `run_background_jobs` worker instead of the request,
+# only enable it where the worker is deployed
+BACKGROUND_JOBS_ENABLED = config("BACKGROUND_JOBS_ENABLED", False, cast=bool)
+# Seconds the worker sleeps when no job is pending
+BACKGROUND_JOB_POLL_INTERVAL = config("BACKGROUND_JOB_POLL_INTERVAL", 2, cast=float)
+# Running jobs without a progress update for this many seconds are marked failed
+BACKGROUND_JOB_STALE_TIMEOUT = config("BACKGROUND_JOB_STALE_TIMEOUT", 3600, cast=int)
+
+# ? case rescoring settings
+# Cases loaded and rescored per batch by the `rescore_cases` command
+CASE_RESCORING_BATCH_SIZE = config("CASE_RESCORING_BATCH_SIZE", 5000, cast=int)
+
+# ? pagination settings
+# Total count of keyset paginated lists: EXACT, CACHED or APPROXIMATE (PaginationCountModeEnum)
+KEYSET_PAGINATION_COUNT_MODE = config("KEYSET_PAGINATION_COUNT_MODE", "CACHED")
+# Seconds a list count is reused for identical filters
+PAGINATION_COUNT_CACHE_TTL = config("PAGINATION_COUNT_CACHE_TTL", 60, cast=int)
+# APPROXIMATE mode counts exactly below this many estimated rows
+PAGINATION_EXACT_COUNT_THRESHOLD = config(
+    "PAGINATION_EXACT_COUNT_THRESHOLD", 10000, cast=int
+)
+
+# ? token state settings
+# Seconds a token validation result is reused by the process before the database is checked again
+TOKEN_STATE_CACHE_TTL = config("TOKEN_STATE_CACHE_TTL", 60, cast=int)
+# Token validation results kept per process
+TOKEN_STATE_CACHE_MAX_SIZE = config("TOKEN_STATE_CACHE_MAX_SIZE", 10000, cast=int)
+
+# ? activity log settings
+# Write activity logs from an in-process buffer instead of inside the request
+ACTIVITY_LOG_BUFFER_ENABLED = config("ACTIVITY_LOG_BUFFER_ENABLED", True, cast=bool)
+# Pending activity logs triggering a flush, and rows per bulk_create batch
+ACTIVITY_LOG_BUFFER_BATCH_SIZE = config("ACTIVITY_LOG_BUFFER_BATCH_SIZE", 200, cast=int)
+# Seconds between two flushes of the activity log buffer
+ACTIVITY_LOG_BUFFER_FLUSH_INTERVAL = config(
+    "ACTIVITY_LOG_BUFFER_FLUSH_INTERVAL", 2, cast=float
+)
+# Flushes an activity log failing to be written is kept for before it is dropped
+ACTIVITY_LOG_BUFFER_MAX_ATTEMPTS = config(
+    "ACTIVITY_LOG_BUFFER_MAX_ATTEMPTS", 3, cast=int
+)
+# Activity log deltas of at least this many bytes of JSON are stored zlib compressed
+ACTIVITY_LOG_COMPRESSION_MIN_SIZE = config(
+    "ACTIVITY_LOG_COMPRESSION_MIN_SIZE", 2048, cast=int
+)
+# Monthly activity log partitions created ahead by `partition_activity_logs` (Postgres)
+ACTIVITY_LOG_PARTITION_MONTHS_AHEAD = config(
+    "ACTIVITY_LOG_PARTITION_MONTHS_AHEAD", 3, cast=int
+)
+# Months of activity logs and finished background jobs kept by `archive_activity_logs`
+ACTIVITY_LOG_RETENTION_MONTHS = config("ACTIVITY_LOG_RETENTION_MONTHS", 12, cast=int)
+# Directory of the gzipped JSON lines archives of older months
+ACTIVITY_LOG_ARCHIVE_DIR = config(
+    "ACTIVITY_LOG_ARCHIVE_DIR", os.path.join(BASE_DIR, "archives", "activity_logs")
+)
+
+# ? performance profiler settings
+# Profiles requests (middleware) and background jobs into PERFORMANCE_PROFILE_TABLE
+PERFORMANCE_PROFILER_ENABLED = config("PERFORMANCE_PROFILER_ENABLED", False, cast=bool)
+# Comma separated path prefixes of the profiled requests, every request when empty
+PERFORMANCE_PROFILER_PATH_PREFIXES = config(
+    "PERFORMANCE_PROFILER_PATH_PREFIXES", "", cast=Csv()
+)
+# Profiles shorter than this are not saved
+PERFORMANCE_PROFILER_MIN_DURATION_MS = config(
+    "PERFORMANCE_PROFILER_MIN_DURATION_MS", 0, cast=int
+)
+# Most repeated queries kept per profile
+PERFORMANCE_PROFILER_MAX_DUPLICATE_QUERIES = config(
+    "PERFORMANCE_PROFILER_MAX_DUPLICATE_QUERIES", 10, cast=int
+)
+
+# ? query budget settings
+# Counts the queries of the GET requests of CoreGeneric views declaring a query_budget
+QUERY_BUDGET_ENABLED = config("QUERY_BUDGET_ENABLED", DEBUG, cast=bool)
+# Raise QueryBudgetExceeded instead of logging a warning (test settings)
+QUERY_BUDGET_RAISE = config("QUERY_BUDGET_RAISE", False, cast=bool)
+
 STATIC_ROOT = BASE_DIR / "static"
 
 # * .env variables
@@ -4,9 +4,14 @@ from core_utils.activity_monitoring.api.v1.generics.utils.handlers.activity_meth
     ActivityMethodEnumHelperListEnumHandler,
 )
 from core_utils.activity_monitoring.models import (
+    ActivityMonitoringBackGroundActivityModel,
     ActivityMonitoringLinkedEntityModel,
     ActivityMonitoringLogModel,
     ActivityTypeModel,
+    PerformanceProfileModel,
+)
+from core_utils.utils.db_utils.activity_log_snapshots import (
+    get_activity_log_snapshots,
 )
 from core_utils.utils.generics.serializers.mixins import CoreGenericSerializerMixin
 
@@ -42,6 +47,36 @@ class ActivityMonitoringLogListModelSerializer(serializers.ModelSerializer):
         return {"method": obj.method.method, "color": obj.method.color}
 
 
+class ActivityMonitoringLogDetailModelSerializer(
+    ActivityMonitoringLogListModelSerializer
+):
+    """
+    Log row with the full before/after snapshots rebuilt from the stored deltas.
+    """
+
+    old_data = serializers.SerializerMethodField()
+    new_data = serializers.SerializerMethodField()
+
+    class Meta(ActivityMonitoringLogListModelSerializer.Meta):
+        fields = ActivityMonitoringLogListModelSerializer.Meta.fields + [
+            "primary_key",
+            "old_data",
+            "new_data",
+        ]
+
+    def get_snapshots(self, obj: ActivityMonitoringLogModel):
+        # ? rebuilt once for both fields
+        if not hasattr(obj, "_snapshots"):
+            obj._snapshots = get_activity_log_snapshots(instance=obj)
+        return obj._snapshots
+
+    def get_old_data(self, obj: ActivityMonitoringLogModel):
+        return self.get_snapshots(obj)[0]
+
+    def get_new_data(self, obj: ActivityMonitoringLogModel):
+        return self.get_snapshots(obj)[1]
+
+
 class ActivityMonitoringLinkedEntityModelSerializer(serializers.ModelSerializer):
     value = serializers.CharField(source="id")
     label = serializers.CharField(source="title")
@@ -66,3 +101,43 @@ class ActivityMethodEnumHelperListEnumSerializer(
     results = serializers.JSONField(required=False)
     handler_class = ActivityMethodEnumHelperListEnumHandler
     queryset = ActivityTypeModel.objects.all()
+
+
+class ActivityMonitoringBackGroundActivityModelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ActivityMonitoringBackGroundActivityModel
+        fields = [
+            "id",
+            "title",
+            "primary_key",
+            "status",
+            "percentage",
+            "description",
+            "result",
+            "start_time",
+            "end_time",
+            "core_generic_created_at",
+        ]
+
+
+class PerformanceProfileModelSerializer(serializers.ModelSerializer):
+    performed_by = serializers.CharField(source="performed_by.username", default=None)
+
+    class Meta:
+        model = PerformanceProfileModel
+        fields = [
+            "id",
+            "kind",
+            "name",
+            "method",
+            "status_code",
+            "correlation_id",
+            "performed_by",
+            "wall_time_ms",
+            "query_count",
+            "query_time_ms",
+            "duplicate_query_count",
+            "duplicate_queries",
+            "stages",
+            "core_generic_created_at",
+        ]
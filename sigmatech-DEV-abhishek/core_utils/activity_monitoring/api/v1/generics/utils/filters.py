@@ -2,17 +2,22 @@ import django_filters
 
 from core_utils.activity_monitoring.models import (
     ActivityMonitoringLogModel,
+    PerformanceProfileModel,
+)
+from core_utils.activity_monitoring.enums import (
+    ActivityMonitoringMethodTypeEnumChoices,
+    PerformanceProfileKindEnum,
 )
-from core_utils.activity_monitoring.enums import ActivityMonitoringMethodTypeEnumChoices
 from core_utils.utils.filter_utils import (
     ChoiceInFilter,
-    DateRangeCommaSeparatedFilter,
+    DateTimeRangeCommaSeparatedFilter,
     UUIDInFilter,
 )
 
 
 class ActivityMonitoringLogFilterSet(django_filters.FilterSet):
-    core_generic_created_at = DateRangeCommaSeparatedFilter(
+    # ? bounds on the column itself, the partitions outside the range are pruned
+    core_generic_created_at = DateTimeRangeCommaSeparatedFilter(
         field_name="core_generic_created_at"
     )
 
@@ -43,3 +48,35 @@ class ActivityMonitoringLogFilterSet(django_filters.FilterSet):
             "linked_entity",
             "performed_by",
         ]
+
+
+class PerformanceProfileFilterSet(django_filters.FilterSet):
+    core_generic_created_at = DateTimeRangeCommaSeparatedFilter(
+        field_name="core_generic_created_at"
+    )
+    kind = ChoiceInFilter(
+        field_name="kind",
+        choices=PerformanceProfileKindEnum.choices(),
+        lookup_expr="in",
+    )
+    name = django_filters.CharFilter(field_name="name", lookup_expr="startswith")
+    wall_time_ms = django_filters.NumberFilter(
+        field_name="wall_time_ms", lookup_expr="gte"
+    )
+    query_count = django_filters.NumberFilter(
+        field_name="query_count", lookup_expr="gte"
+    )
+    correlation_id = django_filters.CharFilter(
+        field_name="correlation_id", lookup_expr="startswith"
+    )
+
+    class Meta:
+        model = PerformanceProfileModel
+        fields = [
+            "core_generic_created_at",
+            "kind",
+            "name",
+            "wall_time_ms",
+            "query_count",
+            "correlation_id",
+        ]
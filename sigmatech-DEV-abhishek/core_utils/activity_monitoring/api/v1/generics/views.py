@@ -1,16 +1,22 @@
 from core_utils.activity_monitoring.api.v1.generics.serializers import (
     ActivityMethodEnumHelperListEnumSerializer,
+    ActivityMonitoringBackGroundActivityModelSerializer,
     ActivityMonitoringLinkedEntityModelSerializer,
+    ActivityMonitoringLogDetailModelSerializer,
     ActivityMonitoringLogListModelSerializer,
     ActivityTypeHelperListModelSerializer,
+    PerformanceProfileModelSerializer,
 )
 from core_utils.activity_monitoring.api.v1.generics.utils.filters import (
     ActivityMonitoringLogFilterSet,
+    PerformanceProfileFilterSet,
 )
 from core_utils.activity_monitoring.models import (
+    ActivityMonitoringBackGroundActivityModel,
     ActivityMonitoringLinkedEntityModel,
     ActivityMonitoringLogModel,
     ActivityTypeModel,
+    PerformanceProfileModel,
 )
 from core_utils.utils.generics.views.generic_views import (
     CoreGenericGetAPIView,
@@ -22,6 +28,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from user_config.user_auth.utils.custom_authentication.custom_authentication import (
     CustomAuthentication,
 )
+from user_config.user_auth.utils.permissions import IsAdminRolePermission
 
 
 class ActivityMonitoringLogListModelGenericAPIView(
@@ -33,9 +40,13 @@ class ActivityMonitoringLogListModelGenericAPIView(
     permission_classes = [permissions.IsAuthenticated]
     search_fields = ["activity_type__lable", "description"]
     filterset_class = ActivityMonitoringLogFilterSet
+    query_budget = 4
 
     def get_queryset(self):
-        return self.queryset.all()
+        # ? snapshots are only read by the detail API, `method` by a method field
+        return self.queryset.select_related("method").defer(
+            "old_data", "new_data", "compressed_data"
+        )
 
     def get_serializer_class(self):
 
@@ -44,6 +55,26 @@ class ActivityMonitoringLogListModelGenericAPIView(
         }.get(self.request.method)
 
 
+class ActivityMonitoringLogDetailGenericAPIView(
+    CoreGenericGetAPIView,
+    generics.GenericAPIView,
+):
+    """
+    Activity log with the full before/after snapshots of the logged instance.
+    """
+
+    queryset = ActivityMonitoringLogModel.objects.all()
+    authentication_classes = [CustomAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    many = False
+    pk_scope = "KWARGS"
+
+    def get_serializer_class(self):
+        return {
+            "GET": ActivityMonitoringLogDetailModelSerializer,
+        }.get(self.request.method)
+
+
 class ActivityMonitoringLinkedEntityHelperGenericAPIView(
     CoreGenericGetAPIView,
     generics.GenericAPIView,
@@ -93,3 +124,49 @@ class ActivityMethodEnumHelperListEnumAPIView(
         return {
             "GET": ActivityMethodEnumHelperListEnumSerializer,
         }.get(self.request.method)
+
+
+class ActivityMonitoringBackGroundActivityDetailAPIView(
+    CoreGenericGetAPIView,
+    generics.GenericAPIView,
+):
+    """
+    Status, stage and percentage of a background job (e.g. an allocation file upload).
+    """
+
+    queryset = ActivityMonitoringBackGroundActivityModel.objects.all()
+    authentication_classes = [CustomAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    many = False
+    pk_scope = "KWARGS"
+
+    def get_serializer_class(self):
+        return {
+            "GET": ActivityMonitoringBackGroundActivityModelSerializer,
+        }.get(self.request.method)
+
+
+class PerformanceProfileListGenericAPIView(
+    CoreGenericListCreateAPIView, generics.ListAPIView
+):
+    """
+    Saved performance profiles of requests and background jobs, admins only.
+    """
+
+    queryset = PerformanceProfileModel.objects.select_related("performed_by")
+    authentication_classes = [CustomAuthentication]
+    filter_backends = [filters.OrderingFilter, DjangoFilterBackend]
+    permission_classes = [permissions.IsAuthenticated, IsAdminRolePermission]
+    filterset_class = PerformanceProfileFilterSet
+    ordering_fields = [
+        "core_generic_created_at",
+        "wall_time_ms",
+        "query_count",
+        "query_time_ms",
+        "duplicate_query_count",
+    ]
+
+    def get_serializer_class(self):
+        return {
+            "GET": PerformanceProfileModelSerializer,
+        }.get(self.request.method)
@@ -9,6 +9,11 @@ urlpatterns: list = [
         views.ActivityMonitoringLogListModelGenericAPIView.as_view(),
         name="ActivityMonitoringLogListModelGenericAPIView",
     ),
+    path(
+        "activity-monitoring-detail-api/<str:id>/",
+        views.ActivityMonitoringLogDetailGenericAPIView.as_view(),
+        name="ActivityMonitoringLogDetailGenericAPIView",
+    ),
     path(
         "activity-monitoring-linked-entity-helper-list-api/",
         views.ActivityMonitoringLinkedEntityHelperGenericAPIView.as_view(),
@@ -24,4 +29,14 @@ urlpatterns: list = [
         views.ActivityMethodEnumHelperListEnumAPIView.as_view(),
         name="ActivityMethodEnumHelperListEnumAPIView",
     ),
+    path(
+        "activity-monitoring-background-activity-api/<str:id>/",
+        views.ActivityMonitoringBackGroundActivityDetailAPIView.as_view(),
+        name="ActivityMonitoringBackGroundActivityDetailAPIView",
+    ),
+    path(
+        "performance-profile-list-api/",
+        views.PerformanceProfileListGenericAPIView.as_view(),
+        name="PerformanceProfileListGenericAPIView",
+    ),
 ]
@@ -15,5 +15,11 @@ class ActivityMonitoringBackGroundActivityEnum(EnumChoices):
 
 class ActivityMonitoringBackGroundStatusEnum(EnumChoices):
     PENDING = "PENDING"
+    RUNNING = "RUNNING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
+
+
+class PerformanceProfileKindEnum(EnumChoices):
+    REQUEST = "REQUEST"
+    JOB = "JOB"
@@ -1,9 +1,11 @@
 import uuid
 from django.db import models
+from django.utils import timezone
 from core_utils.activity_monitoring.enums import (
     ActivityMonitoringBackGroundActivityEnum,
     ActivityMonitoringBackGroundStatusEnum,
     ActivityMonitoringMethodTypeEnumChoices,
+    PerformanceProfileKindEnum,
 )
 from core_utils.utils.generics.generic_models import CoreGenericModel
 from django.contrib.contenttypes.models import ContentType
@@ -120,6 +122,17 @@ class ActivityMonitoringLogModel(CoreGenericModel):
 
     old_data = models.JSONField(blank=True, null=True, db_column="OLD_DATA")
     new_data = models.JSONField(blank=True, null=True, db_column="NEW_DATA")
+    # ? changed fields only, see core_utils.utils.db_utils.activity_log_snapshots
+    is_delta = models.BooleanField(default=False, db_column="IS_DELTA")
+    # ? large deltas, zlib compressed JSON of old_data/new_data (left empty)
+    compressed_data = models.BinaryField(
+        blank=True, null=True, db_column="COMPRESSED_DATA"
+    )
+    # ? time of the event, set when the row is built rather than when the
+    # activity log buffer writes it
+    core_generic_created_at = models.DateTimeField(
+        default=timezone.now, null=True, db_column="CORE_GENERIC_CREATED_AT"
+    )
 
     class Meta:
         db_table = "ACTIVITY_MONITORING_LOG_TABLE"
@@ -155,5 +168,87 @@ class ActivityMonitoringBackGroundActivityModel(CoreGenericModel):
 
     description = models.TextField(db_column="DESCRIPTION", null=True, blank=True)
 
+    # ? background job runner fields, see core_utils.utils.db_utils.background_jobs
+    task = models.CharField(
+        max_length=255, db_column="BACK_GROUND_TASK_PATH", null=True, blank=True
+    )
+    payload = models.JSONField(
+        db_column="BACK_GROUND_TASK_PAYLOAD", null=True, blank=True
+    )
+    result = models.JSONField(
+        db_column="BACK_GROUND_TASK_RESULT", null=True, blank=True
+    )
+    start_time = models.DateTimeField(
+        db_column="TASK_START_TIME", null=True, blank=True
+    )
+    attempts = models.PositiveSmallIntegerField(db_column="TASK_ATTEMPTS", default=0)
+
     class Meta:
         db_table = "ACTIVITY_MONITORING_BACK_GROUND_TASK_TABLE"
+        indexes = [
+            models.Index(
+                fields=["status", "core_generic_created_at"],
+                name="BACK_GROUND_TASK_QUEUE_IDX",
+            ),
+        ]
+
+
+class PerformanceProfileModel(CoreGenericModel):
+    """
+    Timings and SQL statistics of a profiled request or background job, see
+    core_utils.utils.db_utils.performance_profiler
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        unique=True,
+        editable=False,
+        db_column="PERFORMANCE_PROFILE_ID",
+        default=uuid.uuid4,
+    )
+    kind = models.CharField(
+        max_length=16,
+        choices=PerformanceProfileKindEnum.choices(),
+        db_column="PROFILE_KIND",
+    )
+    # ? request path or background job task path
+    name = models.CharField(max_length=255, db_column="PROFILE_NAME")
+    method = models.CharField(
+        max_length=16, db_column="HTTP_METHOD", null=True, blank=True
+    )
+    status_code = models.PositiveSmallIntegerField(
+        db_column="HTTP_STATUS_CODE", null=True, blank=True
+    )
+    correlation_id = models.CharField(
+        max_length=128, db_column="CORRELATION_ID", null=True, blank=True
+    )
+    performed_by = models.ForeignKey(
+        get_user_model(),
+        on_delete=models.SET_NULL,
+        related_name="PerformanceProfileModel_performed_by",
+        db_column="PERFORMED_BY",
+        null=True,
+        blank=True,
+    )
+    wall_time_ms = models.FloatField(db_column="WALL_TIME_MS")
+    query_count = models.PositiveIntegerField(db_column="QUERY_COUNT", default=0)
+    query_time_ms = models.FloatField(db_column="QUERY_TIME_MS", default=0)
+    duplicate_query_count = models.PositiveIntegerField(
+        db_column="DUPLICATE_QUERY_COUNT", default=0
+    )
+    # ? [{"sql": ..., "count": ...}], most repeated first
+    duplicate_queries = models.JSONField(
+        db_column="DUPLICATE_QUERIES", null=True, blank=True
+    )
+    # ? {"validation": ms, "save": ms, ...}, nested stages overlap their parent
+    stages = models.JSONField(db_column="PROFILE_STAGES", null=True, blank=True)
+
+    class Meta:
+        db_table = "PERFORMANCE_PROFILE_TABLE"
+        ordering = ("-core_generic_created_at",)
+        indexes = [
+            models.Index(
+                fields=["kind", "name", "core_generic_created_at"],
+                name="PERFORMANCE_PROFILE_NAME_IDX",
+            ),
+        ]
@@ -0,0 +1,128 @@
+import logging
+from typing import Any, Dict, List, Optional, Set, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from rest_framework import serializers
+
+from core.settings import logger
+from core_utils.manage_columns.models import UserConfigTableFieldsModel
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+
+def get_serializer_path(serializer_class: Type[serializers.BaseSerializer]) -> str:
+    # ? same dotted path as `CoreUtilsFeaturesModel.serializer`
+    return f"{serializer_class.__module__}.{serializer_class.__name__}"
+
+
+def get_user_active_columns(
+    user_instance: Any, serializer_class: Type[serializers.BaseSerializer]
+) -> Optional[List[str]]:
+    """
+    Active columns of the user for the feature rendered by `serializer_class`, in
+    their configured order.
+
+    Read with one indexed query on every request rather than cached: the
+    default cache is per process, so a saved preference would otherwise stay
+    stale on the other workers.
+
+    Without a saved preference, the serializer `default_manage_column_fields`
+    are used, as the manage columns API initializes them.
+
+    Returns:
+        Optional[List[str]]: Serializer field names, None when every field is shown.
+    """
+    if not getattr(user_instance, "pk", None):
+        return None
+    columns: List[str] = list(
+        UserConfigTableFieldsModel.objects.filter(
+            table__user=user_instance,
+            table__feature__serializer=get_serializer_path(
+                serializer_class=serializer_class
+            ),
+            table__feature__is_active=True,
+            is_active=True,
+        )
+        .order_by("order")
+        .values_list("title", flat=True)
+    )
+    return columns or (
+        list(getattr(serializer_class, "default_manage_column_fields", [])) or None
+    )
+
+
+def get_projected_model_fields(
+    serializer: serializers.Serializer, model: Type[Model]
+) -> Optional[List[str]]:
+    """
+    Concrete model fields read by the (projected) serializer fields, for
+    `QuerySet.only()`. Relations are kept by their foreign key so
+    `select_related` can still traverse them.
+
+    `SerializerMethodField`s read the model fields declared in the serializer
+    `manage_column_field_sources` (field name -> model fields). A method field
+    without declaration, or a source that is not a model field (property,
+    method), makes the projection unsafe and returns None.
+
+    Returns:
+        Optional[List[str]]: Model field names, None if every field must be loaded.
+    """
+    field_sources: Dict[str, List[str]] = getattr(
+        serializer, "manage_column_field_sources", {}
+    )
+    model_fields: Set[str] = {model._meta.pk.name}
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in field_sources:
+            model_fields.update(field_sources[name])
+            continue
+        if isinstance(field, serializers.SerializerMethodField) or field.source == "*":
+            return None
+        try:
+            model_field = model._meta.get_field(field.source.split(".")[0])
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        model_fields.add(model_field.name)
+    return sorted(model_fields)
+
+
+def apply_column_projection(
+    queryset: QuerySet[Model], serializer: serializers.Serializer
+) -> QuerySet[Model]:
+    """
+    Narrows the selected columns to `get_projected_model_fields()` and the
+    ordering fields (read again by keyset pagination). Querysets with
+    `only()`/`defer()` already applied, or returning dicts/tuples, are returned
+    unchanged.
+    """
+    if (
+        not isinstance(queryset, QuerySet)
+        or queryset.query.deferred_loading[0]
+        or queryset.query.values_select
+        or queryset.query.combinator
+    ):
+        return queryset
+
+    model_fields: Optional[List[str]] = get_projected_model_fields(
+        serializer=serializer, model=queryset.model
+    )
+    if model_fields is None:
+        return queryset
+
+    ordering_fields: List[str] = []
+    for item in queryset.query.order_by or queryset.model._meta.ordering:
+        if not isinstance(item, str):
+            continue
+        try:
+            ordering_field = queryset.model._meta.get_field(item.lstrip("-"))
+        except FieldDoesNotExist:
+            continue
+        if ordering_field.concrete:
+            ordering_fields.append(ordering_field.name)
+
+    return queryset.only(*model_fields, *ordering_fields)
@@ -0,0 +1,27 @@
+from typing import Dict
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core_utils.utils.db_utils.activity_log_partitions import archive_activity_logs
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Move activity logs and finished background jobs older than the retention "
+        "into gzipped monthly archives (ACTIVITY_LOG_ARCHIVE_DIR)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=None,
+            help="Months kept in the database (ACTIVITY_LOG_RETENTION_MONTHS)",
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        archived: Dict[str, int] = archive_activity_logs(
+            retention_months=options["retention_months"]
+        )
+        for table, archived_count in archived.items():
+            self.stdout.write(f"Archived {archived_count} rows of {table}")
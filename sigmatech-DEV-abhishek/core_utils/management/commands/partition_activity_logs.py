@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core_utils.utils.db_utils.activity_log_partitions import (
+    ensure_activity_log_partitions,
+    is_partitioning_supported,
+)
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Partition ACTIVITY_MONITORING_LOG_TABLE by month (Postgres) and create the "
+        "partitions of the coming months, to be scheduled monthly"
+    )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        if not is_partitioning_supported():
+            self.stdout.write("Partitioning is only supported on Postgres, skipped")
+            return
+
+        created_count: int = ensure_activity_log_partitions()
+        self.stdout.write(f"Created {created_count} activity log partitions")
@@ -0,0 +1,87 @@
+import signal
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from core_utils.activity_monitoring.models import (
+    ActivityMonitoringBackGroundActivityModel,
+)
+from core_utils.utils.db_utils.background_jobs import (
+    claim_next_background_job,
+    fail_stale_background_jobs,
+    run_background_job,
+)
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Run queued background jobs (allocation file uploads/reuploads) "
+        "from ACTIVITY_MONITORING_BACK_GROUND_TASK_TABLE"
+    )
+
+    stop_requested: bool = False
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=None,
+            help="Seconds to sleep when the queue is empty (BACKGROUND_JOB_POLL_INTERVAL)",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=0,
+            help="Exit after running this many jobs, 0 for no limit",
+        )
+
+    def request_stop(self, *args) -> None:
+        # Finish the running job, then exit
+        self.stop_requested = True
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        poll_interval: float = (
+            options["poll_interval"] or settings.BACKGROUND_JOB_POLL_INTERVAL
+        )
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+
+        processed_count: int = 0
+        while not self.stop_requested:
+            close_old_connections()
+            # Jobs of a worker that died while this one is running are failed on the next poll
+            stale_count: int = fail_stale_background_jobs()
+            if stale_count:
+                self.stdout.write(f"Marked {stale_count} stale jobs as failed")
+
+            job: Optional[ActivityMonitoringBackGroundActivityModel] = (
+                claim_next_background_job()
+            )
+
+            if not job:
+                if options["once"]:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            self.stdout.write(f"Running job {job.pk} ({job.title})")
+            start_time: float = time.time()
+            run_background_job(job=job)
+            job.refresh_from_db(fields=["status"])
+            self.stdout.write(
+                f"Job {job.pk} {job.status} in {time.time() - start_time:.2f} seconds"
+            )
+
+            processed_count += 1
+            if options["max_jobs"] and processed_count >= options["max_jobs"]:
+                break
+
+        self.stdout.write(f"Processed {processed_count} jobs")
@@ -1,9 +1,13 @@
+import datetime
+import json
 import os
+from decimal import Decimal
 from rest_framework.request import Request
 import uuid
 import tempfile
 import pandas as pd
-from typing import List, Dict, Any
+from openpyxl import Workbook
+from typing import List, Dict, Any, Optional
 
 from core_utils.media_storage.api.v1.utils.e2e_storage_converter import (
     FileToUrlE2EStorageConvertor,
@@ -40,6 +44,79 @@ def convert_data_to_excel_file(
     return file_path
 
 
+class ExcelFileRecordsWriter:
+    """
+    Builds an Excel file from records added batch by batch, for exports too
+    large to keep in memory. Records are spilled to a temporary JSON lines file
+    as they come, the workbook is written row by row (openpyxl write-only mode)
+    on `close()`. Columns are the keys of all the records, in order of first
+    appearance, as with `convert_data_to_excel_file()`.
+
+    Attributes:
+        records_count (int): Records added so far.
+    """
+
+    records_count: int
+
+    def __init__(self, file_prefix: str = "ERROR_FIELDS"):
+        self.file_prefix = file_prefix
+        self.records_count = 0
+        self._headers: Dict[str, None] = {}
+        self._spill_file = tempfile.NamedTemporaryFile(
+            mode="w+", suffix=".jsonl", encoding="utf-8", delete=False
+        )
+
+    def add_records(self, records: List[Dict[str, Any]]) -> None:
+        for record in records:
+            self._headers.update(dict.fromkeys(record))
+            self._spill_file.write(json.dumps(record, default=str) + "\n")
+            self.records_count += 1
+
+    @staticmethod
+    def _to_cell_value(value: Any) -> Any:
+        if value is None or isinstance(
+            value, (str, int, float, Decimal, datetime.date, datetime.time)
+        ):
+            return value
+        return str(value)
+
+    def close(self) -> Optional[str]:
+        """
+        Writes the workbook and removes the spill file.
+
+        Returns:
+            Optional[str]: Path of the Excel file, None when no record was added.
+        """
+        try:
+            if not self.records_count:
+                return None
+            file_path: str = os.path.join(
+                tempfile.gettempdir(), f"{self.file_prefix}_{uuid.uuid4().hex}.xlsx"
+            )
+            workbook: Workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet()
+            headers: List[str] = list(self._headers)
+            worksheet.append(headers)
+            self._spill_file.seek(0)
+            for line in self._spill_file:
+                record: Dict[str, Any] = json.loads(line)
+                worksheet.append(
+                    [self._to_cell_value(record.get(header)) for header in headers]
+                )
+            workbook.save(file_path)
+            return file_path
+        finally:
+            self.discard()
+
+    def discard(self) -> None:
+        """
+        Removes the spill file without writing the workbook.
+        """
+        self._spill_file.close()
+        if os.path.exists(self._spill_file.name):
+            os.remove(self._spill_file.name)
+
+
 def upload_file_object_and_get_url(request: Request, file_path: str) -> str:
     """
     Upload a local file to MinIO using FileToUrlE2EStorageConvertor
@@ -0,0 +1,218 @@
+import atexit
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from core.settings import logger
+from core_utils.activity_monitoring.models import (
+    ActivityMonitoringLogModel,
+    ActivityMonitoringMethodTypeColorPreferenceModel,
+    ActivityTypeModel,
+)
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+
+class ActivityLogBuffer:
+    """
+    In-process queue of activity log rows, written with `bulk_create` by a
+    daemon thread every `flush_interval` seconds (or once `batch_size` rows are
+    pending) instead of one INSERT inside each request.
+
+    Rows are queued when the surrounding transaction commits, so rolled back
+    operations are not logged, as with the synchronous writes. Rows still
+    pending are written at interpreter exit; a killed process loses them.
+
+    Attributes:
+        batch_size (int): Pending rows triggering a flush, and `bulk_create` batch size.
+        flush_interval (float): Seconds between two flushes of the daemon thread.
+        max_attempts (int): Flushes a failing row is written by before it is dropped.
+    """
+
+    batch_size: int
+    flush_interval: float
+    max_attempts: int
+
+    def __init__(self, batch_size: int, flush_interval: float, max_attempts: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._pending: List[ActivityMonitoringLogModel] = []
+        # ? rows of the running flush, and failed flushes per pending row
+        self._writing: List[ActivityMonitoringLogModel] = []
+        self._attempts: Dict[int, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+        # ? one flush at a time (daemon thread, atexit)
+        self._flush_lock: threading.Lock = threading.Lock()
+        self._flush_requested: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, instance: ActivityMonitoringLogModel) -> None:
+        """
+        Queues an unsaved log row once the current transaction commits.
+        """
+        transaction.on_commit(lambda: self._enqueue(instance))
+
+    def _enqueue(self, instance: ActivityMonitoringLogModel) -> None:
+        with self._lock:
+            self._pending.append(instance)
+            pending_count: int = len(self._pending)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="activity-log-buffer", daemon=True
+                )
+                self._thread.start()
+        if pending_count >= self.batch_size:
+            self._flush_requested.set()
+
+    def update(self, instance: ActivityMonitoringLogModel, **values: Any) -> None:
+        """
+        Changes fields of a log row, in memory while it is pending, in the
+        database once written.
+
+        Args:
+            instance (ActivityMonitoringLogModel): Row returned by the logger.
+            **values: Field values to set.
+        """
+        with self._lock:
+            for field, value in values.items():
+                setattr(instance, field, value)
+            is_writing: bool = any(row is instance for row in self._writing)
+            if instance._state.adding and not is_writing:
+                # ? not written yet, the flush writes the new values
+                return
+        # ? a flush writing the row may have read the old values, wait for it
+        with self._flush_lock:
+            is_written: bool = not instance._state.adding
+        if is_written:
+            type(instance).objects.filter(pk=instance.pk).update(**values)
+
+    def flush(self) -> int:
+        """
+        Writes every pending row. The pending rows are swapped out under the lock
+        and written outside of it, so requests queueing rows never wait for the
+        database. When `bulk_create` fails the rows are saved one by one, the
+        failing ones stay queued for `max_attempts` flushes.
+
+        Returns:
+            int: Number of rows written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending: List[ActivityMonitoringLogModel] = self._pending
+                self._pending = []
+                self._writing = pending
+            if not pending:
+                return 0
+
+            try:
+                ActivityMonitoringLogModel.objects.bulk_create(
+                    pending, batch_size=self.batch_size
+                )
+                failed: List[ActivityMonitoringLogModel] = []
+            except Exception as e:
+                logger.error(
+                    f"Failed to write {len(pending)} activity logs, "
+                    f"writing them one by one: {e}"
+                )
+                failed: List[ActivityMonitoringLogModel] = self._save_each(pending)
+
+            with self._lock:
+                self._writing = []
+                self._pending[:0] = self._get_retried(pending=pending, failed=failed)
+        written_count: int = len(pending) - len(failed)
+        logger.debug(f"Wrote {written_count} activity logs")
+        return written_count
+
+    def _save_each(
+        self, pending: List[ActivityMonitoringLogModel]
+    ) -> List[ActivityMonitoringLogModel]:
+        """
+        Returns:
+            List[ActivityMonitoringLogModel]: Rows that failed to be saved.
+        """
+        failed: List[ActivityMonitoringLogModel] = []
+        for instance in pending:
+            # ? rolled back batches of `bulk_create` are flagged as written
+            instance._state.adding = True
+            try:
+                instance.save(force_insert=True)
+            except Exception as e:
+                logger.error(f"Failed to write activity log {instance.pk}: {e}")
+                failed.append(instance)
+        return failed
+
+    def _get_retried(
+        self,
+        pending: List[ActivityMonitoringLogModel],
+        failed: List[ActivityMonitoringLogModel],
+    ) -> List[ActivityMonitoringLogModel]:
+        """
+        Counts the failed attempt of each failed row, and forgets the rows written.
+
+        Returns:
+            List[ActivityMonitoringLogModel]: Failed rows to queue again.
+        """
+        previous_attempts: Dict[int, int] = {
+            id(instance): self._attempts.pop(id(instance), 0) for instance in pending
+        }
+        retried: List[ActivityMonitoringLogModel] = []
+        for instance in failed:
+            attempts: int = previous_attempts[id(instance)] + 1
+            if attempts < self.max_attempts:
+                self._attempts[id(instance)] = attempts
+                retried.append(instance)
+            else:
+                logger.error(
+                    f"Dropped activity log {instance.pk} after {attempts} attempts"
+                )
+        return retried
+
+    def _run(self) -> None:
+        while True:
+            self._flush_requested.wait(timeout=self.flush_interval)
+            self._flush_requested.clear()
+            close_old_connections()
+            self.flush()
+
+
+activity_log_buffer: ActivityLogBuffer = ActivityLogBuffer(
+    batch_size=settings.ACTIVITY_LOG_BUFFER_BATCH_SIZE,
+    flush_interval=settings.ACTIVITY_LOG_BUFFER_FLUSH_INTERVAL,
+    max_attempts=settings.ACTIVITY_LOG_BUFFER_MAX_ATTEMPTS,
+)
+atexit.register(activity_log_buffer.flush)
+
+
+# Lookup rows resolved once per process, they are seeded configuration
+_activity_method_instances: Dict[
+    str, ActivityMonitoringMethodTypeColorPreferenceModel
+] = {}
+_activity_type_instances: Dict[str, ActivityTypeModel] = {}
+
+
+def get_activity_method_instance(
+    method: str,
+) -> ActivityMonitoringMethodTypeColorPreferenceModel:
+    """
+    Raises:
+        ActivityMonitoringMethodTypeColorPreferenceModel.DoesNotExist: Unknown method.
+    """
+    if method not in _activity_method_instances:
+        _activity_method_instances[method] = (
+            ActivityMonitoringMethodTypeColorPreferenceModel.objects.get(method=method)
+        )
+    return _activity_method_instances[method]
+
+
+def get_activity_type_instance(title: str) -> ActivityTypeModel:
+    """
+    Raises:
+        ActivityTypeModel.DoesNotExist: Unknown activity type.
+    """
+    if title not in _activity_type_instances:
+        _activity_type_instances[title] = ActivityTypeModel.objects.get(title=title)
+    return _activity_type_instances[title]
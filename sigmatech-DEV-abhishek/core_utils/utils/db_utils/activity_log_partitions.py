@@ -0,0 +1,367 @@
+import base64
+import gzip
+import json
+import logging
+import os
+import tempfile
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+from core.settings import logger
+from core_utils.activity_monitoring.enums import ActivityMonitoringBackGroundStatusEnum
+from core_utils.activity_monitoring.models import (
+    ActivityMonitoringBackGroundActivityModel,
+    ActivityMonitoringLogModel,
+)
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+# Models archived by `archive_activity_logs()` -> rows that may be archived
+ACTIVITY_ARCHIVE_MODELS: List[Tuple[Type[Model], Dict[str, Any]]] = [
+    (ActivityMonitoringLogModel, {}),
+    (
+        ActivityMonitoringBackGroundActivityModel,
+        {
+            "status__in": [
+                ActivityMonitoringBackGroundStatusEnum.COMPLETED.value,
+                ActivityMonitoringBackGroundStatusEnum.FAILED.value,
+            ]
+        },
+    ),
+]
+
+
+def get_month_start(value: date, months: int = 0) -> date:
+    """
+    First day of the month of `value`, shifted by `months`.
+    """
+    month_index: int = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _month_bounds(month_start: date) -> Tuple[datetime, datetime]:
+    return (
+        timezone.make_aware(datetime.combine(month_start, time.min)),
+        timezone.make_aware(
+            datetime.combine(get_month_start(month_start, 1), time.min)
+        ),
+    )
+
+
+def get_partition_name(model: Type[Model], month_start: date) -> str:
+    return f"{model._meta.db_table}_{month_start:%Y_%m}"
+
+
+def is_partitioning_supported() -> bool:
+    # ? declarative partitioning is Postgres only, other databases keep one table
+    return connection.vendor == "postgresql"
+
+
+def is_table_partitioned(model: Type[Model]) -> bool:
+    if not is_partitioning_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "INNER JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [model._meta.db_table],
+        )
+        return cursor.fetchone() is not None
+
+
+def get_table_partitions(model: Type[Model]) -> List[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits i "
+            "INNER JOIN pg_class parent ON parent.oid = i.inhparent "
+            "INNER JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)",
+            [model._meta.db_table],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def ensure_monthly_partitions(
+    model: Type[Model], first_month: date, last_month: date
+) -> int:
+    """
+    Creates the missing monthly partitions from `first_month` to `last_month`.
+
+    Returns:
+        int: Number of partitions created.
+    """
+    quote_name: Callable[[str], str] = connection.ops.quote_name
+    existing_partitions: List[str] = get_table_partitions(model=model)
+    created_count: int = 0
+    month_start: date = get_month_start(first_month)
+    with connection.cursor() as cursor:
+        while month_start <= last_month:
+            partition_name: str = get_partition_name(
+                model=model, month_start=month_start
+            )
+            if partition_name not in existing_partitions:
+                month_from, month_to = _month_bounds(month_start)
+                cursor.execute(
+                    f"CREATE TABLE {quote_name(partition_name)} "
+                    f"PARTITION OF {quote_name(model._meta.db_table)} "
+                    f"FOR VALUES FROM ('{month_from.isoformat()}') TO ('{month_to.isoformat()}')"
+                )
+                created_count += 1
+            month_start = get_month_start(month_start, 1)
+    return created_count
+
+
+def partition_table_by_month(model: Type[Model]) -> bool:
+    """
+    Converts the table of `model` into a table partitioned by month on
+    `core_generic_created_at`, copying its rows, foreign keys and non-unique
+    indexes. The primary key becomes (pk, created at), as Postgres requires the
+    partition key in it; rows without creation date take their update date.
+    Runs in one transaction, writes to the table wait for it.
+
+    Returns:
+        bool: False when the database or the table is already partitioned.
+    """
+    if not is_partitioning_supported() or is_table_partitioned(model=model):
+        return False
+
+    quote_name: Callable[[str], str] = connection.ops.quote_name
+    table: str = model._meta.db_table
+    legacy_table: str = f"{table}_LEGACY"
+    pk_column: str = model._meta.pk.column
+    created_at_column: str = model._meta.get_field("core_generic_created_at").column
+    updated_at_column: str = model._meta.get_field("core_generic_updated_at").column
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [quote_name(table)],
+        )
+        foreign_keys: List[Tuple[str, str]] = cursor.fetchall()
+        cursor.execute(
+            "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "WHERE i.indrelid = %s::regclass AND NOT i.indisunique",
+            [quote_name(table)],
+        )
+        index_definitions: List[str] = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(
+            f"ALTER TABLE {quote_name(table)} RENAME TO {quote_name(legacy_table)}"
+        )
+        cursor.execute(
+            f"UPDATE {quote_name(legacy_table)} "
+            f"SET {quote_name(created_at_column)} = COALESCE({quote_name(updated_at_column)}, NOW()) "
+            f"WHERE {quote_name(created_at_column)} IS NULL"
+        )
+        cursor.execute(
+            f"CREATE TABLE {quote_name(table)} "
+            f"(LIKE {quote_name(legacy_table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({quote_name(created_at_column)})"
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote_name(table)} "
+            f"ALTER COLUMN {quote_name(created_at_column)} SET NOT NULL"
+        )
+        cursor.execute(
+            f"SELECT MIN({quote_name(created_at_column)}) FROM {quote_name(legacy_table)}"
+        )
+        oldest: Optional[datetime] = cursor.fetchone()[0]
+        today: date = timezone.localdate()
+        ensure_monthly_partitions(
+            model=model,
+            first_month=timezone.localtime(oldest).date() if oldest else today,
+            last_month=get_month_start(
+                today, settings.ACTIVITY_LOG_PARTITION_MONTHS_AHEAD
+            ),
+        )
+        # ? rows beyond the created months, until their partition exists
+        cursor.execute(
+            f"CREATE TABLE {quote_name(f'{table}_DEFAULT')} "
+            f"PARTITION OF {quote_name(table)} DEFAULT"
+        )
+        cursor.execute(
+            f"INSERT INTO {quote_name(table)} SELECT * FROM {quote_name(legacy_table)}"
+        )
+        cursor.execute(f"DROP TABLE {quote_name(legacy_table)}")
+
+        # ? constraint and index names are free once the old table is dropped
+        cursor.execute(
+            f"ALTER TABLE {quote_name(table)} "
+            f"ADD PRIMARY KEY ({quote_name(pk_column)}, {quote_name(created_at_column)})"
+        )
+        for constraint_name, constraint_definition in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {quote_name(table)} "
+                f"ADD CONSTRAINT {quote_name(constraint_name)} {constraint_definition}"
+            )
+        # ? read before the rename, they target the new table
+        for index_definition in index_definitions:
+            cursor.execute(index_definition)
+
+    logger.info(f"Partitioned {table} by month")
+    return True
+
+
+def ensure_activity_log_partitions() -> int:
+    """
+    Partitions the activity log table if needed and creates the partitions of
+    the next `ACTIVITY_LOG_PARTITION_MONTHS_AHEAD` months, to be run monthly.
+
+    Returns:
+        int: Number of partitions created, 0 on databases without partitioning.
+    """
+    if not is_partitioning_supported():
+        return 0
+    partition_table_by_month(model=ActivityMonitoringLogModel)
+    today: date = timezone.localdate()
+    return ensure_monthly_partitions(
+        model=ActivityMonitoringLogModel,
+        first_month=get_month_start(today),
+        last_month=get_month_start(today, settings.ACTIVITY_LOG_PARTITION_MONTHS_AHEAD),
+    )
+
+
+def _to_archive_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: (
+            base64.b64encode(bytes(value)).decode()
+            if isinstance(value, (bytes, memoryview))
+            else value
+        )
+        for key, value in row.items()
+    }
+
+
+def _get_archive_path(partition_name: str) -> str:
+    # ? a month archived twice (late rows) keeps both parts
+    archive_path: str = os.path.join(
+        settings.ACTIVITY_LOG_ARCHIVE_DIR, f"{partition_name}.jsonl.gz"
+    )
+    part: int = 1
+    while os.path.exists(archive_path):
+        part += 1
+        archive_path: str = os.path.join(
+            settings.ACTIVITY_LOG_ARCHIVE_DIR, f"{partition_name}.{part}.jsonl.gz"
+        )
+    return archive_path
+
+
+def _publish_archive(temp_path: str, partition_name: str, archived_count: int) -> None:
+    archive_path: str = _get_archive_path(partition_name=partition_name)
+    os.replace(temp_path, archive_path)
+    logger.info(f"Archived {archived_count} rows of {partition_name} to {archive_path}")
+
+
+def archive_month(
+    model: Type[Model], month_start: date, archive_filters: Dict[str, Any]
+) -> int:
+    """
+    Writes the rows of `model` created in the month to a gzipped JSON lines file
+    in `ACTIVITY_LOG_ARCHIVE_DIR`, then removes them: the month partition is
+    dropped when it holds nothing else, rows are deleted otherwise.
+
+    The rows are written to a temporary file, renamed once the removal commits:
+    a failed removal leaves no archive, so a rerun archives the rows only once.
+
+    Returns:
+        int: Number of rows archived.
+    """
+    month_from, month_to = _month_bounds(month_start)
+    month_queryset: QuerySet = model._default_manager.filter(
+        core_generic_created_at__gte=month_from, core_generic_created_at__lt=month_to
+    )
+    archive_queryset: QuerySet = month_queryset.filter(**archive_filters)
+    if not archive_queryset.exists():
+        return 0
+
+    partition_name: str = get_partition_name(model=model, month_start=month_start)
+    os.makedirs(settings.ACTIVITY_LOG_ARCHIVE_DIR, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(
+        prefix=f"{partition_name}.",
+        suffix=".tmp",
+        dir=settings.ACTIVITY_LOG_ARCHIVE_DIR,
+    )
+    os.close(file_descriptor)
+    try:
+        archived_count: int = 0
+        with gzip.open(temp_path, "wt", encoding="utf-8") as archive_file:
+            for row in archive_queryset.values().order_by().iterator(chunk_size=2000):
+                archive_file.write(
+                    json.dumps(_to_archive_row(row), cls=DjangoJSONEncoder) + "\n"
+                )
+                archived_count += 1
+
+        with transaction.atomic():
+            if (
+                is_table_partitioned(model=model)
+                and partition_name in get_table_partitions(model=model)
+                and not month_queryset.exclude(**archive_filters).exists()
+            ):
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"DROP TABLE {connection.ops.quote_name(partition_name)}"
+                    )
+            else:
+                archive_queryset.delete()
+            transaction.on_commit(
+                lambda: _publish_archive(
+                    temp_path=temp_path,
+                    partition_name=partition_name,
+                    archived_count=archived_count,
+                )
+            )
+    except Exception:
+        os.remove(temp_path)
+        raise
+    return archived_count
+
+
+def archive_activity_logs(
+    retention_months: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Archives the activity logs and finished background jobs older than the
+    retention, month by month, oldest first.
+
+    Args:
+        retention_months (Optional[int]): Months kept in the database, `ACTIVITY_LOG_RETENTION_MONTHS` by default.
+
+    Returns:
+        Dict[str, int]: Rows archived per table.
+    """
+    retention_months: int = (
+        settings.ACTIVITY_LOG_RETENTION_MONTHS
+        if retention_months is None
+        else retention_months
+    )
+    cutoff_month: date = get_month_start(timezone.localdate(), -retention_months)
+    archived: Dict[str, int] = {}
+    for model, archive_filters in ACTIVITY_ARCHIVE_MODELS:
+        oldest: Optional[datetime] = (
+            model._default_manager.filter(
+                core_generic_created_at__lt=_month_bounds(cutoff_month)[0],
+                **archive_filters,
+            )
+            .order_by("core_generic_created_at")
+            .values_list("core_generic_created_at", flat=True)
+            .first()
+        )
+        archived[model._meta.db_table] = 0
+        if oldest is None:
+            continue
+        month_start: date = get_month_start(timezone.localtime(oldest).date())
+        while month_start < cutoff_month:
+            archived[model._meta.db_table] += archive_month(
+                model=model, month_start=month_start, archive_filters=archive_filters
+            )
+            month_start = get_month_start(month_start, 1)
+    return archived
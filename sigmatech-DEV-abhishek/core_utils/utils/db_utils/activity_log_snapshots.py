@@ -0,0 +1,172 @@
+import json
+import zlib
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.db.models import Model, Q
+from django.db.models.query import QuerySet
+
+from core_utils.activity_monitoring.models import ActivityMonitoringLogModel
+from core_utils.utils.santize_data import object_to_json
+
+
+def get_snapshot_delta(
+    old_data: Optional[Dict], new_data: Optional[Dict]
+) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Reduces two `object_to_json` snapshots to the fields whose value changed.
+    A snapshot without counterpart (creation) is kept whole, it is the base the
+    later deltas are applied to.
+
+    Returns:
+        Tuple[Optional[Dict], Optional[Dict]]: Old and new snapshots of the changed fields.
+    """
+    if not old_data or not new_data:
+        return old_data or None, new_data or None
+
+    old_fields: Dict[str, Any] = old_data.get("fields", {})
+    new_fields: Dict[str, Any] = new_data.get("fields", {})
+    changed_fields: List[str] = [
+        field
+        for field in {**old_fields, **new_fields}
+        if old_fields.get(field) != new_fields.get(field)
+    ]
+    return (
+        {
+            **old_data,
+            "fields": {field: old_fields.get(field) for field in changed_fields},
+        },
+        {
+            **new_data,
+            "fields": {field: new_fields.get(field) for field in changed_fields},
+        },
+    )
+
+
+def pack_activity_log_data(
+    old_data: Optional[Dict], new_data: Optional[Dict]
+) -> Dict[str, Any]:
+    """
+    Field values of an `ActivityMonitoringLogModel` row storing the delta of the
+    snapshots, zlib compressed into `compressed_data` from
+    `ACTIVITY_LOG_COMPRESSION_MIN_SIZE` bytes of JSON.
+
+    Returns:
+        Dict[str, Any]: `is_delta`, `old_data`, `new_data` and `compressed_data` values.
+    """
+    old_delta, new_delta = get_snapshot_delta(old_data=old_data, new_data=new_data)
+    packed: Dict[str, Any] = {
+        "is_delta": True,
+        "old_data": old_delta,
+        "new_data": new_delta,
+        "compressed_data": None,
+    }
+    payload: bytes = json.dumps(
+        {"old_data": old_delta, "new_data": new_delta}, separators=(",", ":")
+    ).encode()
+    if len(payload) >= settings.ACTIVITY_LOG_COMPRESSION_MIN_SIZE:
+        packed.update(
+            old_data=None, new_data=None, compressed_data=zlib.compress(payload)
+        )
+    return packed
+
+
+def get_activity_log_data(
+    instance: ActivityMonitoringLogModel,
+) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Stored old and new data of a log row, decompressed if needed. Rows written
+    before deltas (`is_delta` False) hold full snapshots.
+    """
+    if instance.compressed_data:
+        payload: Dict = json.loads(zlib.decompress(bytes(instance.compressed_data)))
+        return payload["old_data"], payload["new_data"]
+    return instance.old_data, instance.new_data
+
+
+def _apply_fields(snapshot: Dict, delta: Optional[Dict]) -> Dict:
+    if not delta:
+        return snapshot
+    return {**snapshot, "fields": {**snapshot["fields"], **delta.get("fields", {})}}
+
+
+def _is_full_snapshot(
+    log: ActivityMonitoringLogModel, old_data: Optional[Dict], new_data: Optional[Dict]
+) -> bool:
+    # ? pre-delta rows and creations hold every field
+    return bool(new_data) and (not log.is_delta or not old_data)
+
+
+def _get_current_snapshot(instance: ActivityMonitoringLogModel) -> Optional[Dict]:
+    if not instance.model_instance_id or not instance.primary_key:
+        return None
+    model: Optional[Type[Model]] = instance.model_instance.model_class()
+    if model is None:
+        return None
+    current_instance: Optional[Model] = model._default_manager.filter(
+        pk=instance.primary_key
+    ).first()
+    return object_to_json(current_instance) if current_instance else None
+
+
+def get_activity_log_snapshots(
+    instance: ActivityMonitoringLogModel,
+) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Full before/after snapshots of the instance a log row is about.
+
+    Deltas are replayed forward from the latest full snapshot (creation or
+    pre-delta row) logged for the same instance; without one, the current row
+    is rolled back through the newer deltas. Fields no snapshot covers are
+    left out.
+
+    Returns:
+        Tuple[Optional[Dict], Optional[Dict]]: Old and new snapshots, None for the old one of a creation.
+    """
+    old_data, new_data = get_activity_log_data(instance=instance)
+    if not instance.is_delta or not old_data:
+        return old_data, new_data
+
+    entity_logs: QuerySet[ActivityMonitoringLogModel] = (
+        ActivityMonitoringLogModel.objects.filter(
+            model_instance=instance.model_instance_id,
+            primary_key=instance.primary_key,
+        )
+        .exclude(pk=instance.pk)
+        .only("is_delta", "old_data", "new_data", "compressed_data")
+    )
+    is_before: Q = Q(core_generic_created_at__lt=instance.core_generic_created_at) | Q(
+        core_generic_created_at=instance.core_generic_created_at, pk__lt=instance.pk
+    )
+
+    # Newer first, down to the latest full snapshot
+    before_deltas: List[Optional[Dict]] = []
+    base: Optional[Dict] = None
+    for log in entity_logs.filter(is_before).order_by(
+        "-core_generic_created_at", "-pk"
+    ):
+        log_old_data, log_new_data = get_activity_log_data(instance=log)
+        if _is_full_snapshot(log=log, old_data=log_old_data, new_data=log_new_data):
+            base: Optional[Dict] = log_new_data
+            break
+        before_deltas.append(log_new_data)
+
+    if base is not None:
+        # ? forward from the full snapshot
+        before: Dict = {**base, "fields": dict(base.get("fields", {}))}
+        for log_new_data in reversed(before_deltas):
+            before = _apply_fields(snapshot=before, delta=log_new_data)
+    else:
+        # ? backward from the current row
+        before: Optional[Dict] = _get_current_snapshot(instance=instance)
+        if before is None:
+            return old_data, new_data
+        for log in entity_logs.exclude(is_before).order_by(
+            "-core_generic_created_at", "-pk"
+        ):
+            before = _apply_fields(
+                snapshot=before, delta=get_activity_log_data(instance=log)[0]
+            )
+
+    before = _apply_fields(snapshot=before, delta=old_data)
+    return before, _apply_fields(snapshot=before, delta=new_data)
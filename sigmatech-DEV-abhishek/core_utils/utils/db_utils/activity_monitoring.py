@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
 from typing import Optional, Dict
 from django.db import models
@@ -9,6 +10,12 @@ from core_utils.activity_monitoring.models import (
     ActivityMonitoringMethodTypeColorPreferenceModel,
     ActivityTypeModel,
 )
+from core_utils.utils.db_utils.activity_log_buffer import (
+    activity_log_buffer,
+    get_activity_method_instance,
+    get_activity_type_instance,
+)
+from core_utils.utils.db_utils.activity_log_snapshots import pack_activity_log_data
 from core_utils.utils.enums import status_list_enum_values
 from core_utils.utils.santize_data import object_to_json
 import logging
@@ -25,7 +32,8 @@ class ActivityMonitoringLogger:
         - Activity type (from `ActivityTypeModel`)
         - The user who performed the action
         - The method (from `ActivityMonitoringMethodTypeColorPreferenceModel`)
-        - Old and new serialized data of the model instance
+        - Old and new serialized data of the model instance, stored as the
+          delta of the changed fields (`activity_log_snapshots`)
 
     Typical usage:
         logger = ActivityMonitoringLogger()
@@ -36,6 +44,10 @@ class ActivityMonitoringLogger:
         logger.set_old_data(old_instance)
         logger.set_new_data(new_instance)
         logger.activity_monitoring_log()
+
+    With `ACTIVITY_LOG_BUFFER_ENABLED`, the log row is returned unsaved and
+    written by `activity_log_buffer` after the transaction commits; change it
+    through `activity_log_buffer.update()` rather than `save()`.
     """
 
     # Queryset used for creating activity log entries
@@ -99,7 +111,7 @@ class ActivityMonitoringLogger:
         if isinstance(self._method, ActivityMonitoringMethodTypeColorPreferenceModel):
             return
         self._method: ActivityMonitoringMethodTypeColorPreferenceModel = (
-            ActivityMonitoringMethodTypeColorPreferenceModel.objects.get(method=method)
+            get_activity_method_instance(method=method)
         )
 
     def get_method(self) -> ActivityMonitoringMethodTypeColorPreferenceModel:
@@ -135,10 +147,22 @@ class ActivityMonitoringLogger:
         """
         if not self._activity_type:
             raise ValueError("Activity type not set.")
-        return ActivityTypeModel.objects.get(title=self._activity_type)
+        return get_activity_type_instance(title=self._activity_type)
 
     # ---------- Logging Methods ----------
 
+    def write_activity_log(
+        self, activity_log_instance: ActivityMonitoringLogModel
+    ) -> None:
+        """
+        Queues the log row to `activity_log_buffer`, or saves it right away when
+        `ACTIVITY_LOG_BUFFER_ENABLED` is off.
+        """
+        if settings.ACTIVITY_LOG_BUFFER_ENABLED:
+            activity_log_buffer.add(activity_log_instance)
+        else:
+            activity_log_instance.save()
+
     def activity_monitoring_log(self) -> ActivityMonitoringLogModel:
         """
         Create a single activity monitoring log entry.
@@ -152,20 +176,20 @@ class ActivityMonitoringLogger:
         if not self._model_instance:
             raise ValueError("Model instance must be set before logging.")
 
+        # ? content types are cached by their manager
         content_type = ContentType.objects.get_for_model(
             self._model_instance, for_concrete_model=False
         )
-        activity_log_instance: ActivityMonitoringLogModel = (
-            self.activity_monitoring_log_queryset.create(
-                model_instance=content_type,
-                primary_key=self._primary_key,
-                activity_type=self.get_activity_type_model(),
-                performed_by=self._performed_by,
-                method=self.get_method(),
-                old_data=self._old_data,
-                new_data=self._new_data,
-            )
+        activity_log_instance: ActivityMonitoringLogModel = ActivityMonitoringLogModel(
+            model_instance=content_type,
+            primary_key=self._primary_key,
+            activity_type=self.get_activity_type_model(),
+            performed_by=self._performed_by,
+            method=self.get_method(),
+            # ? changed fields only, compressed when large
+            **pack_activity_log_data(old_data=self._old_data, new_data=self._new_data),
         )
+        self.write_activity_log(activity_log_instance=activity_log_instance)
 
         self.logger.info(
             f"Activity '{activity_log_instance.activity_type.title}' "
@@ -181,13 +205,12 @@ class ActivityMonitoringLogger:
         Note:
             This does not attach specific model instances or old/new data.
         """
-        activity_log_instance: ActivityMonitoringLogModel = (
-            self.activity_monitoring_log_queryset.create(
-                activity_type=self.get_activity_type_model(),
-                performed_by=self.request.user,
-                method=self._method,
-            )
+        activity_log_instance: ActivityMonitoringLogModel = ActivityMonitoringLogModel(
+            activity_type=self.get_activity_type_model(),
+            performed_by=self.request.user,
+            method=self._method,
         )
+        self.write_activity_log(activity_log_instance=activity_log_instance)
 
         self.logger.info(
             f"Bulk Activity '{activity_log_instance.activity_type.title}' "
@@ -251,7 +274,7 @@ def activity_monitoring_logger(
         new_instance (Optional[models.Model]): State after update.
 
     Returns:
-        ActivityMonitoringLogModel: The created activity log entry.
+        ActivityMonitoringLogModel: The activity log entry (queued when buffered).
     """
     logger = ActivityMonitoringLogger()
     logger.set_model_instance(instance)
@@ -0,0 +1,393 @@
+import json
+import logging
+from contextvars import Token
+from datetime import timedelta
+from typing import Any, Dict, Optional, Type
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import F, Model
+from django.db.models.query import QuerySet
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from core.settings import logger
+from core_utils.activity_monitoring.enums import (
+    ActivityMonitoringBackGroundStatusEnum,
+    PerformanceProfileKindEnum,
+)
+from core_utils.activity_monitoring.models import (
+    ActivityMonitoringBackGroundActivityModel,
+)
+from core_utils.utils.db_utils.performance_profiler import profile_performance
+from core_utils.utils.logging_utils import (
+    get_correlation_id,
+    reset_correlation_id,
+    set_correlation_id,
+)
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+background_job_queryset: QuerySet[ActivityMonitoringBackGroundActivityModel] = (
+    ActivityMonitoringBackGroundActivityModel.objects.all()
+)
+
+
+def _to_json_safe(data: Any) -> Any:
+    """
+    Converts handler data (model instances, Decimals, dates...) to JSON types.
+    """
+    return json.loads(json.dumps(data, default=str))
+
+
+class BackgroundJobRequest:
+    """
+    Minimal stand-in for the DRF request a handler is built with, used when the
+    handler runs inside the background job worker.
+
+    Handlers only rely on the authenticated user (audit fields, activity logs,
+    media uploads), the payload and the route kwargs.
+
+    Attributes:
+        user (Model): User who enqueued the job.
+        data (Dict[str, Any]): Original handler payload.
+        method (str): HTTP method of the original request.
+        parser_context (Dict[str, Any]): Empty route kwargs.
+    """
+
+    user: Model
+    data: Dict[str, Any]
+    method: str
+    parser_context: Dict[str, Any]
+
+    def __init__(self, user: Model, data: Dict[str, Any], method: str = "POST"):
+        self.user = user
+        self.data = data
+        self.method = method
+        self.parser_context = {"kwargs": {}}
+
+
+class BackgroundJobProgress:
+    """
+    Records the stage and percentage of a running job on its
+    `ActivityMonitoringBackGroundActivityModel` row.
+
+    Writes are skipped when neither the description nor the whole-number
+    percentage changed, so per-chunk reporting costs at most ~100 updates.
+
+    Attributes:
+        job (ActivityMonitoringBackGroundActivityModel): Job being executed.
+    """
+
+    job: ActivityMonitoringBackGroundActivityModel
+    _last_description: Optional[str] = None
+    _last_percentage: Optional[int] = None
+
+    def __init__(self, job: ActivityMonitoringBackGroundActivityModel):
+        self.job = job
+
+    def update(self, description: str, percentage: Optional[float] = None) -> None:
+        """
+        Args:
+            description (str): Current stage of the job.
+            percentage (Optional[float]): Overall progress, 0-100. Unchanged if None.
+        """
+        percentage: float = (
+            self.job.percentage if percentage is None else min(max(percentage, 0), 100)
+        )
+        if (
+            description == self._last_description
+            and int(percentage or 0) == self._last_percentage
+        ):
+            return
+
+        self._last_description = description
+        self._last_percentage = int(percentage or 0)
+        self.job.description = description
+        self.job.percentage = percentage
+        background_job_queryset.filter(pk=self.job.pk).update(
+            description=description,
+            percentage=percentage,
+            core_generic_updated_at=timezone.now(),
+        )
+
+
+class BackgroundJobHandlerMixin:
+    """
+    Lets a `CoreGenericBaseHandler` defer its `create()` to the background job
+    worker (`python manage.py run_background_jobs`).
+
+    In the request, `validate()` runs only cheap payload checks when
+    `is_background_job_deferred()` is True and `create()` calls
+    `enqueue_background_job()`, which stores the handler path and payload and
+    returns immediately. The worker rebuilds the handler with the same user and
+    payload, runs the full `validate()` and `create()`, and records progress
+    through `report_background_job_progress()`.
+
+    Attributes:
+        background_job_title (str): `ActivityMonitoringBackGroundActivityEnum` value of the job.
+        background_job_primary_key_field (Optional[str]): Key of `self.data` holding the primary key
+            of the processed record, stored on the job once completed.
+        background_job_progress (Optional[BackgroundJobProgress]): Set only inside the worker.
+    """
+
+    background_job_title: str
+    background_job_primary_key_field: Optional[str] = None
+    background_job_progress: Optional[BackgroundJobProgress] = None
+
+    def is_background_job_deferred(self) -> bool:
+        """
+        Returns:
+            bool: True if `create()` must enqueue a job instead of running in the request.
+        """
+        return settings.BACKGROUND_JOBS_ENABLED and self.background_job_progress is None
+
+    def set_background_job_progress(self, progress: BackgroundJobProgress) -> None:
+        self.background_job_progress = progress
+
+    def report_background_job_progress(
+        self, description: str, percentage: Optional[float] = None
+    ) -> None:
+        """
+        Records the current stage on the job; no-op outside the worker.
+        """
+        if self.background_job_progress:
+            self.background_job_progress.update(
+                description=description, percentage=percentage
+            )
+
+    def enqueue_background_job(
+        self, primary_key: Optional[str] = None
+    ) -> ActivityMonitoringBackGroundActivityModel:
+        """
+        Queues the handler for the worker and adds the job id to the response data.
+
+        Args:
+            primary_key (Optional[str]): Primary key of the record the job works on, if known.
+
+        Returns:
+            ActivityMonitoringBackGroundActivityModel: The PENDING job.
+        """
+        job: ActivityMonitoringBackGroundActivityModel = background_job_queryset.create(
+            title=self.background_job_title,
+            task=f"{type(self).__module__}.{type(self).__qualname__}",
+            payload={
+                "data": _to_json_safe(self.data),
+                "queryset_model": self.queryset.model._meta.label,
+                "method": self.request.method,
+                # ? the job logs keep the id of the request that queued it
+                "correlation_id": get_correlation_id(),
+            },
+            primary_key=primary_key,
+            status=ActivityMonitoringBackGroundStatusEnum.PENDING.value,
+            percentage=0,
+            description="Queued",
+            core_generic_created_by=(
+                self.request.user.UserDetailModel_user
+                if self.request.user.is_authenticated
+                else None
+            ),
+        )
+        logger.info(f"Enqueued background job {job.pk} ({job.task})")
+
+        self.data["background_activity_id"] = str(job.pk)
+        self.data["background_activity_status"] = job.status
+        return job
+
+
+def claim_next_background_job() -> Optional[ActivityMonitoringBackGroundActivityModel]:
+    """
+    Claims the oldest PENDING job.
+
+    The claim is a conditional UPDATE on the job status, so several workers can
+    poll the same table without a broker or row locks: only one of them sees
+    its update applied.
+
+    Returns:
+        Optional[ActivityMonitoringBackGroundActivityModel]: The claimed RUNNING job, if any.
+    """
+    pending_ids = (
+        background_job_queryset.filter(
+            status=ActivityMonitoringBackGroundStatusEnum.PENDING.value
+        )
+        .order_by("core_generic_created_at")
+        .values_list("pk", flat=True)[:10]
+    )
+
+    for job_id in pending_ids:
+        now = timezone.now()
+        claimed: int = background_job_queryset.filter(
+            pk=job_id, status=ActivityMonitoringBackGroundStatusEnum.PENDING.value
+        ).update(
+            status=ActivityMonitoringBackGroundStatusEnum.RUNNING.value,
+            start_time=now,
+            attempts=F("attempts") + 1,
+            description="Started",
+            core_generic_updated_at=now,
+        )
+        if claimed:
+            return background_job_queryset.get(pk=job_id)
+    return None
+
+
+def fail_stale_background_jobs(timeout: Optional[int] = None) -> int:
+    """
+    Marks RUNNING jobs without a progress update for `timeout` seconds as FAILED
+    (their worker died). They are not retried, as a partial upload must be
+    re-submitted by the user.
+
+    Args:
+        timeout (Optional[int]): Seconds, defaults to `BACKGROUND_JOB_STALE_TIMEOUT`.
+
+    Returns:
+        int: Number of jobs marked as failed.
+    """
+    timeout: int = timeout or settings.BACKGROUND_JOB_STALE_TIMEOUT
+    now = timezone.now()
+    return background_job_queryset.filter(
+        status=ActivityMonitoringBackGroundStatusEnum.RUNNING.value,
+        core_generic_updated_at__lt=now - timedelta(seconds=timeout),
+    ).update(
+        status=ActivityMonitoringBackGroundStatusEnum.FAILED.value,
+        description="Worker stopped before the job completed",
+        end_time=now,
+        core_generic_updated_at=now,
+    )
+
+
+def _finish_background_job(
+    job: ActivityMonitoringBackGroundActivityModel,
+    status: str,
+    description: str,
+    result: Optional[Dict[str, Any]] = None,
+    primary_key: Optional[str] = None,
+) -> None:
+    job.status = status
+    job.description = description
+    job.result = _to_json_safe(result) if result else None
+    job.end_time = timezone.now()
+    if status == ActivityMonitoringBackGroundStatusEnum.COMPLETED.value:
+        job.percentage = 100
+    if primary_key:
+        job.primary_key = primary_key
+    job.save(
+        update_fields=[
+            "status",
+            "description",
+            "result",
+            "end_time",
+            "percentage",
+            "primary_key",
+            "core_generic_updated_at",
+        ]
+    )
+
+
+def run_background_job(job: ActivityMonitoringBackGroundActivityModel) -> None:
+    """
+    Rebuilds the job's handler and runs its `validate()` and `create()`.
+
+    Validation errors and exceptions mark the job FAILED with the error in
+    `description` and `result`; otherwise the job is COMPLETED with the
+    handler response data in `result`. With `PERFORMANCE_PROFILER_ENABLED`,
+    the run is saved as a JOB performance profile.
+
+    Args:
+        job (ActivityMonitoringBackGroundActivityModel): A claimed RUNNING job.
+    """
+    payload: Dict[str, Any] = job.payload or {}
+    progress: BackgroundJobProgress = BackgroundJobProgress(job=job)
+    # ? request that queued the job / job
+    correlation_token: Token = set_correlation_id(
+        "/".join(filter(None, [payload.get("correlation_id"), f"job-{job.pk}"]))
+    )
+    try:
+        if not settings.PERFORMANCE_PROFILER_ENABLED:
+            _run_background_job(job=job, payload=payload, progress=progress)
+            return
+        with profile_performance(
+            kind=PerformanceProfileKindEnum.JOB.value, name=job.task or job.title
+        ) as performance_profile:
+            _run_background_job(job=job, payload=payload, progress=progress)
+        performance_profile.save(
+            method=payload.get("method"),
+            performed_by=(
+                job.core_generic_created_by.user
+                if job.core_generic_created_by
+                else None
+            ),
+        )
+    finally:
+        reset_correlation_id(correlation_token)
+
+
+def _run_background_job(
+    job: ActivityMonitoringBackGroundActivityModel,
+    payload: Dict[str, Any],
+    progress: BackgroundJobProgress,
+) -> None:
+    try:
+        handler_class: Type = import_string(job.task)
+        user: Model = (
+            job.core_generic_created_by.user
+            if job.core_generic_created_by
+            else AnonymousUser()
+        )
+        request: BackgroundJobRequest = BackgroundJobRequest(
+            user=user,
+            data=payload.get("data", {}),
+            method=payload.get("method", "POST"),
+        )
+        handler = handler_class(
+            request=request,
+            queryset=apps.get_model(payload["queryset_model"]).objects.all(),
+            context={"request": request},
+        )
+        handler.set_background_job_progress(progress=progress)
+        handler.set_data(data=dict(request.data))
+
+        progress.update(description="Validating", percentage=0)
+        handler.validate()
+        if handler.data.get("error_message"):
+            error_message: Any = handler.data["error_message"]
+            _finish_background_job(
+                job=job,
+                status=ActivityMonitoringBackGroundStatusEnum.FAILED.value,
+                description=(
+                    error_message.get("description") or error_message.get("title")
+                    if isinstance(error_message, dict)
+                    else str(error_message)
+                ),
+                result={
+                    "error_message": error_message,
+                    "field_errors": handler.data.get("field_errors"),
+                },
+            )
+            return
+
+        handler.create()
+    except Exception as e:
+        logger.exception(f"Background job {job.pk} failed")
+        _finish_background_job(
+            job=job,
+            status=ActivityMonitoringBackGroundStatusEnum.FAILED.value,
+            description=str(e),
+        )
+        return
+
+    _finish_background_job(
+        job=job,
+        status=ActivityMonitoringBackGroundStatusEnum.COMPLETED.value,
+        description="Completed",
+        result={
+            key: value
+            for key, value in handler.data.items()
+            if key not in request.data and key != "activity_log_instance"
+        },
+        primary_key=(
+            handler.data.get(handler.background_job_primary_key_field)
+            if handler.background_job_primary_key_field
+            else None
+        ),
+    )
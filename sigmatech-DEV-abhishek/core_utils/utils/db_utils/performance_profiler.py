@@ -0,0 +1,170 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connection
+
+from core.settings import logger
+from core_utils.activity_monitoring.models import PerformanceProfileModel
+from core_utils.utils.logging_utils import get_correlation_id
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+# IN lists of any length are the same query for duplicate detection
+IN_LIST_PATTERN: re.Pattern = re.compile(r"IN \((?:%s, )*%s\)")
+
+# Profile of the request or background job running in the current context
+active_profile_var: ContextVar[Optional["PerformanceProfile"]] = ContextVar(
+    "active_profile", default=None
+)
+
+
+def get_active_profile() -> Optional["PerformanceProfile"]:
+    return active_profile_var.get()
+
+
+class PerformanceProfile:
+    """
+    Wall time, SQL queries and named stage timings of one request or job.
+
+    Installed as an `execute_wrapper` of the connection of the current thread,
+    it times every query and counts the queries run more than once with the
+    same SQL (parameters aside), the usual sign of a lookup inside a loop.
+
+    Attributes:
+        kind (str): `PerformanceProfileKindEnum` value.
+        name (str): Request path or background job task path.
+        query_count (int): Queries run.
+        query_time (float): Seconds spent in the database.
+        stages (Dict[str, float]): Seconds spent per stage, summed over repeats.
+    """
+
+    kind: str
+    name: str
+    query_count: int
+    query_time: float
+    stages: Dict[str, float]
+
+    def __init__(self, kind: str, name: str):
+        self.kind = kind
+        self.name = name
+        self.query_count = 0
+        self.query_time = 0.0
+        self.stages = {}
+        self._query_counts: Counter = Counter()
+        self._started_at: float = time.perf_counter()
+        self._finished_at: Optional[float] = None
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: Dict
+    ) -> Any:
+        started_at: float = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_time += time.perf_counter() - started_at
+            self.query_count += 1
+            self._query_counts[IN_LIST_PATTERN.sub("IN (...)", sql)] += 1
+
+    def add_stage(self, name: str, duration: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + duration
+
+    def finish(self) -> None:
+        self._finished_at = time.perf_counter()
+
+    @property
+    def wall_time(self) -> float:
+        return (self._finished_at or time.perf_counter()) - self._started_at
+
+    def get_duplicate_queries(self) -> List[Dict[str, Any]]:
+        return [
+            {"sql": sql[:1000], "count": count}
+            for sql, count in self._query_counts.most_common(
+                settings.PERFORMANCE_PROFILER_MAX_DUPLICATE_QUERIES
+            )
+            if count > 1
+        ]
+
+    def save(
+        self,
+        method: Optional[str] = None,
+        status_code: Optional[int] = None,
+        performed_by: Optional[Any] = None,
+    ) -> Optional[PerformanceProfileModel]:
+        """
+        Persists the profile when it lasted at least
+        `PERFORMANCE_PROFILER_MIN_DURATION_MS`. Errors are logged, never raised,
+        profiling must not fail the request or job.
+        """
+        wall_time_ms: float = self.wall_time * 1000
+        if wall_time_ms < settings.PERFORMANCE_PROFILER_MIN_DURATION_MS:
+            return None
+        try:
+            return PerformanceProfileModel.objects.create(
+                kind=self.kind,
+                name=self.name[:255],
+                method=method,
+                status_code=status_code,
+                correlation_id=(get_correlation_id() or "")[:128] or None,
+                performed_by=performed_by,
+                wall_time_ms=round(wall_time_ms, 2),
+                query_count=self.query_count,
+                query_time_ms=round(self.query_time * 1000, 2),
+                duplicate_query_count=sum(
+                    count - 1 for count in self._query_counts.values() if count > 1
+                ),
+                duplicate_queries=self.get_duplicate_queries(),
+                stages={
+                    stage: round(duration * 1000, 2)
+                    for stage, duration in self.stages.items()
+                },
+            )
+        except Exception as e:
+            logger.error(f"Failed to save the performance profile of {self.name}: {e}")
+            return None
+
+
+@contextmanager
+def profile_performance(kind: str, name: str) -> Iterator[PerformanceProfile]:
+    """
+    Profiles the block, the caller saves the yielded profile once the block is
+    done (`PerformanceProfile.save()`), outside of the profiled queries.
+
+    Args:
+        kind (str): `PerformanceProfileKindEnum` value.
+        name (str): Request path or background job task path.
+    """
+    performance_profile: PerformanceProfile = PerformanceProfile(kind=kind, name=name)
+    token: Token = active_profile_var.set(performance_profile)
+    try:
+        with connection.execute_wrapper(performance_profile):
+            yield performance_profile
+    finally:
+        performance_profile.finish()
+        active_profile_var.reset(token)
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """
+    Times a named stage (validation, risk, create_cases, storage_upload...) of the
+    active profile, and logs its duration at debug level. Without active
+    profile only the debug log is written.
+
+    Args:
+        name (str): Stage name, repeated stages are summed.
+    """
+    started_at: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration: float = time.perf_counter() - started_at
+        performance_profile: Optional[PerformanceProfile] = get_active_profile()
+        if performance_profile is not None:
+            performance_profile.add_stage(name=name, duration=duration)
+        logger.debug("Stage %s took %.2f seconds", name, duration)
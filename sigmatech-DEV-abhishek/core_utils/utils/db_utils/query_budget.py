@@ -0,0 +1,121 @@
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.urls import resolve
+
+from core.settings import logger
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    A view ran more queries than its `query_budget`.
+    """
+
+
+@contextmanager
+def capture_queries() -> Iterator[List[str]]:
+    """
+    Collects the SQL of the queries run by the block on the connection of the
+    current thread.
+
+    Yields:
+        List[str]: SQL of the queries, filled while the block runs.
+    """
+    queries: List[str] = []
+
+    def execute_wrapper(
+        execute: Callable, sql: str, params: Any, many: bool, context: Dict
+    ) -> Any:
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(execute_wrapper):
+        yield queries
+
+
+def check_query_budget(view_name: str, budget: int, queries: List[str]) -> None:
+    """
+    Logs a warning when `queries` exceed the budget, or raises with
+    `QUERY_BUDGET_RAISE` (test settings).
+
+    Raises:
+        QueryBudgetExceeded: Budget exceeded with `QUERY_BUDGET_RAISE`.
+    """
+    if len(queries) <= budget:
+        return
+    message: str = (
+        f"{view_name} ran {len(queries)} queries, budget is {budget}:\n"
+        + "\n".join(queries)
+    )
+    if settings.QUERY_BUDGET_RAISE:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+def assert_query_budget(
+    client: Client,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_sizes: Sequence[int] = (1, 50),
+    **extra: Any,
+) -> List[int]:
+    """
+    Test harness of the `query_budget` of a CoreGeneric list or detail view:
+    after a warm-up request, requests `path` once per page size (`limit` query
+    parameter) against the seeded data and asserts that every response is
+    successful, stays within the view budget, and runs the same number of
+    queries whatever the page size (no query per row).
+
+    Args:
+        client (Client): Test client, authenticated through `extra` headers if needed.
+        path (str): Path of the view.
+        params (Optional[Dict[str, Any]]): Extra query parameters.
+        page_sizes (Sequence[int]): Page sizes compared, one is enough for detail views.
+        **extra: Passed to `client.get()` (e.g. `HTTP_AUTHORIZATION`).
+
+    Raises:
+        QueryBudgetExceeded: Failed request, budget exceeded or count growing with the page size.
+
+    Returns:
+        List[int]: Query count per page size.
+    """
+    view_class: Any = getattr(resolve(path).func, "view_class", None)
+    budget: Optional[int] = getattr(view_class, "query_budget", None)
+    if budget is None:
+        raise QueryBudgetExceeded(f"{path} does not declare a query_budget")
+
+    # ? warms the per-process and cached lookups (token state, visibility, counts)
+    client.get(path, data={**(params or {}), "limit": max(page_sizes)}, **extra)
+
+    query_counts: List[int] = []
+    for page_size in page_sizes:
+        with capture_queries() as queries:
+            response: Any = client.get(
+                path, data={**(params or {}), "limit": page_size}, **extra
+            )
+        if response.status_code != 200:
+            raise QueryBudgetExceeded(
+                f"{path} answered {response.status_code} with limit={page_size}"
+            )
+        if len(queries) > budget:
+            raise QueryBudgetExceeded(
+                f"{path} ran {len(queries)} queries with limit={page_size}, "
+                f"budget is {budget}:\n" + "\n".join(queries)
+            )
+        query_counts.append(len(queries))
+
+    if len(set(query_counts)) > 1:
+        raise QueryBudgetExceeded(
+            f"{path} query count depends on the page size: "
+            + ", ".join(
+                f"limit={page_size}: {count}"
+                for page_size, count in zip(page_sizes, query_counts)
+            )
+        )
+    return query_counts
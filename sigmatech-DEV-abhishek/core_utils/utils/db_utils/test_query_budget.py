@@ -0,0 +1,190 @@
+"""
+Query budgets of the CoreGeneric list and detail views, against seeded cases,
+users and activity logs.
+
+Run with `python manage.py test core_utils.utils.db_utils.test_query_budget`.
+"""
+
+from typing import Dict, List
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+from rest_framework_jwt.utils import jwt_create_payload, jwt_encode_payload
+
+from core_utils.activity_monitoring.models import (
+    ActivityMonitoringLinkedEntityModel,
+    ActivityMonitoringLogModel,
+    ActivityMonitoringMethodTypeColorPreferenceModel,
+    ActivityTypeModel,
+)
+from core_utils.utils.db_utils.query_budget import (
+    assert_query_budget,
+    capture_queries,
+)
+from store.configurations.loan_config.models import (
+    LoanConfigurationsProcessModel,
+    LoanConfigurationsProductAssignmentModel,
+    LoanConfigurationsProductsModel,
+)
+from store.operations.allocation_files.models import AllocationFileModel
+from store.operations.case_management.models import CaseManagementCaseModel
+from user_config.user_auth.enums import UserRoleEnum
+from user_config.user_auth.models import (
+    BlackListTokenModel,
+    UserModel,
+    UserRoleModel,
+)
+from user_config.user_auth.utils.token_state import token_state_cache
+
+# Rows seeded per table, above the largest page size compared
+SEEDED_ROW_COUNT: int = 60
+
+
+@override_settings(
+    QUERY_BUDGET_ENABLED=True,
+    QUERY_BUDGET_RAISE=True,
+    PERFORMANCE_PROFILER_ENABLED=False,
+    ACTIVITY_LOG_BUFFER_ENABLED=False,
+)
+class QueryBudgetTestCase(TestCase):
+    """
+    Each view runs its `query_budget` on a cold process, then the same number of
+    queries with `limit=1` and `limit=50`.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        roles: Dict[str, UserRoleModel] = {}
+        for user_role in UserRoleEnum:
+            roles[user_role.value] = UserRoleModel.objects.create(
+                title=user_role.value.title(), role=user_role.value
+            )
+
+        cls.admin_instance = UserModel.objects.create_user(
+            login_id="admin",
+            password="admin",
+            username="admin",
+            email="admin@mail.com",
+            phone_number="9000000000",
+            user_role=roles[UserRoleEnum.ADMIN.value],
+            is_active=True,
+            is_approved=True,
+            is_verified=True,
+        )
+        cls.field_officer_instances: List[UserModel] = [
+            UserModel.objects.create_user(
+                login_id=f"field_officer_{idx}",
+                username=f"field_officer_{idx}",
+                email=f"field_officer_{idx}@mail.com",
+                phone_number=f"9{idx:09d}",
+                user_role=roles[UserRoleEnum.FIELD_OFFICER.value],
+                reports_to=cls.admin_instance,
+                is_active=True,
+            )
+            for idx in range(1, SEEDED_ROW_COUNT + 1)
+        ]
+
+        product_assignment_instance: LoanConfigurationsProductAssignmentModel = (
+            LoanConfigurationsProductAssignmentModel.objects.create(
+                process=LoanConfigurationsProcessModel.objects.create(title="Process"),
+                product=LoanConfigurationsProductsModel.objects.create(title="Product"),
+            )
+        )
+        allocation_file_instance: AllocationFileModel = (
+            AllocationFileModel.objects.create(
+                title="Allocation file",
+                product_assignment=product_assignment_instance,
+            )
+        )
+        CaseManagementCaseModel.objects.bulk_create(
+            [
+                CaseManagementCaseModel(
+                    allocation_file=allocation_file_instance,
+                    loan_account_number=f"LAN{idx:06d}",
+                    customer_name=f"Customer {idx}",
+                    current_dpd=idx,
+                )
+                for idx in range(SEEDED_ROW_COUNT)
+            ]
+        )
+
+        method_instance: ActivityMonitoringMethodTypeColorPreferenceModel = (
+            ActivityMonitoringMethodTypeColorPreferenceModel.objects.create(
+                method="POST", color="#000000"
+            )
+        )
+        activity_type_instance: ActivityTypeModel = ActivityTypeModel.objects.create(
+            title="Create",
+            lable="Create",
+            linked_entity=ActivityMonitoringLinkedEntityModel.objects.create(
+                title="Case"
+            ),
+        )
+        ActivityMonitoringLogModel.objects.bulk_create(
+            [
+                ActivityMonitoringLogModel(
+                    performed_by=cls.admin_instance,
+                    method=method_instance,
+                    activity_type=activity_type_instance,
+                    description=f"Activity {idx}",
+                )
+                for idx in range(SEEDED_ROW_COUNT)
+            ]
+        )
+
+        cls.token = jwt_encode_payload(jwt_create_payload(cls.admin_instance))
+        BlackListTokenModel.objects.create(
+            token=cls.token, user=cls.admin_instance, is_login=True
+        )
+
+    def setUp(self):
+        # ? cold per-process caches, as on the first request of a worker
+        cache.clear()
+        token_state_cache.clear()
+
+    def assert_view_query_budget(
+        self, path: str, cached_query_count: int, page_sizes=(1, 50)
+    ) -> None:
+        """
+        The `query_budget` of the view is the query count of the first request
+        of a process (token state and count caches empty), the
+        next requests run `cached_query_count` queries whatever the page size.
+        """
+        extra: Dict[str, str] = {"HTTP_AUTHORIZATION": f"Bearer {self.token}"}
+        with capture_queries() as queries:
+            self.client.get(path, data={"limit": max(page_sizes)}, **extra)
+        self.assertEqual(len(queries), resolve(path).func.view_class.query_budget)
+
+        query_counts: List[int] = assert_query_budget(
+            self.client, path, page_sizes=page_sizes, **extra
+        )
+        self.assertEqual(query_counts, [cached_query_count] * len(page_sizes))
+
+    def test_case_allocation_list(self):
+        # ? the allocation file list is registered under the same URL name
+        self.assert_view_query_budget(
+            path="/store/operations/case-management/api/v1/case-allocation-file-api/",
+            cached_query_count=4,
+        )
+
+    def test_user_management_user_list(self):
+        self.assert_view_query_budget(
+            path=reverse("UserManagementUserGenericAPIView"), cached_query_count=10
+        )
+
+    def test_user_management_user_details(self):
+        self.assert_view_query_budget(
+            path=reverse(
+                "UserManagementUserDetailsGenericAPIView",
+                kwargs={"id": self.field_officer_instances[0].pk},
+            ),
+            cached_query_count=10,
+            page_sizes=(1,),
+        )
+
+    def test_activity_monitoring_log_list(self):
+        self.assert_view_query_budget(
+            path=reverse("ActivityMonitoringLogListModelGenericAPIView"),
+            cached_query_count=3,
+        )
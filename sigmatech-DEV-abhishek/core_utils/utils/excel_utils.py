@@ -1,7 +1,6 @@
 # core_utils/utils/dataframe_utils.py
 
 import pandas as pd
-import numpy as np
 from typing import List, Dict, Any
 
 
@@ -12,16 +11,9 @@ def dataframe_to_records_json(df: pd.DataFrame) -> List[Dict[str, Any]]:
     - np.nan -> None
     - numpy scalars -> Python primitives
     """
-    # Replace NaN with None
+    # Casting to object turns numpy scalars into Python primitives column-wise,
+    # then NaN/NaT are replaced with None
+    df: pd.DataFrame = df.astype(object)
     df: pd.DataFrame = df.where(pd.notnull(df), None)
 
-    records: List[Dict[str, Any]] = []
-    for i in range(len(df)):
-        row: Dict[str, Any] = df.iloc[i].apply(
-            lambda x: (
-                None if pd.isna(x) else x.item() if isinstance(x, np.generic) else x
-            )
-        )
-        records.append(dict(row))
-
-    return records
+    return df.to_dict(orient="records")
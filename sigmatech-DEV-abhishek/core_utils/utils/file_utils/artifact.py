@@ -0,0 +1,406 @@
+import hashlib
+import io
+import os
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+import pandas as pd
+import requests
+from django.conf import settings
+from pandas.core.frame import DataFrame
+from requests.models import Response
+
+from core_utils.utils.excel_utils import dataframe_to_records_json
+from core_utils.utils.file_utils.stream import (
+    iter_csv_dataframe_chunks,
+    iter_xlsx_dataframe_chunks,
+    read_csv_headers,
+    read_xlsx_headers,
+)
+
+SUPPORTED_FILE_EXTENSIONS: List[str] = ["xlsx", "xls", "csv"]
+
+
+def get_file_extension(file_url: str) -> str:
+    """
+    Returns the lower-cased extension of the given file URL.
+
+    Args:
+        file_url (str): The URL of the file.
+
+    Returns:
+        str: File extension without the leading dot.
+    """
+    return file_url.lower().split(".")[-1]
+
+
+class FileArtifact:
+    """
+    Single downloaded and parsed copy of an Excel/CSV file.
+
+    The file is fetched over the network exactly once when the artifact is
+    created and parsed into a DataFrame at most once. Headers, records and
+    column values are all derived from that single DataFrame, so every
+    validation and save step of an upload can share the same artifact.
+
+    Attributes:
+        file_url (str): The URL the file was downloaded from.
+        file_extension (str): Detected file extension.
+        content_hash (str): sha256 hex digest of the downloaded content.
+        is_streaming (bool): Always False, see StreamingFileArtifact.
+    """
+
+    file_url: str
+    file_extension: str
+    content_hash: str
+    is_streaming: bool = False
+
+    def __init__(self, file_url: str, content: bytes):
+        self.file_url = file_url
+        self.file_extension = get_file_extension(file_url=file_url)
+        self.content_hash = hashlib.sha256(content).hexdigest()
+        self._content: Optional[bytes] = content
+        self._dataframe: Optional[DataFrame] = None
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def content(self) -> bytes:
+        """
+        Raw downloaded bytes. Released once the DataFrame has been parsed.
+        """
+        return self._content
+
+    @property
+    def dataframe(self) -> DataFrame:
+        """
+        Returns the parsed DataFrame, parsing the downloaded content on first
+        access. The DataFrame lives only as long as this artifact.
+
+        Raises:
+            pd.errors.EmptyDataError: If the file has no data.
+            Exception: If the file could not be parsed.
+        """
+        if self._dataframe is None:
+            self._dataframe = self.parse()
+            # Content is no longer needed once parsed
+            self._content = None
+        return self._dataframe
+
+    @property
+    def header_data(self) -> List[str]:
+        return self.dataframe.columns.tolist()
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """
+        Rows of the file as a list of dicts with Python primitive values.
+        Computed once per artifact.
+        """
+        if self._records is None:
+            self._records = dataframe_to_records_json(df=self.dataframe)
+        return self._records
+
+    @property
+    def records_count(self) -> int:
+        return len(self.dataframe)
+
+    @property
+    def first_record(self) -> Optional[Dict[str, Any]]:
+        if self._records is not None:
+            return self._records[0] if self._records else None
+        records: List[Dict[str, Any]] = dataframe_to_records_json(
+            df=self.dataframe.head(1)
+        )
+        return records[0] if records else None
+
+    def distinct_values(self, field_name: str) -> Set[Any]:
+        """
+        Returns the unique values of a column, NaN values as None.
+        """
+        return set(self.field_values(field_name=field_name))
+
+    def iter_dataframe_chunks(self, chunk_size: int) -> Iterator[DataFrame]:
+        """
+        Yields the parsed file in DataFrames of at most ``chunk_size`` rows.
+        """
+        df: DataFrame = self.dataframe
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start : start + chunk_size]
+
+    def iter_record_chunks(self, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the file records in lists of at most ``chunk_size`` records.
+        """
+        for chunk in self.iter_dataframe_chunks(chunk_size=chunk_size):
+            yield dataframe_to_records_json(df=chunk)
+
+    def close(self) -> None:
+        """
+        Nothing to release for in-memory artifacts.
+        """
+
+    def field_values(self, field_name: str, exclude_nan: bool = False) -> List[Any]:
+        """
+        Returns all values of a column in the file.
+
+        Args:
+            field_name (str): The column name whose values should be returned.
+            exclude_nan (bool): Drop NaN values instead of replacing them with None.
+
+        Returns:
+            List[Any]: Values of the specified field.
+
+        Raises:
+            ValueError: If the field does not exist in the file headers.
+        """
+        df: DataFrame = self.dataframe
+
+        if field_name not in df.columns:
+            raise ValueError(f"Field '{field_name}' not found in file headers.")
+
+        if exclude_nan:
+            return df[field_name].dropna().tolist()
+
+        return [None if pd.isna(v) else v for v in df[field_name].tolist()]
+
+    def parse(self) -> DataFrame:
+        """
+        Parses the downloaded content into a DataFrame.
+
+        Returns:
+            DataFrame: Parsed file content.
+        """
+        if self.file_extension in ["xlsx", "xls"]:
+            return pd.read_excel(io.BytesIO(self._content), engine="openpyxl")
+        return pd.read_csv(io.BytesIO(self._content))
+
+
+def get_file_artifact(file_url: str) -> FileArtifact:
+    """
+    Downloads the file at the given URL once and wraps it in a FileArtifact.
+
+    Args:
+        file_url (str): The URL of the file.
+
+    Returns:
+        FileArtifact: The downloaded, lazily parsed file.
+
+    Raises:
+        ValueError: If the file extension is unsupported.
+        requests.HTTPError: If the file could not be downloaded.
+    """
+    file_extension: str = get_file_extension(file_url=file_url)
+
+    if file_extension not in SUPPORTED_FILE_EXTENSIONS:
+        raise ValueError(f"Unsupported file format: {file_extension}")
+
+    response: Response = requests.get(file_url, stream=True)
+    response.raise_for_status()
+
+    return FileArtifact(file_url=file_url, content=response.content)
+
+
+class StreamingFileArtifact:
+    """
+    Disk-backed counterpart of FileArtifact for very large files.
+
+    The file is streamed once to a temporary file while its sha256 is
+    computed, and is then only ever read in bounded row chunks (read-only
+    workbook iteration for Excel, chunked reader for CSV), so memory stays
+    flat regardless of the number of rows.
+
+    Column level information needed up-front by validations (row count, first
+    record, distinct values or full values of a few columns) is collected in a
+    single pass by ``scan``.
+
+    Attributes:
+        file_url (str): The URL the file was downloaded from.
+        file_extension (str): Detected file extension.
+        content_hash (str): sha256 hex digest of the downloaded content.
+        file_path (str): Local temporary copy of the file.
+        is_streaming (bool): Always True.
+    """
+
+    file_url: str
+    file_extension: str
+    content_hash: str
+    file_path: str
+    is_streaming: bool = True
+
+    def __init__(self, file_url: str, response: Response):
+        self.file_url = file_url
+        self.file_extension = get_file_extension(file_url=file_url)
+
+        content_hash = hashlib.sha256()
+        file_descriptor, self.file_path = tempfile.mkstemp(
+            suffix=f".{self.file_extension}"
+        )
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            for block in response.iter_content(chunk_size=1024 * 1024):
+                content_hash.update(block)
+                temp_file.write(block)
+        self.content_hash = content_hash.hexdigest()
+
+        self._header_data: Optional[List[str]] = None
+        self._records_count: Optional[int] = None
+        self._first_record: Optional[Dict[str, Any]] = None
+        self._distinct_values: Dict[str, Set[Any]] = {}
+        self._field_values: Dict[str, List[Any]] = {}
+
+    @property
+    def header_data(self) -> List[str]:
+        if self._header_data is None:
+            if self.file_extension in ["xlsx", "xls"]:
+                self._header_data = read_xlsx_headers(file_path=self.file_path)
+            else:
+                self._header_data = read_csv_headers(file_path=self.file_path)
+        return self._header_data
+
+    @property
+    def records_count(self) -> int:
+        self._ensure_scanned()
+        return self._records_count
+
+    @property
+    def first_record(self) -> Optional[Dict[str, Any]]:
+        self._ensure_scanned()
+        return self._first_record
+
+    def _ensure_scanned(self) -> None:
+        if self._records_count is None:
+            self.scan()
+
+    def iter_dataframe_chunks(self, chunk_size: int) -> Iterator[DataFrame]:
+        """
+        Yields the file content in DataFrames of at most ``chunk_size`` rows.
+        """
+        if self.file_extension in ["xlsx", "xls"]:
+            return iter_xlsx_dataframe_chunks(
+                file_path=self.file_path, chunk_size=chunk_size
+            )
+        return iter_csv_dataframe_chunks(
+            file_path=self.file_path, chunk_size=chunk_size
+        )
+
+    def iter_record_chunks(self, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the file records in lists of at most ``chunk_size`` records.
+        """
+        for chunk in self.iter_dataframe_chunks(chunk_size=chunk_size):
+            yield dataframe_to_records_json(df=chunk)
+
+    def scan(
+        self,
+        distinct_field_names: Optional[List[str]] = None,
+        value_field_names: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        """
+        Single pass over the file collecting the row count, the first record,
+        the unique values of ``distinct_field_names`` and all values of
+        ``value_field_names``. Columns missing from the headers are skipped.
+
+        Args:
+            distinct_field_names (Optional[List[str]]): Columns whose unique values are kept.
+            value_field_names (Optional[List[str]]): Columns whose values are kept in file order.
+            chunk_size (Optional[int]): Rows read per chunk.
+        """
+        headers: List[str] = self.header_data
+        distinct_field_names: List[str] = [
+            i for i in distinct_field_names or [] if i in headers
+        ]
+        value_field_names: List[str] = [
+            i for i in value_field_names or [] if i in headers
+        ]
+        self._records_count = 0
+        self._first_record = None
+        self._distinct_values = {i: set() for i in distinct_field_names}
+        self._field_values = {i: [] for i in value_field_names}
+
+        for chunk in self.iter_dataframe_chunks(
+            chunk_size=chunk_size or settings.ALLOCATION_FILE_CHUNK_SIZE
+        ):
+            if self._first_record is None and len(chunk):
+                self._first_record = dataframe_to_records_json(df=chunk.head(1))[0]
+            self._records_count += len(chunk)
+            for field_name in distinct_field_names:
+                self._distinct_values[field_name].update(
+                    None if pd.isna(v) else v for v in chunk[field_name].tolist()
+                )
+            for field_name in value_field_names:
+                self._field_values[field_name].extend(
+                    None if pd.isna(v) else v for v in chunk[field_name].tolist()
+                )
+
+    def distinct_values(self, field_name: str) -> Set[Any]:
+        """
+        Returns the unique values of a column collected by ``scan``.
+
+        Raises:
+            ValueError: If the field was not collected by the scan.
+        """
+        self._ensure_scanned()
+        if field_name not in self._distinct_values:
+            raise ValueError(f"Field '{field_name}' not found in file headers.")
+        return self._distinct_values[field_name]
+
+    def field_values(self, field_name: str, exclude_nan: bool = False) -> List[Any]:
+        """
+        Returns all values of a column collected by ``scan``.
+
+        Raises:
+            ValueError: If the field was not collected by the scan.
+        """
+        self._ensure_scanned()
+        if field_name not in self._field_values:
+            raise ValueError(f"Field '{field_name}' not found in file headers.")
+        if exclude_nan:
+            return [i for i in self._field_values[field_name] if i is not None]
+        return self._field_values[field_name]
+
+    def close(self) -> None:
+        """
+        Removes the temporary copy of the file.
+        """
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def open_file_artifact(file_url: str) -> Union[FileArtifact, StreamingFileArtifact]:
+    """
+    Downloads the file at the given URL once and returns an in-memory
+    FileArtifact, or a StreamingFileArtifact when the file size reported by the
+    server is at least ``ALLOCATION_FILE_STREAMING_MIN_FILE_SIZE`` bytes.
+
+    Args:
+        file_url (str): The URL of the file.
+
+    Returns:
+        Union[FileArtifact, StreamingFileArtifact]: The downloaded file.
+
+    Raises:
+        ValueError: If the file extension is unsupported.
+        requests.HTTPError: If the file could not be downloaded.
+    """
+    file_extension: str = get_file_extension(file_url=file_url)
+
+    if file_extension not in SUPPORTED_FILE_EXTENSIONS:
+        raise ValueError(f"Unsupported file format: {file_extension}")
+
+    response: Response = requests.get(file_url, stream=True)
+    response.raise_for_status()
+
+    streaming_min_file_size: int = settings.ALLOCATION_FILE_STREAMING_MIN_FILE_SIZE
+    content_length: int = int(response.headers.get("Content-Length") or 0)
+
+    if streaming_min_file_size > 0 and content_length >= streaming_min_file_size:
+        return StreamingFileArtifact(file_url=file_url, response=response)
+
+    return FileArtifact(file_url=file_url, content=response.content)
+
@@ -1,40 +1,35 @@
 import io
 import requests
 import pandas as pd
-from typing import Any, List, Tuple
+from typing import Any, List, Optional
 from pandas.core.frame import DataFrame
 from requests.models import Response
 
+from core_utils.utils.file_utils.artifact import FileArtifact, get_file_artifact
 
-def fetch_dataframe_from_url(file_url: str) -> Tuple[DataFrame, str]:
+
+def fetch_dataframe_from_url(
+    file_url: str, artifact: Optional[FileArtifact] = None
+) -> DataFrame:
     """
     Fetch a file from the given URL and return it as a pandas DataFrame.
 
     Args:
         file_url (str): The URL of the file.
+        artifact (Optional[FileArtifact]): Already downloaded file to reuse
+            instead of fetching the URL again.
 
     Returns:
-        Tuple[DataFrame, str]: A tuple containing the DataFrame and detected file extension.
+        DataFrame: The parsed file content.
 
     Raises:
         ValueError: If the file extension is unsupported.
         Exception: If the file could not be read.
     """
-    file_extension: str = file_url.lower().split(".")[-1]
+    if artifact is None:
+        artifact: FileArtifact = get_file_artifact(file_url=file_url)
 
-    if file_extension not in ["xlsx", "xls", "csv"]:
-        raise ValueError(f"Unsupported file format: {file_extension}")
-
-    response: Response = requests.get(file_url, stream=True)
-    response.raise_for_status()
-
-    if file_extension in ["xlsx", "xls"]:
-        df: DataFrame = pd.read_excel(io.BytesIO(response.content), engine="openpyxl")
-    else:  # csv
-        df: DataFrame = pd.read_csv(io.BytesIO(response.content))
-    # df: DataFrame = pd.read_excel(
-    #     "/Users/rohith/Desktop/coding/Django/Aptagrim/sigma/backend/project/Axis_Credit_Card.xlsx")
-    return df
+    return artifact.dataframe
 
 
 def fetch_dataframe_headers_from_url(file_url: str) -> List[str]:
@@ -70,7 +65,7 @@ def fetch_dataframe_headers_from_url(file_url: str) -> List[str]:
 
 
 def fetch_field_exclude_nan_values_from_url(
-    file_url: str, field_name: str
+    file_url: str, field_name: str, artifact: Optional[FileArtifact] = None
 ) -> List[Any]:
     """
     Fetch an Excel/CSV file from the given URL and return all values of a specific field.
@@ -78,6 +73,8 @@ def fetch_field_exclude_nan_values_from_url(
     Args:
         file_url (str): The URL of the file.
         field_name (str): The column name whose values should be returned.
+        artifact (Optional[FileArtifact]): Already downloaded file to reuse
+            instead of fetching the URL again.
 
     Returns:
         List[Any]: A list of values from the specified field.
@@ -86,18 +83,15 @@ def fetch_field_exclude_nan_values_from_url(
         ValueError: If the file extension is unsupported or the field does not exist.
         Exception: If the file could not be read.
     """
-    df, file_extension = (
-        fetch_dataframe_from_url(file_url),
-        file_url.lower().split(".")[-1],
-    )
+    if artifact is None:
+        artifact: FileArtifact = get_file_artifact(file_url=file_url)
 
-    if field_name not in df.columns:
-        raise ValueError(f"Field '{field_name}' not found in file headers.")
+    return artifact.field_values(field_name=field_name, exclude_nan=True)
 
-    return df[field_name].dropna().tolist()
 
-
-def fetch_field_values_from_url(file_url: str, field_name: str) -> List[Any]:
+def fetch_field_values_from_url(
+    file_url: str, field_name: str, artifact: Optional[FileArtifact] = None
+) -> List[Any]:
     """
     Fetch an Excel/CSV file from the given URL and return all values of a specific field.
     NaN values are replaced with None.
@@ -105,6 +99,8 @@ def fetch_field_values_from_url(file_url: str, field_name: str) -> List[Any]:
     Args:
         file_url (str): The URL of the file.
         field_name (str): The column name whose values should be returned.
+        artifact (Optional[FileArtifact]): Already downloaded file to reuse
+            instead of fetching the URL again.
 
     Returns:
         List[Any]: A list of values from the specified field (NaN replaced with None).
@@ -113,10 +109,8 @@ def fetch_field_values_from_url(file_url: str, field_name: str) -> List[Any]:
         ValueError: If the file extension is unsupported or the field does not exist.
         Exception: If the file could not be read.
     """
-    df = fetch_dataframe_from_url(file_url)
-
-    if field_name not in df.columns:
-        raise ValueError(f"Field '{field_name}' not found in file headers.")
+    if artifact is None:
+        artifact: FileArtifact = get_file_artifact(file_url=file_url)
 
-    # Replace NaN with None
-    return [None if pd.isna(v) else v for v in df[field_name].tolist()]
+    # NaN values are replaced with None
+    return artifact.field_values(field_name=field_name)
@@ -0,0 +1,119 @@
+from typing import Any, Iterator, List, Tuple
+
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.workbook.workbook import Workbook
+from pandas.core.frame import DataFrame
+
+
+def _normalize_xlsx_header(header_row: Tuple[Any, ...]) -> List[str]:
+    """
+    Trims trailing empty header cells reported by read-only worksheets and
+    names inner empty cells the way pandas does ("Unnamed: <index>").
+    """
+    header: List[Any] = list(header_row)
+    while header and header[-1] is None:
+        header.pop()
+    return [
+        f"Unnamed: {idx}" if value is None else str(value)
+        for idx, value in enumerate(header)
+    ]
+
+
+def read_xlsx_headers(file_path: str) -> List[str]:
+    """
+    Reads only the header row of the first worksheet of an Excel file.
+
+    Args:
+        file_path (str): Local path of the workbook.
+
+    Returns:
+        List[str]: Column names of the first worksheet.
+    """
+    workbook: Workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        for header_row in workbook.active.iter_rows(max_row=1, values_only=True):
+            return _normalize_xlsx_header(header_row=header_row)
+        return []
+    finally:
+        workbook.close()
+
+
+def iter_xlsx_dataframe_chunks(file_path: str, chunk_size: int) -> Iterator[DataFrame]:
+    """
+    Iterates the first worksheet of an Excel file in DataFrames of at most
+    ``chunk_size`` rows using a read-only workbook, so only one chunk of rows
+    is held in memory at a time.
+
+    Blank rows in the middle of the sheet are kept as empty rows, trailing
+    blank rows are dropped, matching ``pd.read_excel``.
+
+    Args:
+        file_path (str): Local path of the workbook.
+        chunk_size (int): Maximum number of rows per chunk.
+
+    Yields:
+        DataFrame: The next chunk of rows with the sheet headers as columns.
+    """
+    workbook: Workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows: Iterator[Tuple[Any, ...]] = workbook.active.iter_rows(values_only=True)
+        header_row: Tuple[Any, ...] = next(rows, None)
+        if header_row is None:
+            return
+
+        header: List[str] = _normalize_xlsx_header(header_row=header_row)
+        column_count: int = len(header)
+        chunk: List[Tuple[Any, ...]] = []
+        pending_blank_rows: List[Tuple[Any, ...]] = []
+
+        for row in rows:
+            row: Tuple[Any, ...] = tuple(row[:column_count]) + (None,) * (
+                column_count - len(row)
+            )
+            if all(value is None for value in row):
+                # Only keep blank rows if a non-blank row follows them
+                pending_blank_rows.append(row)
+                continue
+
+            chunk.extend(pending_blank_rows)
+            pending_blank_rows: List[Tuple[Any, ...]] = []
+            chunk.append(row)
+
+            if len(chunk) >= chunk_size:
+                yield pd.DataFrame(chunk, columns=header)
+                chunk: List[Tuple[Any, ...]] = []
+
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header)
+    finally:
+        workbook.close()
+
+
+def read_csv_headers(file_path: str) -> List[str]:
+    """
+    Reads only the header row of a CSV file.
+
+    Args:
+        file_path (str): Local path of the CSV file.
+
+    Returns:
+        List[str]: Column names of the file.
+    """
+    return pd.read_csv(file_path, nrows=0).columns.tolist()
+
+
+def iter_csv_dataframe_chunks(file_path: str, chunk_size: int) -> Iterator[DataFrame]:
+    """
+    Iterates a CSV file in DataFrames of at most ``chunk_size`` rows.
+
+    Args:
+        file_path (str): Local path of the CSV file.
+        chunk_size (int): Maximum number of rows per chunk.
+
+    Yields:
+        DataFrame: The next chunk of rows.
+    """
+    with pd.read_csv(file_path, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            yield chunk
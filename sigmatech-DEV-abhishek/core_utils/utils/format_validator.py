@@ -3,6 +3,10 @@ import random
 import string
 from typing import List
 
+# Patterns shared by the scalar validators below and column-wise (pandas) validation
+EMAIL_FORMAT_PATTERN: str = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+PHONE_FORMAT_PATTERN: str = r"^(?:\+91|0)?[-.\s]?\d{10}$"
+
 
 def is_format_validator_email(email: str) -> bool:
     """
@@ -15,8 +19,7 @@ def is_format_validator_email(email: str) -> bool:
         bool: True if valid, False otherwise.
     """
     # Basic email regex pattern
-    pattern: str = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-    return re.match(pattern, email) is not None
+    return re.match(EMAIL_FORMAT_PATTERN, email) is not None
 
 
 def is_valid_password(password: str) -> bool:
@@ -111,5 +114,4 @@ def is_format_validator_phone(phone: str) -> bool:
     Returns:
         bool: True if valid, False otherwise.
     """
-    pattern: str = r"^(?:\+91|0)?[-.\s]?\d{10}$"
-    return re.match(pattern, phone) is not None
+    return re.match(PHONE_FORMAT_PATTERN, phone) is not None
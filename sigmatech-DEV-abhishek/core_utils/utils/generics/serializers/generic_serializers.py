@@ -25,6 +25,27 @@ class CoreGenericGetQuerysetSerializer:
             print("Queryset is not defined for the serializer.")
 
 
+class CoreGenericProjectedFieldsSerializerMixin:
+    """
+    Returns only the fields listed in the `projected_fields` context (the user's
+    active manage columns, set by views with `is_column_projection_enabled`),
+    plus `always_projected_fields`. Every field is returned without it.
+    """
+
+    always_projected_fields: tuple = ("id",)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        projected_fields = self.context.get("projected_fields")
+        if not projected_fields:
+            return fields
+        return {
+            name: field
+            for name, field in fields.items()
+            if name in projected_fields or name in self.always_projected_fields
+        }
+
+
 class CoreGenericMultipleObjectDeleteSerializer(CoreGenericGetQuerysetSerializer):
     """
     Serializer to validate and delete multiple model instances by primary key.
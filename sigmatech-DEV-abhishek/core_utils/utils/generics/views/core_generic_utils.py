@@ -3,16 +3,16 @@ from django.db.models import Model
 from typing import Dict, Union, List, Optional, Any
 from rest_framework.response import Response
 from rest_framework import status
-from core.settings import logger
 import logging
-import inspect
 
 from core_utils.activity_monitoring.enums import ActivityMonitoringMethodTypeEnumChoices
-from core_utils.activity_monitoring.models import (
-    ActivityMonitoringLogModel,
-    ActivityMonitoringMethodTypeColorPreferenceModel,
+from core_utils.activity_monitoring.models import ActivityMonitoringLogModel
+from core_utils.utils.db_utils.activity_log_buffer import (
+    activity_log_buffer,
+    get_activity_method_instance,
 )
 from core_utils.utils.enums import CoreUtilsStatusEnum
+from core_utils.utils.logging_utils import get_app_logger
 
 
 class CoreGenericUtils:
@@ -52,26 +52,20 @@ class CoreGenericUtils:
 
     def get_logger(self) -> logging.LoggerAdapter:
         """
-        Creates and returns a contextual logger adapter.
+        Returns the contextual logger adapter of the class.
 
         Context includes:
             - Class name
-            - File path of caller
+            - Module of the class
+
+        The adapter is built once per class, without inspecting the call stack.
 
         Returns:
             logging.LoggerAdapter: Configured logger adapter instance.
         """
-        frame: inspect.FrameInfo = inspect.stack()[1]  # Caller frame
-        module: Optional[object] = inspect.getmodule(frame[0])
-        class_name: str = self.__class__.__name__
-        file_path: str = (
-            module.__file__ if module and hasattr(module, "__file__") else "unknown"
-        )
-
-        adapter: logging.LoggerAdapter = logging.LoggerAdapter(
-            logger, {"app_name": f"{class_name} | {file_path}"}
+        return get_app_logger(
+            app_name=f"{self.__class__.__name__} | {self.__class__.__module__}"
         )
-        return adapter
 
     # -------------------------------
     # Toast message utilities
@@ -107,20 +101,17 @@ class CoreGenericUtils:
         instance: ActivityMonitoringLogModel = self.get_activity_log_instance()
         if not instance:
             return
-        instance.description = success_message
+        values: Dict[str, Any] = {"description": success_message}
         if status and status == CoreUtilsStatusEnum.ACTIVATED.value:
-            instance.method = (
-                ActivityMonitoringMethodTypeColorPreferenceModel.objects.get(
-                    method=ActivityMonitoringMethodTypeEnumChoices.ACTIVATED.value
-                )
+            values["method"] = get_activity_method_instance(
+                method=ActivityMonitoringMethodTypeEnumChoices.ACTIVATED.value
             )
         elif status and status == CoreUtilsStatusEnum.DEACTIVATED.value:
-            instance.method = (
-                ActivityMonitoringMethodTypeColorPreferenceModel.objects.get(
-                    method=ActivityMonitoringMethodTypeEnumChoices.INACTIVATED.value
-                )
+            values["method"] = get_activity_method_instance(
+                method=ActivityMonitoringMethodTypeEnumChoices.INACTIVATED.value
             )
-        instance.save()
+        # ? the log may still be pending in the activity log buffer
+        activity_log_buffer.update(instance, **values)
 
     def set_dynamic_toast_message(self, validated_data: Dict) -> str:
         """
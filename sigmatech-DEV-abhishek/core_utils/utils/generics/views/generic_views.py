@@ -75,7 +75,9 @@ class CoreGenericGetAPIView(CoreGenericQueryset, CoreGenericQuerysetInstance):
         try:
             # ? Fetch queryset or single object
             if self.many:
-                queryset: QuerySet[Model] = self.get_queryset()
+                queryset: QuerySet[Model] = self.get_related_lookups_queryset(
+                    self.get_queryset()
+                )
             else:
                 queryset: Model = self.get_object()
 
@@ -0,0 +1,314 @@
+import base64
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Model, Q
+from django.db.models.query import QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core.settings import logger
+from core_utils.utils.enums import EnumChoices
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+
+class PaginationCountModeEnum(EnumChoices):
+    # ? COUNT(*) on every page
+    EXACT = "EXACT"
+    # ? COUNT(*) shared by identical queries for PAGINATION_COUNT_CACHE_TTL seconds
+    CACHED = "CACHED"
+    # ? planner estimate (Postgres) above PAGINATION_EXACT_COUNT_THRESHOLD rows, cached
+    APPROXIMATE = "APPROXIMATE"
+
+
+def _get_count_cache_key(queryset: QuerySet) -> str:
+    sql, params = queryset.order_by().query.sql_with_params()
+    return (
+        "pagination-count:"
+        + hashlib.sha256(f"{queryset.db}|{sql}|{params}".encode("utf-8")).hexdigest()
+    )
+
+
+def estimate_queryset_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Row estimate of the query planner, without scanning the rows.
+
+    Returns:
+        Optional[int]: Estimated count, None if the database cannot provide one.
+    """
+    connection: BaseDatabaseWrapper = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan: Any = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan: Any = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning(f"Unable to estimate queryset count: {e}")
+        return None
+
+
+def get_queryset_count(queryset: QuerySet, count_mode: str) -> Tuple[int, bool]:
+    """
+    Args:
+        queryset (QuerySet): Filtered queryset.
+        count_mode (str): `PaginationCountModeEnum` value.
+
+    Returns:
+        Tuple[int, bool]: Count and whether it is an estimate.
+    """
+    if count_mode == PaginationCountModeEnum.EXACT.value:
+        return queryset.count(), False
+
+    cache_key: str = _get_count_cache_key(queryset=queryset)
+    cached: Optional[Tuple[int, bool]] = cache.get(cache_key)
+    if cached is not None:
+        return tuple(cached)
+
+    count: Optional[int] = None
+    is_approximate: bool = False
+    if count_mode == PaginationCountModeEnum.APPROXIMATE.value:
+        count: Optional[int] = estimate_queryset_count(queryset=queryset)
+        is_approximate: bool = (
+            count is not None and count >= settings.PAGINATION_EXACT_COUNT_THRESHOLD
+        )
+    if not is_approximate:
+        count: int = queryset.count()
+
+    cache.set(cache_key, (count, is_approximate), settings.PAGINATION_COUNT_CACHE_TTL)
+    return count, is_approximate
+
+
+class CoreGenericKeysetPagination(LimitOffsetPagination):
+    """
+    Opt-in keyset (cursor) pagination for large lists, set as `pagination_class`
+    of a CoreGeneric list view.
+
+    Pages are read with `WHERE (ordering keys) > (keys of the last row)
+    LIMIT n` instead of `OFFSET`, so every page costs the same whatever its
+    depth. The ordering keys are the queryset `order_by` fields followed by the
+    primary key as tie-breaker; the `next`/`previous` links carry them in the
+    `cursor` query parameter.
+
+    Requests with an `offset` parameter (and no cursor), or querysets ordered on
+    nullable, related or computed fields, are paginated by offset; their next
+    page is also decided by fetching one extra row. The total count follows the view `pagination_count_mode`
+    (`PaginationCountModeEnum`, `KEYSET_PAGINATION_COUNT_MODE` by default).
+
+    Attributes:
+        cursor_query_param (str): Query parameter holding the cursor.
+        keyset_nullable_fields (Tuple[str, ...]): Nullable fields accepted as keys as they are
+            always set (`CoreGenericModel` timestamps).
+    """
+
+    cursor_query_param: str = "cursor"
+    keyset_nullable_fields: Tuple[str, ...] = (
+        "core_generic_created_at",
+        "core_generic_updated_at",
+    )
+
+    is_keyset: bool = False
+    is_approximate_count: bool = False
+    has_next: bool = False
+    has_previous: bool = False
+    ordering: List[Tuple[str, bool]]
+    page: List[Model]
+
+    def get_keyset_ordering(
+        self, queryset: QuerySet
+    ) -> Optional[List[Tuple[str, bool]]]:
+        """
+        Returns:
+            Optional[List[Tuple[str, bool]]]: (field attname, is descending) ordering keys ending
+                with the primary key, None if the ordering cannot be used as a keyset.
+        """
+        order_by: List[Any] = list(queryset.query.order_by) or list(
+            queryset.model._meta.ordering
+        )
+        ordering: List[Tuple[str, bool]] = []
+        for item in order_by:
+            if not isinstance(item, str) or item == "?":
+                return None
+            name: str = item.lstrip("-")
+            try:
+                field = (
+                    queryset.model._meta.pk
+                    if name == "pk"
+                    else queryset.model._meta.get_field(name)
+                )
+            except FieldDoesNotExist:
+                return None
+            if (
+                not field.concrete
+                or field.is_relation
+                or (field.null and field.name not in self.keyset_nullable_fields)
+            ):
+                return None
+            ordering.append((field.attname, item.startswith("-")))
+
+        pk_attname: str = queryset.model._meta.pk.attname
+        if pk_attname not in [attname for attname, _ in ordering]:
+            ordering.append((pk_attname, ordering[0][1] if ordering else False))
+        return ordering
+
+    def encode_cursor(self, instance: Model, is_reverse: bool) -> str:
+        cursor: Dict[str, Any] = {
+            "v": [getattr(instance, attname) for attname, _ in self.ordering],
+            "r": is_reverse,
+        }
+        return base64.urlsafe_b64encode(
+            json.dumps(cursor, default=str).encode("utf-8")
+        ).decode("ascii")
+
+    def decode_cursor(
+        self, request: Request, model: type
+    ) -> Optional[Tuple[List[Any], bool]]:
+        encoded: Optional[str] = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor: Dict[str, Any] = json.loads(
+                base64.urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8")
+            )
+            if len(cursor["v"]) != len(self.ordering):
+                raise ValueError("Cursor does not match the ordering")
+            fields: Dict[str, Any] = {
+                field.attname: field for field in model._meta.concrete_fields
+            }
+            values: List[Any] = [
+                fields[attname].to_python(value)
+                for (attname, _), value in zip(self.ordering, cursor["v"])
+            ]
+            return values, bool(cursor.get("r"))
+        except Exception:
+            raise NotFound("Invalid cursor")
+
+    def get_keyset_filter(self, values: List[Any], is_reverse: bool) -> Q:
+        """
+        Rows after (before, when reversed) the cursor: `(a > x) OR (a = x AND b > y) ...`
+        with `<` for descending keys.
+        """
+        keyset_filter: Q = Q()
+        for idx, (attname, is_descending) in enumerate(self.ordering):
+            lookup: str = "lt" if is_descending != is_reverse else "gt"
+            condition: Q = Q(**{f"{attname}__{lookup}": values[idx]})
+            for previous_idx in range(idx):
+                condition &= Q(**{self.ordering[previous_idx][0]: values[previous_idx]})
+            keyset_filter |= condition
+        return keyset_filter
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> Optional[List[Model]]:
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        count_mode: str = getattr(
+            view, "pagination_count_mode", settings.KEYSET_PAGINATION_COUNT_MODE
+        )
+        self.count, self.is_approximate_count = get_queryset_count(
+            queryset=queryset, count_mode=count_mode
+        )
+
+        ordering: Optional[List[Tuple[str, bool]]] = self.get_keyset_ordering(queryset)
+        self.is_keyset = ordering is not None and not (
+            self.offset_query_param in request.query_params
+            and self.cursor_query_param not in request.query_params
+        )
+        if not self.is_keyset:
+            return self.paginate_queryset_by_offset(queryset=queryset)
+
+        self.ordering = ordering
+        cursor: Optional[Tuple[List[Any], bool]] = self.decode_cursor(
+            request=request, model=queryset.model
+        )
+        is_reverse: bool = bool(cursor and cursor[1])
+
+        page_queryset: QuerySet = queryset.order_by(
+            *[
+                f"{'-' if is_descending != is_reverse else ''}{attname}"
+                for attname, is_descending in self.ordering
+            ]
+        )
+        if cursor:
+            page_queryset: QuerySet = page_queryset.filter(
+                self.get_keyset_filter(values=cursor[0], is_reverse=is_reverse)
+            )
+
+        page: List[Model] = list(page_queryset[: self.limit + 1])
+        has_more: bool = len(page) > self.limit
+        self.page = page[: self.limit]
+        if is_reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        return self.page
+
+    def paginate_queryset_by_offset(self, queryset: QuerySet) -> List[Model]:
+        # ? same as LimitOffsetPagination, the next page is decided by an extra
+        # ? row as the count may be an estimate or cached
+        self.offset = self.get_offset(self.request)
+        if self.count > self.limit and self.template is not None:
+            self.display_page_controls = True
+        page: List[Model] = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(page) > self.limit
+        self.page = page[: self.limit]
+        return self.page
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        if not self.is_keyset:
+            url: str = remove_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param
+            )
+            url: str = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(
+                url, self.offset_query_param, self.offset + self.limit
+            )
+            return None
+        url: str = remove_query_param(
+            self.request.build_absolute_uri(), self.offset_query_param
+        )
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.encode_cursor(instance=self.page[-1], is_reverse=False),
+        )
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.is_keyset:
+            return super().get_previous_link()
+        if not self.has_previous or not self.page:
+            return None
+        url: str = remove_query_param(
+            self.request.build_absolute_uri(), self.offset_query_param
+        )
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.encode_cursor(instance=self.page[0], is_reverse=True),
+        )
+
+    def get_paginated_response(self, data: List[Any]) -> Response:
+        response: Response = super().get_paginated_response(data)
+        response.data["is_approximate_count"] = self.is_approximate_count
+        return response
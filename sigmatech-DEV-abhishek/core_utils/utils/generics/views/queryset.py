@@ -1,7 +1,17 @@
+from django.conf import settings
 from django.db.models import Model
 from django.db.models.query import QuerySet
-from typing import Dict, Any, Union
+from django.http import HttpRequest, HttpResponse
+from typing import Dict, Any, List, Optional, Union
+from core_utils.manage_columns.v1.utils.column_projection import (
+    apply_column_projection,
+    get_user_active_columns,
+)
+from core_utils.utils.db_utils.query_budget import capture_queries, check_query_budget
 from core_utils.utils.generics.views.core_generic_utils import CoreGenericUtils
+from core_utils.utils.generics.views.related_lookups import (
+    apply_serializer_related_lookups,
+)
 
 
 class CoreGenericQueryset(CoreGenericUtils):
@@ -14,6 +24,32 @@ class CoreGenericQueryset(CoreGenericUtils):
     ordering_param_name: str = "ordering"
     queryset: QuerySet  # ? Should be overridden by subclass or view
     default_ordering_field: str = "-core_generic_created_at"  # ? Default ordering
+    # ? Apply the select_related/prefetch_related lookups needed by the serializer
+    is_related_lookups_enabled: bool = True
+    # ? Select and serialize only the user's active manage columns (opt-in)
+    is_column_projection_enabled: bool = False
+    # ? Maximum queries of a GET whatever the page size (authentication included),
+    # as run by the first request of a worker (cold caches), checked with
+    # QUERY_BUDGET_ENABLED, see core_utils.utils.db_utils.query_budget
+    query_budget: Optional[int] = None
+
+    def dispatch(
+        self, request: HttpRequest, *args: List, **kwargs: Dict
+    ) -> HttpResponse:
+        if (
+            self.query_budget is None
+            or not settings.QUERY_BUDGET_ENABLED
+            or request.method != "GET"
+        ):
+            return super().dispatch(request, *args, **kwargs)
+        with capture_queries() as queries:
+            response: HttpResponse = super().dispatch(request, *args, **kwargs)
+        check_query_budget(
+            view_name=self.__class__.__name__,
+            budget=self.query_budget,
+            queries=queries,
+        )
+        return response
 
     def get_ordering_dict(self) -> Union[str, None]:
         """
@@ -56,6 +92,64 @@ class CoreGenericQueryset(CoreGenericUtils):
         """
         return self.get_queryset()
 
+    def get_related_lookups_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Joins/prefetches the relations read by the serializer fields `source`,
+        so the number of queries does not grow with the page size.
+
+        Returns:
+            QuerySet: Queryset with the related lookups applied.
+        """
+        if not self.is_related_lookups_enabled:
+            return queryset
+        context: Dict = {"request": self.request, **self.kwargs}
+        if self.get_projected_fields():
+            context["projected_fields"] = self.get_projected_fields()
+        return apply_serializer_related_lookups(
+            queryset=queryset,
+            serializer_class=self.get_serializer_class(),
+            context=context,
+        )
+
+    def get_projected_fields(self) -> Optional[List[str]]:
+        """
+        Active manage columns of the user for the view serializer, resolved once
+        per request.
+
+        Returns:
+            Optional[List[str]]: Serializer field names, None when every field is returned.
+        """
+        # ? writes (list-create views) always go through every field
+        if not self.is_column_projection_enabled or self.request.method != "GET":
+            return None
+        if not hasattr(self, "_projected_fields"):
+            self._projected_fields: Optional[List[str]] = get_user_active_columns(
+                user_instance=self.request.user,
+                serializer_class=self.get_serializer_class(),
+            )
+        return self._projected_fields
+
+    def set_context_data(self) -> Dict:
+        context: Dict = super().set_context_data()
+        if self.get_projected_fields():
+            # ? read by `CoreGenericProjectedFieldsSerializerMixin`
+            context["projected_fields"] = self.get_projected_fields()
+        return context
+
+    def get_projected_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Selects only the model columns read by the projected serializer fields.
+
+        Returns:
+            QuerySet: Queryset narrowed with `only()`, unchanged without projection.
+        """
+        if not self.get_projected_fields():
+            return queryset
+        return apply_column_projection(
+            queryset=queryset,
+            serializer=self.get_serializer_class()(context=self.set_context_data()),
+        )
+
     def get_paginate_queryset(self) -> QuerySet[Model]:
         """
         Paginates the filtered and ordered queryset using DRF's pagination mechanism.
@@ -64,7 +158,11 @@ class CoreGenericQueryset(CoreGenericUtils):
             QuerySet[Model]: Paginated queryset.
         """
         return self.paginate_queryset(
-            self.filter_queryset(self.get_queryset_order_by())
+            self.get_related_lookups_queryset(
+                self.get_projected_queryset(
+                    self.filter_queryset(self.get_queryset_order_by())
+                )
+            )
         )
 
 
@@ -0,0 +1,270 @@
+import logging
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+from django.db.models.query import ModelIterable, QuerySet
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+
+from core.settings import logger
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+# Maximum depth of nested serializers inspected
+RELATED_LOOKUPS_MAX_DEPTH: int = 5
+
+# Related lookups planned per (serializer class, model, projected fields)
+_related_lookups_cache: Dict[
+    Tuple[Type, Type[Model], Tuple[str, ...]], Tuple[List[str], List[str]]
+] = {}
+
+
+def _get_relation_field(model: Type[Model], name: str):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _plan_source(
+    model: Type[Model],
+    source_attrs: List[str],
+    field: Optional[serializers.Field],
+    prefix: str,
+    is_prefetch: bool,
+    select_related: Set[str],
+    prefetch_related: Set[str],
+    depth: int,
+) -> None:
+    """
+    Walks one serializer field `source` over the model relations and records the
+    lookups it needs: forward foreign keys and one-to-one relations are joined
+    with `select_related`, many-to-many and reverse foreign keys (and anything
+    reached through them) are loaded with `prefetch_related`.
+    """
+    path: List[str] = []
+    for idx, attr in enumerate(source_attrs):
+        relation = _get_relation_field(model=model, name=attr)
+        if (
+            relation is None
+            or not relation.is_relation
+            or relation.related_model is None
+        ):
+            # ? plain field, property or method: nothing more to load
+            break
+
+        is_last: bool = idx == len(source_attrs) - 1
+        is_many: bool = relation.many_to_many or relation.one_to_many
+        if (
+            is_last
+            and not is_many
+            and isinstance(field, RelatedField)
+            and field.use_pk_only_optimization()
+            and relation.concrete
+        ):
+            # ? the primary key is read from the foreign key column
+            break
+
+        path.append(attr)
+        lookup: str = f"{prefix}{'__'.join(path)}"
+        is_prefetch: bool = is_prefetch or is_many
+        (prefetch_related if is_prefetch else select_related).add(lookup)
+        model: Type[Model] = relation.related_model
+
+        if is_last:
+            _plan_nested_serializer(
+                model=model,
+                field=field,
+                prefix=f"{lookup}__",
+                is_prefetch=is_prefetch,
+                select_related=select_related,
+                prefetch_related=prefetch_related,
+                depth=depth,
+            )
+
+
+def _plan_nested_serializer(
+    model: Type[Model],
+    field: Optional[serializers.Field],
+    prefix: str,
+    is_prefetch: bool,
+    select_related: Set[str],
+    prefetch_related: Set[str],
+    depth: int,
+) -> None:
+    if isinstance(field, serializers.ListSerializer):
+        field: serializers.Field = field.child
+    if (
+        isinstance(field, serializers.BaseSerializer)
+        and depth < RELATED_LOOKUPS_MAX_DEPTH
+    ):
+        _plan_serializer_fields(
+            model=model,
+            fields=field.fields,
+            prefix=prefix,
+            is_prefetch=is_prefetch,
+            select_related=select_related,
+            prefetch_related=prefetch_related,
+            depth=depth + 1,
+        )
+
+
+def _plan_serializer_fields(
+    model: Type[Model],
+    fields: Dict[str, serializers.Field],
+    prefix: str,
+    is_prefetch: bool,
+    select_related: Set[str],
+    prefetch_related: Set[str],
+    depth: int,
+) -> None:
+    for field in fields.values():
+        if field.write_only or isinstance(field, serializers.SerializerMethodField):
+            continue
+        source: str = field.source
+        # ? `many=True` relational fields always need their relation loaded
+        is_many_field: bool = isinstance(field, ManyRelatedField)
+        if not source or source == "*":
+            if source == "*":
+                _plan_nested_serializer(
+                    model=model,
+                    field=field,
+                    prefix=prefix,
+                    is_prefetch=is_prefetch,
+                    select_related=select_related,
+                    prefetch_related=prefetch_related,
+                    depth=depth,
+                )
+            continue
+
+        _plan_source(
+            model=model,
+            source_attrs=source.split("."),
+            field=None if is_many_field else field,
+            prefix=prefix,
+            is_prefetch=is_prefetch,
+            select_related=select_related,
+            prefetch_related=prefetch_related,
+            depth=depth,
+        )
+
+
+def get_serializer_related_lookups(
+    serializer_class: Type[serializers.BaseSerializer],
+    model: Type[Model],
+    context: Optional[Dict] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Plans the `select_related` and `prefetch_related` lookups a serializer needs
+    to render instances of `model` without a query per row, from the `source`
+    paths of its fields and of its nested serializers.
+
+    `SerializerMethodField`s are not inspected. The plan is cached per
+    serializer class, model and `projected_fields` of the context, the
+    serializer is only instantiated to build it.
+
+    Args:
+        serializer_class (Type[serializers.BaseSerializer]): Serializer rendering each instance.
+        model (Type[Model]): Model of the serialized queryset.
+        context (Optional[Dict]): Serializer context.
+
+    Returns:
+        Tuple[List[str], List[str]]: `select_related` and `prefetch_related` lookups.
+    """
+    cache_key: Tuple[Type, Type[Model], Tuple[str, ...]] = (
+        serializer_class,
+        model,
+        tuple(sorted((context or {}).get("projected_fields") or ())),
+    )
+    if cache_key not in _related_lookups_cache:
+        select_related: Set[str] = set()
+        prefetch_related: Set[str] = set()
+        _plan_serializer_fields(
+            model=model,
+            fields=serializer_class(context=context or {}).fields,
+            prefix="",
+            is_prefetch=False,
+            select_related=select_related,
+            prefetch_related=prefetch_related,
+            depth=0,
+        )
+        # ? a select_related path implies its prefixes, keep the longest ones only
+        _related_lookups_cache[cache_key] = (
+            sorted(
+                lookup
+                for lookup in select_related
+                if not any(other.startswith(f"{lookup}__") for other in select_related)
+            ),
+            sorted(prefetch_related),
+        )
+    return _related_lookups_cache[cache_key]
+
+
+def apply_serializer_related_lookups(
+    queryset: QuerySet[Model],
+    serializer_class: Type[serializers.BaseSerializer],
+    context: Optional[Dict] = None,
+) -> QuerySet[Model]:
+    """
+    Applies `get_serializer_related_lookups()` to a queryset.
+
+    Querysets returning dicts/tuples or combined with union/intersection are
+    returned unchanged, as are relations excluded by `only()`/`defer()` and
+    lookups the queryset already prefetches.
+
+    Args:
+        queryset (QuerySet[Model]): Queryset to serialize.
+        serializer_class (Type[serializers.BaseSerializer]): Serializer rendering each instance.
+        context (Optional[Dict]): Serializer context.
+
+    Returns:
+        QuerySet[Model]: Queryset with the related lookups applied.
+    """
+    if (
+        not isinstance(queryset, QuerySet)
+        or queryset._iterable_class is not ModelIterable
+        or queryset.query.combinator
+    ):
+        return queryset
+
+    try:
+        select_related, prefetch_related = get_serializer_related_lookups(
+            serializer_class=serializer_class, model=queryset.model, context=context
+        )
+    except Exception as e:
+        logger.warning(
+            f"Unable to plan related lookups of {serializer_class.__name__}: {e}"
+        )
+        return queryset
+
+    deferred_fields, is_defer = queryset.query.deferred_loading
+    if deferred_fields and is_defer:
+        # ? defer(): relations deferred themselves cannot be joined
+        select_related: List[str] = [
+            lookup
+            for lookup in select_related
+            if lookup.split("__")[0] not in deferred_fields
+        ]
+    elif deferred_fields:
+        # ? only(): relations must be part of the loaded fields
+        loaded_fields: Set[str] = {name.split("__")[0] for name in deferred_fields}
+        select_related: List[str] = [
+            lookup
+            for lookup in select_related
+            if lookup.split("__")[0] in loaded_fields
+        ]
+
+    existing_prefetches: Set[str] = {
+        getattr(lookup, "prefetch_to", lookup)
+        for lookup in queryset._prefetch_related_lookups
+    }
+    prefetch_related: List[str] = [
+        lookup for lookup in prefetch_related if lookup not in existing_prefetches
+    ]
+
+    if select_related:
+        queryset: QuerySet[Model] = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset: QuerySet[Model] = queryset.prefetch_related(*prefetch_related)
+    return queryset
@@ -1,23 +1,41 @@
 import jwt
 import datetime
+import hashlib
 import logging
 from core.settings import logger, SECRET_KEY
 
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 logger = logging.LoggerAdapter(logger, {"app_name": __name__})
 
 
+def get_token_digest(token: Union[str, bytes]) -> str:
+    """
+    Fixed-length (sha256 hex) digest of a JWT token, used to index and look up
+    stored tokens instead of the full token text.
+    """
+    if isinstance(token, str):
+        token: bytes = token.encode("utf-8")
+    return hashlib.sha256(token).hexdigest()
+
+
 class JwtTokenUtils:
     jwt_token: str
+    _decoded_token: Optional[Dict] = None
 
     def __init__(self, jwt_token: str):
         self.jwt_token = jwt_token
 
     def decrypt_jwt_token(self) -> Dict:
         """
-        This method will decode the JWT token and return its payload without verifying its signature.
+        This method will decode the JWT token and return its payload, or an empty dict
+        if the token is invalid or expired. The token is decoded only once per instance.
         """
+        if self._decoded_token is None:
+            self._decoded_token = self._decode_jwt_token()
+        return self._decoded_token
+
+    def _decode_jwt_token(self) -> Dict:
         try:
 
             decoded_token: Dict = jwt.decode(
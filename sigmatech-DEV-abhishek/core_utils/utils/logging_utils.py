@@ -0,0 +1,125 @@
+import atexit
+import itertools
+import logging
+import queue
+import uuid
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterator, List, Optional
+
+# ? stdlib only, imported by core.settings before Django is configured
+
+# Request or background job the current log records belong to
+correlation_id_var: ContextVar[Optional[str]] = ContextVar(
+    "correlation_id", default=None
+)
+
+
+def get_correlation_id() -> Optional[str]:
+    return correlation_id_var.get()
+
+
+def set_correlation_id(correlation_id: Optional[str] = None) -> Token:
+    """
+    Sets the correlation id of the current context (thread, async task),
+    a new one when not given.
+
+    Returns:
+        Token: To restore the previous id with `reset_correlation_id()`.
+    """
+    return correlation_id_var.set(correlation_id or uuid.uuid4().hex)
+
+
+def reset_correlation_id(token: Token) -> None:
+    correlation_id_var.reset(token)
+
+
+class CorrelationIdFilter(logging.Filter):
+    """
+    Adds `correlation_id` to the records, and a default `app_name` for the
+    records of loggers used without adapter. Runs on the logging thread, where
+    the context variables of the request or job are set.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id_var.get() or "-"
+        if not hasattr(record, "app_name"):
+            record.app_name = record.name
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """
+    Keeps one DEBUG record out of `sample_rate` per logger (`app_name` of the
+    adapter), so debug logging left in loops costs a fraction of its output.
+    Other levels always pass.
+
+    Attributes:
+        sample_rate (int): 1 keeps every debug record.
+    """
+
+    sample_rate: int
+
+    def __init__(self, sample_rate: int):
+        super().__init__()
+        self.sample_rate = max(sample_rate, 1)
+        self._counters: Dict[str, Iterator[int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.DEBUG or self.sample_rate == 1:
+            return True
+        key: str = getattr(record, "app_name", record.name)
+        counter: Optional[Iterator[int]] = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        return next(counter) % self.sample_rate == 0
+
+
+def configure_queue_logging(
+    logger: logging.Logger,
+    handlers: List[logging.Handler],
+    level: str = "INFO",
+    debug_sample_rate: int = 1,
+) -> QueueListener:
+    """
+    Makes `logger` hand its records to a queue drained by a listener thread
+    that runs `handlers`, so requests and jobs do not wait on stream or file
+    writes. Records do not propagate to the root logger, whose handlers would
+    write them synchronously.
+
+    Args:
+        logger (logging.Logger): Project logger.
+        handlers (List[logging.Handler]): Handlers run by the listener thread.
+        level (str): Level of the logger.
+        debug_sample_rate (int): See `DebugSamplingFilter`.
+
+    Returns:
+        QueueListener: Started listener, stopped (and drained) at exit.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler: QueueHandler = QueueHandler(log_queue)
+    queue_handler.addFilter(CorrelationIdFilter())
+    queue_handler.addFilter(DebugSamplingFilter(sample_rate=debug_sample_rate))
+
+    logger.handlers = [queue_handler]
+    logger.setLevel(level)
+    logger.propagate = False
+
+    listener: QueueListener = QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+@lru_cache(maxsize=None)
+def get_app_logger(app_name: str) -> logging.LoggerAdapter:
+    """
+    Adapter of the project logger for `app_name`, built once per name.
+    """
+    # ? imported here, core.settings imports this module
+    from core.settings import logger
+
+    return logging.LoggerAdapter(logger, {"app_name": app_name})
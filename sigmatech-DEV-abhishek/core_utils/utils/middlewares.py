@@ -0,0 +1,69 @@
+from contextvars import Token
+from typing import Any, Callable, Tuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from core_utils.activity_monitoring.enums import PerformanceProfileKindEnum
+from core_utils.utils.db_utils.performance_profiler import profile_performance
+from core_utils.utils.logging_utils import reset_correlation_id, set_correlation_id
+
+# Header carrying the correlation id from the client or proxy, echoed in the response
+CORRELATION_ID_HEADER: str = "X-Request-ID"
+
+
+class CorrelationIdMiddleware:
+    """
+    Tags the log records of a request with its `X-Request-ID` header (a new id
+    when missing) and returns the id in the response header.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        # ? bounded, the header is client input written to every log line
+        token: Token = set_correlation_id(
+            request.headers.get(CORRELATION_ID_HEADER, "")[:64] or None
+        )
+        try:
+            response: HttpResponse = self.get_response(request)
+            response[CORRELATION_ID_HEADER] = token.var.get()
+            return response
+        finally:
+            reset_correlation_id(token)
+
+
+class PerformanceProfilerMiddleware:
+    """
+    Profiles the requests whose path starts with one of
+    `PERFORMANCE_PROFILER_PATH_PREFIXES` (every request when empty), see
+    core_utils.utils.db_utils.performance_profiler. Only loaded with
+    `PERFORMANCE_PROFILER_ENABLED`.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not settings.PERFORMANCE_PROFILER_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.path_prefixes: Tuple[str, ...] = tuple(
+            settings.PERFORMANCE_PROFILER_PATH_PREFIXES
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.path_prefixes and not request.path.startswith(self.path_prefixes):
+            return self.get_response(request)
+
+        with profile_performance(
+            kind=PerformanceProfileKindEnum.REQUEST.value, name=request.path
+        ) as performance_profile:
+            response: HttpResponse = self.get_response(request)
+        # ? set on the Django request by the DRF authentication of the view
+        user: Any = getattr(request, "user", None)
+        performance_profile.save(
+            method=request.method,
+            status_code=response.status_code,
+            performed_by=user if user is not None and user.is_authenticated else None,
+        )
+        return response
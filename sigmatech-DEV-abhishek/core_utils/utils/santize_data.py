@@ -1,18 +1,45 @@
 from django.db import models
-from typing import Dict
-from django.core.serializers import serialize
-import json
+from typing import Any, Dict, Set
+
+# Values stored as they are in a JSON snapshot, others go through `value_to_string`
+JSON_NATIVE_TYPES: tuple = (str, int, float, bool, type(None))
 
 
 def object_to_json(instance: models.Model) -> Dict:
+    """
+    Snapshot of the instance in the dumpdata format (`model`, `pk`, `fields`),
+    read from the loaded field values without the serializer round trip.
+
+    Deferred fields are left out instead of being loaded, many-to-many fields
+    are only included when prefetched.
+    """
     if not instance:
         return {}
 
-    # Serialize the instance to JSON string in dumpdata format
-    serialized_str = serialize("json", [instance])
+    deferred_fields: Set[str] = instance.get_deferred_fields()
+    fields: Dict[str, Any] = {}
+    for field in instance._meta.concrete_fields:
+        if field.primary_key or field.attname in deferred_fields:
+            continue
+        value: Any = field.value_from_object(instance)
+        fields[field.name] = (
+            value
+            if isinstance(value, JSON_NATIVE_TYPES)
+            else field.value_to_string(instance)
+        )
 
-    # Load the string back to Python data structure
-    data = json.loads(serialized_str)
+    prefetched: Dict[str, Any] = getattr(instance, "_prefetched_objects_cache", {})
+    for field in instance._meta.many_to_many:
+        if field.name in prefetched:
+            fields[field.name] = [str(related.pk) for related in prefetched[field.name]]
 
-    # Return the first (and only) item in the list as Dict
-    return data[0]
+    primary_key: Any = instance.pk
+    return {
+        "model": instance._meta.label_lower,
+        "pk": (
+            primary_key
+            if isinstance(primary_key, JSON_NATIVE_TYPES)
+            else str(primary_key)
+        ),
+        "fields": fields,
+    }
@@ -17,6 +17,9 @@ from store.configurations.region_config.api.v1.utils.handlers.constants import (
 from store.configurations.region_config.api.v1.helper_apis.dependence import (
     can_edit_city,
 )
+from store.operations.case_management.v1.utils.case_geography import (
+    refresh_case_geography_for_region_config,
+)
 
 
 class RegionConfigurationCityUpdateHandler(CoreGenericBaseHandler):
@@ -81,7 +84,13 @@ class RegionConfigurationCityUpdateHandler(CoreGenericBaseHandler):
                 instance.city_name = str(self.data["city_name"]).strip()
 
             if self.zone_instance:
-
+                if instance.zone_id != self.zone_instance.pk:
+                    # ? cases keep the city, zone and region of their pincode
+                    transaction.on_commit(
+                        lambda: refresh_case_geography_for_region_config(
+                            city_ids=[instance.pk]
+                        )
+                    )
                 instance.zone = self.zone_instance
                 self.data.pop("zone")
 
@@ -15,6 +15,9 @@ from store.configurations.region_config.models import (
 from store.configurations.region_config.api.v1.helper_apis.dependence import (
     can_edit_pincode,
 )
+from store.operations.case_management.v1.utils.case_geography import (
+    refresh_case_geography_for_region_config,
+)
 
 
 class RegionConfigurationPincodeUpdateHandler(RegionConfigurationPincodeCreateHandler):
@@ -76,6 +79,13 @@ class RegionConfigurationPincodeUpdateHandler(RegionConfigurationPincodeCreateHa
             )
 
             if "city" in self.data:
+                if instance.city_id != self.city_instance.pk:
+                    # ? cases keep the city, zone and region of their pincode
+                    transaction.on_commit(
+                        lambda: refresh_case_geography_for_region_config(
+                            pincode_ids=[instance.pk]
+                        )
+                    )
                 instance.city = self.city_instance  # assign FK relation
                 self.data.pop("city")
 
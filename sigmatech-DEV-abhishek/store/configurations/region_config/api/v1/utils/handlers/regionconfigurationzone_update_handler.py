@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 
 from core_utils.activity_monitoring.enums import ActivityMonitoringMethodTypeEnumChoices
 from core_utils.utils.enums import CoreUtilsStatusEnum, list_enum_values
@@ -17,6 +17,9 @@ from store.configurations.region_config.models import (
 from store.configurations.region_config.api.v1.helper_apis.dependence import (
     can_edit_zone,
 )
+from store.operations.case_management.v1.utils.case_geography import (
+    refresh_case_geography_for_region_config,
+)
 
 
 class RegionConfigurationZoneUpdateHandler(CoreGenericBaseHandler):
@@ -66,6 +69,14 @@ class RegionConfigurationZoneUpdateHandler(CoreGenericBaseHandler):
 
             if self.region_instance:
                 data["region"] = self.region_instance
+                if self.instance.region_id != self.region_instance.pk:
+                    # ? cases keep the city, zone and region of their pincode
+                    zone_id: Any = self.instance.pk
+                    transaction.on_commit(
+                        lambda: refresh_case_geography_for_region_config(
+                            zone_ids=[zone_id]
+                        )
+                    )
 
             self.instance: RegionConfigurationZoneModel = self.update_model_instance(
                 instance=self.instance, data=data
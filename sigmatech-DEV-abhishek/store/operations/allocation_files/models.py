@@ -75,6 +75,11 @@ class AllocationFileModel(CoreGenericModel):
         default=0,
         db_column="NO_OF_DUPLICATE_RECORDS",
     )
+    # ? records of the chunks committed by the last (re)upload
+    no_of_processed_records = models.IntegerField(
+        default=0,
+        db_column="NO_OF_PROCESSED_RECORDS",
+    )
     expiry_date = models.DateTimeField(
         null=True,
         blank=True,
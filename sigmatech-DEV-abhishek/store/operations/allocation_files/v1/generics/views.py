@@ -21,7 +21,9 @@ from store.operations.allocation_files.v1.generics.serializers import (
     AllocationFileListSerializer,
 )
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Value, IntegerField
+from django.db.models import OuterRef, Subquery, Sum, Value, IntegerField
+from django.db.models.functions import Coalesce
+from store.operations.case_management.models import CasePortfolioRollupModel
 
 from user_config.user_auth.utils.custom_authentication.custom_authentication import (
     CustomAuthentication,
@@ -52,8 +54,17 @@ class AllocationFileGenericAPIView(
     success_message = ALLOCATION_FILE_API_SUCCESS_MESSAGE
 
     def get_queryset(self):
+        # ? case count read from the portfolio rollups instead of counting the cases
+        cases_count = (
+            CasePortfolioRollupModel.objects.filter(allocation_file=OuterRef("pk"))
+            .values("allocation_file")
+            .annotate(total=Sum("case_count"))
+            .values("total")
+        )
         return self.queryset.annotate(
-            cases_count=Count("CaseManagementCaseModel_allocation_file", distinct=True),
+            cases_count=Coalesce(
+                Subquery(cases_count, output_field=IntegerField()), Value(0)
+            ),
             tos_count=Value(0, output_field=IntegerField()),
             referred=Value(0, output_field=IntegerField()),
         )
@@ -0,0 +1,362 @@
+import datetime
+from decimal import Decimal, DecimalException
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+from pandas.core.series import Series
+
+from core_utils.utils.enums import get_enum_value_with_key
+from core_utils.utils.format_validator import (
+    EMAIL_FORMAT_PATTERN,
+    PHONE_FORMAT_PATTERN,
+    is_format_validator_email,
+    is_format_validator_phone,
+)
+from store.configurations.loan_config.template_config.enums import (
+    CustomAllocationFileTemplateReservedFieldsEnum,
+)
+
+# Regex equivalents of the scalar validation methods used in `field_type_mapping`
+VALIDATION_METHOD_PATTERNS: Dict[Callable, str] = {
+    is_format_validator_email: EMAIL_FORMAT_PATTERN,
+    is_format_validator_phone: PHONE_FORMAT_PATTERN,
+}
+
+# Date formats tried, in order, for text date cells
+DATE_FORMATS: List[str] = ["%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%m/%d/%Y", "%m-%d-%Y"]
+
+# Numeric cells at or above 2**63 (in absolute value) would wrap when cast to int64
+INT64_BOUND: float = float(2**63)
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _parse_date(value: str) -> Optional[datetime.date]:
+    """
+    Parses a text date with `datetime.strptime`, for the dates out of the
+    pandas timestamp range (e.g. 9999-12-31) coerced to NaT by `pd.to_datetime`.
+    """
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+class AllocationFileColumnValidator:
+    """
+    Column-wise validation engine for allocation file chunks.
+
+    Validates whole pandas columns at once against the rules declared in
+    `field_type_mapping` (length, email, phone, integer, decimal precision,
+    date formats and foreign-key lookups) and produces the same per-row result
+    as `UpdateAllocationFileCaseDetails._validate_case_fields`: a dict of valid
+    converted values and the list of header names in error, in column order.
+
+    Text/numeric columns go through vectorized pandas operations; object
+    columns of mixed types fall back to the scalar rule, evaluated once per
+    distinct value.
+
+    Attributes:
+        field_type_mapping (Dict[str, Tuple[Type, Optional[Dict[str, Any]]]]): Field rules.
+        scalar_validator (Callable): Scalar rule `(field_name, value, expected_type, constraints)
+            -> (is_valid, converted_value)` used as fallback and for lookup fields.
+    """
+
+    field_type_mapping: Dict[str, Tuple[Type, Optional[Dict[str, Any]]]]
+    scalar_validator: Callable[..., Tuple[bool, Any]]
+
+    def __init__(
+        self,
+        field_type_mapping: Dict[str, Tuple[Type, Optional[Dict[str, Any]]]],
+        scalar_validator: Callable[..., Tuple[bool, Any]],
+    ):
+        self.field_type_mapping = field_type_mapping
+        self.scalar_validator = scalar_validator
+
+    def get_column_db_fields(self, columns: List[str]) -> Dict[str, str]:
+        """
+        Maps file headers (enum names) to db fields once per chunk instead of once per cell.
+
+        Returns:
+            Dict[str, str]: Validated db field keyed by file header, in column order.
+        """
+        column_db_fields: Dict[str, str] = {}
+        for column in columns:
+            db_field: Optional[str] = get_enum_value_with_key(
+                enum_class=CustomAllocationFileTemplateReservedFieldsEnum, key=column
+            )
+            if db_field in self.field_type_mapping:
+                column_db_fields[column] = db_field
+        return column_db_fields
+
+    def validate_dataframe(
+        self, df: DataFrame
+    ) -> Tuple[List[Dict[str, Any]], List[List[str]]]:
+        """
+        Validates every mapped column of a chunk.
+
+        Args:
+            df (DataFrame): Chunk of the uploaded file, one row per record.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[List[str]]]: Per row, the validated values keyed by
+                db field and the headers in error. Empty cells are reported as errors, like the
+                scalar validation.
+        """
+        row_count: int = len(df)
+        validated_records: List[Dict[str, Any]] = [{} for _ in range(row_count)]
+        error_fields: List[List[str]] = [[] for _ in range(row_count)]
+
+        for column, db_field in self.get_column_db_fields(
+            columns=df.columns.tolist()
+        ).items():
+            is_valid: np.ndarray
+            converted: List[Any]
+            is_valid, converted = self.validate_column(
+                db_field=db_field, series=df[column]
+            )
+            for idx in np.flatnonzero(is_valid):
+                validated_records[idx][db_field] = converted[idx]
+            for idx in np.flatnonzero(~is_valid):
+                error_fields[idx].append(column)
+
+        return validated_records, error_fields
+
+    def validate_column(
+        self, db_field: str, series: Series
+    ) -> Tuple[np.ndarray, List[Any]]:
+        """
+        Validates one column.
+
+        Args:
+            db_field (str): Db field the column maps to.
+            series (Series): Column values.
+
+        Returns:
+            Tuple[np.ndarray, List[Any]]: Boolean array of cells holding a valid, non-empty value and
+                the converted values (None where invalid).
+        """
+        expected_type, constraints = self.field_type_mapping[db_field]
+        constraints: Dict[str, Any] = constraints or {}
+        series: Series = series.reset_index(drop=True)
+
+        is_empty: Series = series.isna()
+        if series.dtype == object:
+            is_empty |= series.eq("")
+        values: Series = series[~is_empty]
+
+        if values.empty:
+            return np.zeros(len(series), dtype=bool), [None] * len(series)
+
+        if expected_type == str:
+            valid, converted = self._validate_str(
+                values=values, constraints=constraints
+            )
+        elif expected_type == int and self._is_numeric(values):
+            valid, converted = self._validate_numeric_int(
+                db_field=db_field, values=values, constraints=constraints
+            )
+        elif expected_type == Decimal and self._is_numeric(values):
+            valid, converted = self._validate_numeric_decimal(
+                values=values, constraints=constraints
+            )
+        elif expected_type == datetime.date:
+            valid, converted = self._validate_date(values=values)
+        else:
+            valid, converted = self._validate_unique_scalars(
+                db_field=db_field,
+                values=values,
+                expected_type=expected_type,
+                constraints=constraints,
+            )
+
+        is_valid: np.ndarray = np.zeros(len(series), dtype=bool)
+        result: List[Any] = [None] * len(series)
+        valid: Series = valid & converted.notna()
+        for idx, value in zip(
+            values.index[valid.to_numpy()], converted[valid].tolist()
+        ):
+            is_valid[idx] = True
+            result[idx] = value
+        return is_valid, result
+
+    @staticmethod
+    def _is_numeric(values: Series) -> bool:
+        return pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(
+            values
+        )
+
+    def _validate_str(
+        self, values: Series, constraints: Dict[str, Any]
+    ) -> Tuple[Series, Series]:
+        """
+        Length, email and phone rules on the text form of each cell.
+        """
+        if values.dtype == object:
+            str_values: Series = values.map(str)
+        else:
+            str_values: Series = values.astype(object).map(str)
+        valid: Series = pd.Series(True, index=values.index)
+
+        if "max_length" in constraints:
+            valid &= str_values.str.len() <= constraints["max_length"]
+
+        if constraints.get("is_email"):
+            valid &= self._matches_validation_method(
+                values=str_values, validation_method=constraints["validation_method"]
+            )
+
+        if constraints.get("is_phone_number"):
+            # Same as str(int(float(value))), invalid where that conversion fails
+            numeric: Series = pd.to_numeric(str_values, errors="coerce").astype(float)
+            convertible: Series = numeric.notna() & (numeric.abs() < 1e18)
+            valid &= convertible
+            str_values: Series = str_values.copy()
+            str_values[convertible] = (
+                np.trunc(numeric[convertible]).astype(np.int64).astype(str)
+            )
+
+        if "validation_method" in constraints:
+            valid &= self._matches_validation_method(
+                values=str_values, validation_method=constraints["validation_method"]
+            )
+
+        return valid, str_values.where(valid, None)
+
+    @staticmethod
+    def _matches_validation_method(
+        values: Series, validation_method: Callable[[str], bool]
+    ) -> Series:
+        pattern: Optional[str] = VALIDATION_METHOD_PATTERNS.get(validation_method)
+        if pattern:
+            return values.str.match(pattern).fillna(False).astype(bool)
+        return values.map(validation_method).astype(bool)
+
+    def _validate_numeric_int(
+        self, db_field: str, values: Series, constraints: Dict[str, Any]
+    ) -> Tuple[Series, Series]:
+        """
+        Same as int(value) on numeric cells: floats are truncated. Finite cells out
+        of the int64 range go through the scalar rule.
+        """
+        float_values: np.ndarray = values.astype(float).to_numpy()
+        is_finite: np.ndarray = np.isfinite(float_values)
+        is_int64: Series = pd.Series(
+            is_finite & (np.abs(float_values) < INT64_BOUND), index=values.index
+        )
+        is_out_of_range: Series = pd.Series(
+            is_finite & ~is_int64.to_numpy(), index=values.index
+        )
+        valid: Series = is_int64.copy()
+        converted: Series = pd.Series(None, index=values.index, dtype=object)
+        converted[is_int64] = np.trunc(values[is_int64]).astype(np.int64).astype(object)
+        if is_out_of_range.any():
+            scalar_valid, scalar_converted = self._validate_unique_scalars(
+                db_field=db_field,
+                values=values[is_out_of_range],
+                expected_type=int,
+                constraints=constraints,
+            )
+            valid[is_out_of_range] = scalar_valid.to_numpy(dtype=bool)
+            converted[is_out_of_range] = scalar_converted
+        return valid, converted
+
+    @staticmethod
+    def _validate_numeric_decimal(
+        values: Series, constraints: Dict[str, Any]
+    ) -> Tuple[Series, Series]:
+        """
+        Same as Decimal(str(value)) followed by the integer/decimal digit checks.
+        """
+        valid: Series = pd.Series(np.isfinite(values.astype(float)), index=values.index)
+        converted: Series = pd.Series(None, index=values.index, dtype=object)
+        converted[valid] = values[valid].astype(object).map(lambda v: Decimal(str(v)))
+
+        if "max_digits" in constraints and "decimal_places" in constraints:
+            decimal_str: Series = converted[valid].map(str)
+            parts: DataFrame = decimal_str.str.split(".", n=1, expand=True)
+            integer_part_len: Series = parts[0].str.replace("-", "").str.len()
+            decimal_part_len: Series = (
+                parts[1].fillna("").str.len()
+                if parts.shape[1] > 1
+                else pd.Series(0, index=parts.index)
+            )
+            valid[valid] = (
+                integer_part_len
+                <= constraints["max_digits"] - constraints["decimal_places"]
+            ) & (decimal_part_len <= constraints["decimal_places"])
+
+        return valid, converted.where(valid, None)
+
+    @staticmethod
+    def _validate_date(values: Series) -> Tuple[Series, Series]:
+        """
+        Text cells are parsed with each supported format in turn, cells pandas cannot
+        parse are retried with `datetime.strptime`; date/datetime cells are kept as they
+        are; any other cell is invalid.
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return pd.Series(True, index=values.index), values.astype(object)
+
+        valid: Series = pd.Series(False, index=values.index)
+        converted: Series = pd.Series(None, index=values.index, dtype=object)
+        if values.dtype != object:
+            return valid, converted
+
+        is_date: Series = values.map(lambda v: isinstance(v, datetime.date))
+        valid[is_date] = True
+        converted[is_date] = values[is_date]
+
+        pending: Series = values[values.map(lambda v: isinstance(v, str))]
+        for date_format in DATE_FORMATS:
+            if pending.empty:
+                break
+            parsed: Series = pd.to_datetime(
+                pending, format=date_format, errors="coerce"
+            )
+            matched: Series = parsed.notna()
+            valid[matched[matched].index] = True
+            converted[matched[matched].index] = parsed[matched].dt.date.astype(object)
+            pending: Series = pending[~matched]
+
+        # ? NaT also covers valid dates out of the pandas range, retried per cell
+        if not pending.empty:
+            reparsed: Series = pending.map(_parse_date)
+            matched: Series = reparsed.notna()
+            valid[matched[matched].index] = True
+            converted[matched[matched].index] = reparsed[matched]
+
+        return valid, converted
+
+    def _validate_unique_scalars(
+        self,
+        db_field: str,
+        values: Series,
+        expected_type: Type,
+        constraints: Dict[str, Any],
+    ) -> Tuple[Series, Series]:
+        """
+        Fallback: the scalar rule evaluated once per distinct value and mapped back.
+        """
+        results: Dict[Any, Tuple[bool, Any]] = {}
+        for value in pd.unique(values):
+            # Scalar rules expect Python values, as in `dataframe_to_records_json`
+            value: Any = _to_python(value)
+            try:
+                results[value] = self.scalar_validator(
+                    db_field, value, expected_type, constraints
+                )
+            except (ValueError, TypeError, DecimalException):
+                results[value] = (False, None)
+
+        valid: Series = values.map(lambda v: results[_to_python(v)][0]).astype(bool)
+        converted: Series = values.map(lambda v: results[_to_python(v)][1]).astype(
+            object
+        )
+        return valid, converted.where(valid, None)
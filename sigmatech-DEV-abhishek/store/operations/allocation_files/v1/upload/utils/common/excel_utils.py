@@ -1,11 +1,12 @@
-from typing import Any, Dict, List, Optional
-import requests
-from requests.models import Response
+from typing import Dict, List, Optional, Union
 
 import pandas as pd
-from pandas.core.frame import DataFrame
 from core_utils.utils.enums import get_enum_value_with_key
-from core_utils.utils.excel_utils import dataframe_to_records_json
+from core_utils.utils.file_utils.artifact import (
+    FileArtifact,
+    StreamingFileArtifact,
+    open_file_artifact,
+)
 from store.configurations.loan_config.template_config.enums import (
     CustomAllocationFileTemplateReservedFieldsEnum,
 )
@@ -25,7 +26,6 @@ from store.operations.allocation_files.v1.upload.utils.template_utils import (
 )
 
 from core_utils.utils.file_utils.extract import (
-    fetch_dataframe_from_url,
     fetch_field_exclude_nan_values_from_url,
 )
 
@@ -39,16 +39,23 @@ class AllocationFileExcelUtils:
       - Fetch and parse file data from a URL into DataFrame.
       - Validate file format, headers, and required fields.
       - Validate loan account numbers (existence, uniqueness, no missing values).
+
+    The file is downloaded and parsed once per upload into ``self.file_artifact``;
+    every later step reads from that artifact instead of the URL. Large files are
+    kept on disk as a StreamingFileArtifact and only read in row chunks.
     """
 
+    file_artifact: Union[FileArtifact, StreamingFileArtifact]
+
     def extract_data_from_excel(self) -> Optional[Dict[str, str]]:
         """
         Extracts headers and data from an Excel/CSV file and validates file format.
 
         Process:
           - Checks if file extension is supported (.xlsx, .xls, .csv).
-          - Fetches file content from URL.
-          - Reads file into a DataFrame and extracts headers and data.
+          - Fetches file content from URL once into ``self.file_artifact``.
+          - Extracts headers, and for streamed files collects the row count,
+            process/product values and loan account numbers in a single pass.
           - Returns error if file is empty or unreadable.
 
         Returns:
@@ -69,22 +76,31 @@ class AllocationFileExcelUtils:
                 self.logger.debug(f"Header validation result: {error}")
                 return error
 
-            # Fetch file content from the provided URL
-            response: Response = requests.get(self.file_url, stream=True)
-            response.raise_for_status()
-            self.logger.debug("Successfully fetched file content from URL.")
-
-            # Convert file into pandas DataFrame
-            df: DataFrame = fetch_dataframe_from_url(file_url=self.data["file_url"])
-            print("df", df)
+            # Fetch file content from the provided URL (single download)
+            self.file_artifact = open_file_artifact(file_url=self.file_url)
+            self.logger.debug(
+                f"Successfully fetched file content from URL. sha256: {self.file_artifact.content_hash}, streaming: {self.file_artifact.is_streaming}"
+            )
 
-            # Extract headers and data
-            self.header_data: List[str] = df.columns.tolist()
-            print("self.headers", self.header_data)
-            self.file_data: List[Dict[str, Any]] = dataframe_to_records_json(df=df)
+            # Extract headers from the artifact
+            self.header_data: List[str] = self.file_artifact.header_data
 
             self.logger.debug(f"Extracted headers: {self.header_data}")
 
+            if self.file_artifact.is_streaming:
+                # Single chunked pass for everything the validations need up-front
+                self.file_artifact.scan(
+                    distinct_field_names=[
+                        CustomAllocationFileTemplateReservedFieldsEnum.PROCESS_NAME.name,
+                        CustomAllocationFileTemplateReservedFieldsEnum.PRODUCT_TYPE.name,
+                        # Foreign-key columns preloaded before row processing
+                        *self.get_lookup_field_headers().values(),
+                    ],
+                    value_field_names=[
+                        CustomAllocationFileTemplateReservedFieldsEnum.LOAN_ACCOUNT_NUMBER.name,
+                    ],
+                )
+
             # Validate if headers are present
             if not self.header_data:
                 error: Dict[str, str] = {
@@ -185,23 +201,24 @@ class AllocationFileExcelUtils:
                 "key": "file_url",
             }
 
-        # Extract loan account numbers, excluding NaN
+        # Extract loan account numbers, excluding NaN, from the already parsed file
         self.loan_account_numbers_list: List[str] = (
             fetch_field_exclude_nan_values_from_url(
                 file_url=self.file_url,
                 field_name=CustomAllocationFileTemplateReservedFieldsEnum.LOAN_ACCOUNT_NUMBER.name,
+                artifact=self.file_artifact,
             )
         )
 
         # Validate no missing loan account numbers
-        if len(self.file_data) != len(self.loan_account_numbers_list):
+        if self.file_artifact.records_count != len(self.loan_account_numbers_list):
             return {
                 "error_message": LOAN_ACCOUNT_NUMBER_MISSING_ERROR_MESSAGE,
                 "key": "file_url",
             }
 
         # Validate uniqueness of loan account numbers
-        if len(self.file_data) != len(set(self.loan_account_numbers_list)):
+        if self.file_artifact.records_count != len(set(self.loan_account_numbers_list)):
             return {
                 "error_message": LOAN_ACCOUNT_DUPLICATE_NUMBER_ERROR_MESSAGE,
                 "key": "file_url",
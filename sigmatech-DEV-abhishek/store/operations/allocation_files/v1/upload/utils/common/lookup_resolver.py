@@ -0,0 +1,166 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from django.db.models import Field, Model
+
+
+class AllocationFileLookupResolver:
+    """
+    Resolves foreign-key columns of an allocation file through in-memory maps.
+
+    Every field of `field_type_mapping` whose constraints declare a
+    `lookup_field` is resolved by loading all referenced instances for the
+    distinct values of the file up-front, with a single query per
+    (model, lookup_field) pair. Rows are then resolved with dictionary lookups
+    instead of one `objects.get` per cell, and every value that could not be
+    resolved is collected in one pass for reporting.
+
+    Constraint keys used:
+        lookup_field (str): ORM lookup path matched against the cell value
+            (e.g. "title", "pincode__pincode").
+        lookup_value (Callable): Optional conversion applied to the cell value
+            before matching (e.g. `int` for pincodes).
+
+    Attributes:
+        lookup_fields (Dict[str, Tuple[Type[Model], Dict[str, Any]]]): Resolvable db fields.
+        instance_maps (Dict[str, Dict[Any, Model]]): Resolved instances per db field,
+            keyed by normalized value.
+        unresolved_values (Dict[str, Set[Any]]): Raw values that did not match any instance.
+    """
+
+    lookup_fields: Dict[str, Tuple[Type[Model], Dict[str, Any]]]
+    instance_maps: Dict[str, Dict[Any, Model]]
+    unresolved_values: Dict[str, Set[Any]]
+
+    def __init__(
+        self, field_type_mapping: Dict[str, Tuple[Type, Optional[Dict[str, Any]]]]
+    ):
+        self.lookup_fields = {
+            db_field: (model, constraints)
+            for db_field, (model, constraints) in field_type_mapping.items()
+            if constraints and "lookup_field" in constraints
+        }
+        self.instance_maps = {db_field: {} for db_field in self.lookup_fields}
+        self.unresolved_values = {db_field: set() for db_field in self.lookup_fields}
+
+    @staticmethod
+    def _get_target_field(model: Type[Model], lookup_field: str) -> Field:
+        """
+        Returns the model field at the end of a `__` separated lookup path.
+        """
+        field_names: List[str] = lookup_field.split("__")
+        for field_name in field_names[:-1]:
+            model: Type[Model] = model._meta.get_field(field_name).related_model
+        return model._meta.get_field(field_names[-1])
+
+    @staticmethod
+    def _get_instance_lookup_value(instance: Model, lookup_field: str) -> Any:
+        resolved_value: Any = instance
+        for field_name in lookup_field.split("__"):
+            resolved_value: Any = getattr(resolved_value, field_name)
+        return resolved_value
+
+    def normalize_value(self, db_field: str, value: Any) -> Any:
+        """
+        Converts a raw cell value into the key used by the instance map, the same
+        way the ORM would convert it when filtering.
+
+        Raises:
+            ValueError, TypeError: If the value cannot be converted.
+        """
+        model, constraints = self.lookup_fields[db_field]
+        lookup_value: Callable = constraints.get("lookup_value")
+        attribute_value: Any = lookup_value(value) if lookup_value else value
+        return self._get_target_field(
+            model=model, lookup_field=constraints["lookup_field"]
+        ).to_python(attribute_value)
+
+    def preload(self, values_by_field: Dict[str, Iterable[Any]]) -> None:
+        """
+        Loads the instances for every distinct value of the resolvable fields.
+
+        Fields sharing the same model and lookup (e.g. residential and office pincode)
+        are loaded with one query.
+
+        Args:
+            values_by_field (Dict[str, Iterable[Any]]): Distinct raw values per db field.
+        """
+        keys_by_field: Dict[str, Dict[Any, Any]] = {}
+        grouped_fields: Dict[Tuple[Type[Model], str], List[str]] = {}
+
+        for db_field, values in values_by_field.items():
+            if db_field not in self.lookup_fields:
+                continue
+            model, constraints = self.lookup_fields[db_field]
+            keys_by_field[db_field] = {}
+            for value in values:
+                if value is None or value == "":
+                    continue
+                try:
+                    keys_by_field[db_field][value] = self.normalize_value(
+                        db_field=db_field, value=value
+                    )
+                except Exception:
+                    self.unresolved_values[db_field].add(value)
+            grouped_fields.setdefault((model, constraints["lookup_field"]), []).append(
+                db_field
+            )
+
+        for (model, lookup_field), db_fields in grouped_fields.items():
+            keys: Set[Any] = {
+                key
+                for db_field in db_fields
+                for key in keys_by_field[db_field].values()
+            }
+            if not keys:
+                continue
+
+            queryset = model.objects.filter(**{f"{lookup_field}__in": keys})
+            related_path: str = "__".join(lookup_field.split("__")[:-1])
+            if related_path:
+                queryset = queryset.select_related(related_path)
+
+            instance_map: Dict[Any, Model] = {}
+            for instance in queryset:
+                # First match wins when the lookup value is not unique
+                instance_map.setdefault(
+                    self._get_instance_lookup_value(
+                        instance=instance, lookup_field=lookup_field
+                    ),
+                    instance,
+                )
+
+            for db_field in db_fields:
+                self.instance_maps[db_field].update(instance_map)
+                self.unresolved_values[db_field].update(
+                    value
+                    for value, key in keys_by_field[db_field].items()
+                    if key not in instance_map
+                )
+
+    def resolve(self, db_field: str, value: Any) -> Tuple[bool, Optional[Model]]:
+        """
+        Returns the preloaded instance for a cell value.
+
+        Args:
+            db_field (str): Resolvable db field name.
+            value (Any): Raw cell value.
+
+        Returns:
+            Tuple[bool, Optional[Model]]: (True, instance) if resolved, (False, None) otherwise.
+        """
+        try:
+            key: Any = self.normalize_value(db_field=db_field, value=value)
+        except Exception:
+            return False, None
+        instance: Optional[Model] = self.instance_maps[db_field].get(key)
+        return instance is not None, instance
+
+    def get_unresolved_values_report(self) -> Dict[str, List[str]]:
+        """
+        Returns every unresolved value per db field, for fields with unresolved values.
+        """
+        return {
+            db_field: sorted(str(value) for value in values)
+            for db_field, values in self.unresolved_values.items()
+            if values
+        }
@@ -142,7 +142,7 @@ class AllocationFilePayloadValidator:
         Returns:
             List: Unique values present in the column.
         """
-        return list(set([i[field_name] for i in self.file_data]))
+        return list(self.file_artifact.distinct_values(field_name=field_name))
 
     def is_product_assignment_valid(self) -> Optional[str]:
         """
@@ -161,7 +161,7 @@ class AllocationFilePayloadValidator:
         print("is_product_assignment_valid")
 
         # Check if file has any rows
-        if len(self.file_data) < 1:
+        if self.file_artifact.records_count < 1:
             return EMPTY_ALLOCATION_FILE_ERROR_MESSAGE
 
         # Validate required headers
@@ -200,9 +200,9 @@ class AllocationFilePayloadValidator:
             return MULTIPLE_PRODUCT_TYPE_EXCEL_ERROR_MESSAGE
 
         # Set process and product titles from the first row
-        self.product_title = self.file_data[0][
+        self.product_title = self.file_artifact.first_record[
             CustomAllocationFileTemplateReservedFieldsEnum.PRODUCT_TYPE.name
         ]
-        self.process_title = self.file_data[0][
+        self.process_title = self.file_artifact.first_record[
             CustomAllocationFileTemplateReservedFieldsEnum.PROCESS_NAME.name
         ]
@@ -1,9 +1,12 @@
 from decimal import Decimal, DecimalException
 from core_utils.media_storage.api.v1.utils.data_convertors import (
-    convert_data_to_excel_file,
+    ExcelFileRecordsWriter,
     upload_file_object_and_get_url,
 )
+from core_utils.utils.db_utils.performance_profiler import profile_stage
 from core_utils.utils.enums import get_enum_key_with_value, get_enum_value_with_key
+from core_utils.utils.excel_utils import dataframe_to_records_json
+from pandas.core.frame import DataFrame
 from store.configurations.loan_config.models import (
     LoanConfigurationsBucketModel,
     LoanConfigurationsMonthlyCycleModel,
@@ -15,18 +18,39 @@ from store.configurations.loan_config.template_config.enums import (
     CustomAllocationFileTemplateReservedFieldsEnum,
 )
 from store.configurations.region_config.models import RegionConfigurationPincodeModel
+from store.operations.allocation_files.models import AllocationFileModel
+from store.operations.allocation_files.v1.utils.enums import AllocationStatusEnum
 from store.operations.case_management.models import (
     CaseManagementCaseModel,
 )
+from store.operations.allocation_files.v1.upload.utils.common.column_validator import (
+    AllocationFileColumnValidator,
+)
+from store.operations.allocation_files.v1.upload.utils.common.lookup_resolver import (
+    AllocationFileLookupResolver,
+)
 from store.operations.allocation_files.v1.upload.utils.risk_cal_utils import (
-    calculate_risk_enum_for_case_instance,
+    calculate_risk_for_case_instances,
 )
 from store.operations.case_management.enums import CaseManagementFieldStatusEnumChoices
+from store.operations.case_management.v1.utils.case_geography import (
+    CASE_GEOGRAPHY_FIELDS,
+    set_case_geography,
+)
+from store.operations.case_management.v1.utils.case_search import (
+    set_case_search_text,
+    sync_case_search_grams,
+)
+from store.operations.case_management.v1.utils.portfolio_rollups import (
+    refresh_portfolio_rollups,
+)
 from django.core.exceptions import ObjectDoesNotExist
 from core_utils.utils.format_validator import (
     is_format_validator_email,
     is_format_validator_phone,
 )
+from django.conf import settings
+from django.db import transaction
 import datetime
 from typing import List, Dict, Any, Optional, Tuple, Type
 
@@ -41,8 +65,15 @@ class Utils:
     Attributes:
         field_type_mapping (Dict[str, Tuple[Type, Optional[Dict[str, Any]]]]): Mapping of field names
             to their expected types and constraints (e.g., max_length, validation_method).
+            Foreign-key fields declare a `lookup_field` and are resolved through
+            `AllocationFileLookupResolver`.
+        lookup_resolver (AllocationFileLookupResolver): Preloaded foreign-key maps of the current file.
+        column_validator (AllocationFileColumnValidator): Column-wise validation engine for file chunks.
     """
 
+    lookup_resolver: AllocationFileLookupResolver
+    column_validator: AllocationFileColumnValidator
+
     # Mapping of field names to their expected types and validation constraints
     field_type_mapping: Dict[str, Tuple[Type, Optional[Dict[str, Any]]]] = {
         "customer_name": (str, {"max_length": 255}),
@@ -140,12 +171,7 @@ class Utils:
         "last_purchase_amount": (Decimal, {"max_digits": 15, "decimal_places": 2}),
         "billing_cycle": (
             LoanConfigurationsMonthlyCycleModel,
-            {
-                "return_instance": lambda value, **kwargs: kwargs["model"].objects.get(
-                    title=value
-                ),
-                "kwargs": {"model": LoanConfigurationsMonthlyCycleModel},
-            },
+            {"lookup_field": "title"},
         ),
         "risk_statement": (str, {}),
         "delinquency_string": (str, {"max_length": 255}),
@@ -165,12 +191,7 @@ class Utils:
         ),
         "cycle": (
             LoanConfigurationsBucketModel,
-            {
-                "return_instance": lambda value, **kwargs: kwargs["model"].objects.get(
-                    title=value
-                ),
-                "kwargs": {"model": LoanConfigurationsBucketModel},
-            },
+            {"lookup_field": "title"},
         ),
         "residential_address_1": (str, {"max_length": 255}),
         "residential_address_2": (str, {"max_length": 255}),
@@ -180,12 +201,7 @@ class Utils:
         "residential_customer_state": (str, {"max_length": 100}),
         "residential_pin_code": (
             RegionConfigurationPincodeModel,
-            {
-                "return_instance": lambda value, **kwargs: kwargs["model"].objects.get(
-                    pincode__pincode=int(value)
-                ),
-                "kwargs": {"model": RegionConfigurationPincodeModel},
-            },
+            {"lookup_field": "pincode__pincode", "lookup_value": int},
         ),
         "residential_country": (str, {"max_length": 100}),
         "customer_employer_address_1": (str, {"max_length": 255}),
@@ -196,16 +212,57 @@ class Utils:
         "customer_office_state": (str, {"max_length": 100}),
         "customer_office_pin_code": (
             RegionConfigurationPincodeModel,
-            {
-                "return_instance": lambda value, **kwargs: kwargs["model"].objects.get(
-                    pincode__pincode=int(value)
-                ),
-                "kwargs": {"model": RegionConfigurationPincodeModel},
-            },
+            {"lookup_field": "pincode__pincode", "lookup_value": int},
         ),
         "customer_office_country": (str, {"max_length": 100}),
     }
 
+    def get_lookup_field_headers(self) -> Dict[str, str]:
+        """
+        Returns the file headers of foreign-key fields present in the uploaded file.
+
+        Returns:
+            Dict[str, str]: File header (enum name) keyed by db field name.
+        """
+        lookup_field_headers: Dict[str, str] = {}
+        for db_field, (_, constraints) in self.field_type_mapping.items():
+            if not constraints or "lookup_field" not in constraints:
+                continue
+            header: Optional[str] = get_enum_key_with_value(
+                CustomAllocationFileTemplateReservedFieldsEnum, db_field
+            )
+            if header and header in self.header_data:
+                lookup_field_headers[db_field] = header
+        return lookup_field_headers
+
+    def preload_lookup_instances(self) -> Dict[str, List[str]]:
+        """
+        Preloads the foreign-key instances referenced by the uploaded file, one query per
+        referenced model, before any row is processed.
+
+        Returns:
+            Dict[str, List[str]]: Every unresolved value per db field.
+
+        Side Effects:
+            - Sets `self.lookup_resolver`.
+            - Logs a single warning listing all unresolved values.
+        """
+        self.lookup_resolver = AllocationFileLookupResolver(
+            field_type_mapping=self.field_type_mapping
+        )
+        self.lookup_resolver.preload(
+            values_by_field={
+                db_field: self.file_artifact.distinct_values(field_name=header)
+                for db_field, header in self.get_lookup_field_headers().items()
+            }
+        )
+        unresolved_values: Dict[str, List[str]] = (
+            self.lookup_resolver.get_unresolved_values_report()
+        )
+        if unresolved_values:
+            self.logger.warning(f"Unresolved lookup values: {unresolved_values}")
+        return unresolved_values
+
     def _get_pincode_instance(
         self, pin_code: Optional[str]
     ) -> Optional[RegionConfigurationPincodeModel]:
@@ -224,13 +281,13 @@ class Utils:
         if not pin_code:
             self.logger.debug("No pincode provided, returning None")
             return None
-        self.logger.debug(f"Fetching pincode: {pin_code}")
+        self.logger.debug("Fetching pincode: %s", pin_code)
         # Query the pincode queryset for the given pincode
         instance: Optional[RegionConfigurationPincodeModel] = (
             self.pincode_queryset.filter(pincode=pin_code).first()
         )
         self.logger.debug(
-            f"Pincode '{pin_code}': {'Found' if instance else 'Not found'}"
+            "Pincode '%s': %s", pin_code, "Found" if instance else "Not found"
         )
         return instance
 
@@ -253,7 +310,10 @@ class Utils:
             - Logs a warning with the error details.
             - Appends the error message to error_fields.
         """
-        self.logger.warning(f"Error in field {key} with value {value}: {exception}")
+        # ? per invalid cell, formatted only when the record is emitted
+        self.logger.warning(
+            "Error in field %s with value %s: %s", key, value, exception
+        )
         error_fields.append(key)
         return error_fields
 
@@ -276,7 +336,6 @@ class Utils:
             - Logs errors and appends to error_fields if conversion fails.
         """
         try:
-            self.logger.info("_convert_value_for_field")
             # Get the expected type and constraints for the field
             expected_type, _ = self.field_type_mapping[field]
             if expected_type == datetime.date and isinstance(value, str):
@@ -294,7 +353,7 @@ class Utils:
                 # Use the raw value for other types
                 converted: Any = value
             self.logger.debug(
-                f"Converted {field} from {type(value)} to {type(converted)}"
+                "Converted %s from %s to %s", field, type(value), type(converted)
             )
             return converted
         except (ValueError, TypeError, DecimalException) as e:
@@ -307,29 +366,24 @@ class Utils:
             )
             return None
 
-    def get_data_to_excel_url(self, error_data: List[Dict[str, Any]]) -> str:
+    def get_data_to_excel_url(self, error_file_path: Optional[str]) -> str:
         """
-        Converts error data into an Excel file and uploads it to storage, returning the URL.
+        Uploads the error Excel file to storage, returning the URL.
 
         Args:
-            error_data (List[Dict[str, Any]]): List of records with error messages.
+            error_file_path (Optional[str]): Error workbook written by
+                `update_allocation_file_cases_details()`, None without error records.
 
         Returns:
             str: URL of the uploaded Excel file, or an empty string if no error data.
 
         Side Effects:
-            - Creates an Excel file from error_data if present.
-            - Uploads the file to storage and logs the resulting URL.
+            - Uploads the file to storage (which removes the local copy) and logs the resulting URL.
         """
-        self.logger.info("Generating Excel file for error data")
-        if not error_data:
+        if not error_file_path:
             self.logger.info("No error data to convert, returning empty URL")
             return ""
-        # Convert error data to an Excel file
-        file_path: str = convert_data_to_excel_file(
-            error_data, file_prefix="allocation_error"
-        )
-        self.logger.debug(f"Excel file created at path: {file_path}")
+        file_path: str = error_file_path
         # Upload the file and get the URL
         url: str = upload_file_object_and_get_url(self.request, file_path)
         self.logger.debug(f"Uploaded Excel file URL: {url}")
@@ -340,13 +394,19 @@ class UpdateAllocationFileCaseDetails(Utils):
     """
     Manages the validation and updating of case management details from uploaded allocation file data.
 
-    This class processes records from `file_data`, validates field values against expected types and constraints,
+    This class processes records from the uploaded file artifact chunk by chunk, validates field values against expected types and constraints,
     updates corresponding `CaseManagementCaseModel` instances, and tracks errors for generating error reports.
     It ensures consistency in product and process across all records and uses bulk database operations for efficiency.
     Risk-related fields (e.g., `risk`, `risk_points`) are included in updates to ensure they are saved correctly.
     The implementation avoids caching and constructor modifications, maintaining performance and compatibility.
+
+    Attributes:
+        case_details_progress_range (Tuple[float, float]): Background job percentage covered by the
+            case details update, reported once per chunk.
     """
 
+    case_details_progress_range: Tuple[float, float] = (20.0, 85.0)
+
     def _get_product_assignment_instance(
         self, product: str, process: str
     ) -> Optional[LoanConfigurationsProductAssignmentModel]:
@@ -385,92 +445,117 @@ class UpdateAllocationFileCaseDetails(Utils):
 
     def _validate_product_and_process_consistency(self) -> Tuple[bool, str]:
         """
-        Ensures all records in `file_data` have consistent product and process values.
+        Ensures all records in the uploaded file have consistent product and process values.
 
-        Checks that every record has the same product and process as the first record to maintain data integrity.
+        Checks that the file holds a single product and a single process to maintain data integrity.
         Returns an error message if inconsistencies are found.
 
         Args:
-            None: Uses `self.file_data` from the inherited `Utils` class.
+            None: Uses `self.file_artifact` from `AllocationFileExcelUtils`.
 
         Returns:
             Tuple[bool, str]: A tuple containing:
                 - `bool`: `True` if all records are consistent, `False` otherwise.
                 - `str`: Empty string if valid, error message if inconsistent.
-
-        Side Effects:
-            - Logs error messages for any inconsistencies in product or process values.
         """
-        if not self.file_data:
+        if not self.file_artifact.records_count:
             return False, "No data provided in Excel file"
 
-        first_product: str = self.file_data[0].get(
-            CustomAllocationFileTemplateReservedFieldsEnum.PRODUCT_TYPE.value
+        products: set = self.file_artifact.distinct_values(
+            field_name=CustomAllocationFileTemplateReservedFieldsEnum.PRODUCT_TYPE.name
         )
-        first_process: str = self.file_data[0].get(
-            CustomAllocationFileTemplateReservedFieldsEnum.PROCESS_NAME.value
+        if len(products) > 1:
+            return (
+                False,
+                f"Inconsistent product: expected a single product, got {', '.join(map(str, products))}",
+            )
+
+        processes: set = self.file_artifact.distinct_values(
+            field_name=CustomAllocationFileTemplateReservedFieldsEnum.PROCESS_NAME.name
         )
-        for idx, record in enumerate(self.file_data):
-            if (
-                record.get(
-                    CustomAllocationFileTemplateReservedFieldsEnum.PRODUCT_TYPE.value
-                )
-                != first_product
-            ):
-                return (
-                    False,
-                    f"Inconsistent product at row {idx + 1}: expected {first_product}, got {record.get(CustomAllocationFileTemplateReservedFieldsEnum.PRODUCT_TYPE.value)}",
-                )
-            if (
-                record.get(
-                    CustomAllocationFileTemplateReservedFieldsEnum.PROCESS_NAME.value
-                )
-                != first_process
-            ):
-                return (
-                    False,
-                    f"Inconsistent process at row {idx + 1}: expected {first_process}, got {record.get(CustomAllocationFileTemplateReservedFieldsEnum.PROCESS_NAME.value)}",
-                )
+        if len(processes) > 1:
+            return (
+                False,
+                f"Inconsistent process: expected a single process, got {', '.join(map(str, processes))}",
+            )
         return True, ""
 
-    def update_allocation_file_cases_details(self) -> List[Dict[str, Any]]:
+    def get_case_instances_for_loan_account_numbers(
+        self, loan_account_numbers: List[str]
+    ) -> Dict[str, CaseManagementCaseModel]:
         """
-        Processes and updates case management data from `file_data` with validation and error handling.
+        Fetches the cases of the current allocation file for the given loan account numbers.
 
-        Validates each record's fields against their expected types, updates `CaseManagementCaseModel` instances,
-        applies risk details, and tracks errors for error file generation. Uses bulk database operations to
-        optimize performance and includes risk-related fields in updates. Maintains product and process consistency.
+        Args:
+            loan_account_numbers (List[str]): Loan account numbers of the chunk being processed.
 
         Returns:
-            List[Dict[str, Any]]: A list of dictionaries containing records with their error fields, if any.
+            Dict[str, CaseManagementCaseModel]: Case instances keyed by loan account number.
+        """
+        return {
+            case.loan_account_number: case
+            for case in self.case_management_queryset.filter(
+                allocation_file=self.allocation_file_instance,
+                loan_account_number__in=loan_account_numbers,
+            )
+        }
+
+    def update_allocation_file_cases_details(self) -> Optional[str]:
+        """
+        Processes and updates case management data from the uploaded file with validation and error handling.
+
+        The file is processed in chunks of `ALLOCATION_FILE_CHUNK_SIZE` records; each chunk is validated
+        and persisted in its own transaction before the next one is read, so memory stays flat for
+        streamed files. The error records are spilled to the error workbook chunk by chunk.
+
+        The records of the committed chunks are counted in `no_of_processed_records` of the
+        allocation file; if a chunk fails, the file is marked FAILED with that count before
+        the error is raised. A reupload of the file processes every record again.
+
+        Returns:
+            Optional[str]: Path of the error Excel file, None when every record is valid.
 
         Side Effects:
-            - Initializes `self.validated_data` and `self.error_data` lists for tracking valid and errored records.
-            - Updates `CaseManagementCaseModel` instances in the database using `bulk_update`.
-            - Logs minimal information about processing steps and errors for debugging.
+            - Preloads foreign-key instances and sets `self.unresolved_lookup_values`.
+            - Updates `CaseManagementCaseModel` instances in the database using `bulk_update`, once per chunk.
+            - Keeps `self.validated_data` and `self.error_data` for the chunk being processed.
+            - Reports the processed records to the background job, if any.
+            - Rebuilds the portfolio rollups of the allocation file.
         """
-        error_record_data: List[Dict[str, Any]] = []
+        error_file_writer: ExcelFileRecordsWriter = ExcelFileRecordsWriter(
+            file_prefix="allocation_error"
+        )
         self.validated_data: List[Dict[str, Any]] = []
         self.error_data: List[Dict[str, Any]] = []
+        self.unresolved_lookup_values: Dict[str, List[str]] = {}
 
         # Validate product and process consistency across all records
         is_valid: bool
         error_msg: str
         is_valid, error_msg = self._validate_product_and_process_consistency()
         if not is_valid:
-            error_record_data: List[Dict[str, Any]] = [
-                {"error_fields": error_msg} for _ in self.file_data
-            ]
-            return error_record_data
+            chunk_size: int = settings.ALLOCATION_FILE_CHUNK_SIZE
+            error_records: List[Dict[str, Any]] = [
+                {"error_fields": error_msg}
+            ] * chunk_size
+            for start in range(0, self.file_artifact.records_count, chunk_size):
+                error_file_writer.add_records(
+                    error_records[: self.file_artifact.records_count - start]
+                )
+            return error_file_writer.close()
 
         # Extract product and process IDs from the first record
-        self.product_id: str = self.file_data[0].get(
+        first_record: Dict[str, Any] = self.file_artifact.first_record
+        self.product_id: str = first_record.get(
             CustomAllocationFileTemplateReservedFieldsEnum.PRODUCT_TYPE.name
         )
-        self.process_id: str = self.file_data[0].get(
+        self.process_id: str = first_record.get(
             CustomAllocationFileTemplateReservedFieldsEnum.PROCESS_NAME.name
         )
 
+        # Resolve all foreign-key values of the file up-front
+        self.unresolved_lookup_values = self.preload_lookup_instances()
+
         # Precompute required fields for validation
         required_fields: set[str] = {
             get_enum_key_with_value(CustomAllocationFileTemplateReservedFieldsEnum, i)
@@ -480,22 +565,122 @@ class UpdateAllocationFileCaseDetails(Utils):
             )
         }
 
-        # Fetch case instances in bulk for efficiency
+        # Column-wise validation engine driven by `field_type_mapping`
+        self.column_validator = AllocationFileColumnValidator(
+            field_type_mapping=self.field_type_mapping,
+            scalar_validator=self._validate_single_field,
+        )
+
+        records_count: int = self.file_artifact.records_count
+        processed_records: int = 0
+        try:
+            for chunk_idx, df in enumerate(
+                self.file_artifact.iter_dataframe_chunks(
+                    chunk_size=settings.ALLOCATION_FILE_CHUNK_SIZE
+                )
+            ):
+                self.logger.info(
+                    f"Processing allocation file chunk {chunk_idx + 1} ({len(df)} records)"
+                )
+                with transaction.atomic():
+                    error_file_writer.add_records(
+                        self._update_cases_details_for_dataframe(
+                            df=df, required_fields=required_fields
+                        )
+                    )
+
+                processed_records += len(df)
+                self.allocation_file_instance.no_of_processed_records = (
+                    processed_records
+                )
+                progress_start, progress_end = self.case_details_progress_range
+                self.report_background_job_progress(
+                    description=f"Updated case details of {processed_records}/{records_count} records",
+                    percentage=progress_start
+                    + (progress_end - progress_start)
+                    * processed_records
+                    / max(records_count, 1),
+                )
+        except Exception:
+            error_file_writer.discard()
+            self.mark_allocation_file_failed(processed_records=processed_records)
+            raise
+
+        # Rebuild the portfolio rollups of the file once all its cases are saved
+        refresh_portfolio_rollups(
+            allocation_file_ids=[self.allocation_file_instance.pk]
+        )
+
+        # ? a reupload completing a file that failed before
+        if (
+            self.allocation_file_instance.allocation_status
+            == AllocationStatusEnum.FAILED.value
+        ):
+            self.allocation_file_instance.allocation_status = (
+                AllocationStatusEnum.INPROCESS.value
+            )
+
+        return error_file_writer.close()
+
+    def mark_allocation_file_failed(self, processed_records: int) -> None:
+        """
+        Records that the processing of the file stopped after `processed_records`
+        committed records, the chunks after them were rolled back.
+        """
+        self.logger.error(
+            f"Allocation file {self.allocation_file_instance.pk} failed after {processed_records} records"
+        )
+        self.allocation_file_instance.allocation_status = (
+            AllocationStatusEnum.FAILED.value
+        )
+        self.allocation_file_instance.no_of_processed_records = processed_records
+        AllocationFileModel.objects.filter(pk=self.allocation_file_instance.pk).update(
+            allocation_status=AllocationStatusEnum.FAILED.value,
+            no_of_processed_records=processed_records,
+        )
+
+    def _update_cases_details_for_dataframe(
+        self, df: DataFrame, required_fields: set
+    ) -> List[Dict[str, Any]]:
+        """
+        Validates one chunk of the file column-wise, applies the rows to their case
+        instances and persists the chunk with a single `bulk_update`.
+
+        Args:
+            df (DataFrame): Chunk of the uploaded file.
+            required_fields (set): Required template fields (enum names).
+
+        Returns:
+            List[Dict[str, Any]]: Records of the chunk with their error fields, if any.
+        """
+        error_record_data: List[Dict[str, Any]] = []
+        self.validated_data: List[Dict[str, Any]] = []
+        self.error_data: List[Dict[str, Any]] = []
+
+        records: List[Dict[str, Any]] = dataframe_to_records_json(df=df)
+        validated_records: List[Dict[str, Any]]
+        row_error_fields: List[List[str]]
+        validated_records, row_error_fields = self.column_validator.validate_dataframe(
+            df=df
+        )
+        self.logger.debug(
+            f"Column validation: {sum(1 for i in row_error_fields if i)} of {len(records)} rows with field errors"
+        )
+
+        # Fetch case instances of the chunk in bulk for efficiency
         loan_account_numbers: List[str] = [
             self._extract_loan_account_number(record)
-            for record in self.file_data
+            for record in records
             if self._extract_loan_account_number(record)
         ]
-        case_instances: Dict[str, CaseManagementCaseModel] = {
-            case.loan_account_number: case
-            for case in self.case_management_queryset.filter(
-                allocation_file=self.allocation_file_instance,
-                loan_account_number__in=loan_account_numbers,
+        case_instances: Dict[str, CaseManagementCaseModel] = (
+            self.get_case_instances_for_loan_account_numbers(
+                loan_account_numbers=loan_account_numbers
             )
-        }
+        )
         cases_to_update: List[CaseManagementCaseModel] = []
 
-        for record_idx, record in enumerate(self.file_data):
+        for record_idx, record in enumerate(records):
             error_fields: List[str] = []
 
             loan_account_number: Optional[str] = self._extract_loan_account_number(
@@ -522,20 +707,16 @@ class UpdateAllocationFileCaseDetails(Utils):
                 self.error_data.append({"record": record, "error_fields": error_fields})
                 continue
 
-            # Validate record fields and store valid values
-            validated_record: Dict[str, Any] = {}
-            self._validate_case_fields(record, validated_record, error_fields)
+            # Valid values and field errors of the row from the column-wise validation
+            validated_record: Dict[str, Any] = validated_records[record_idx]
+            error_fields.extend(row_error_fields[record_idx])
 
             # Apply validated field values to the case instance
             for key, value in validated_record.items():
                 setattr(case_instance, key, value)
-
-            # Compute and apply risk details (e.g., risk, risk_points)
-            risk_details: Dict[str, Any] = calculate_risk_enum_for_case_instance(
-                case_instance
-            )
-            for key, value in risk_details.items():
-                setattr(case_instance, key, value)
+            # Uploaded DPD is as of the upload day, it is rolled forward from there
+            if "current_dpd" in validated_record:
+                case_instance.dpd_as_of_date = datetime.date.today()
 
             # Identify missing required fields for status determination
             missing_fields: List[str] = [
@@ -562,7 +743,19 @@ class UpdateAllocationFileCaseDetails(Utils):
 
             cases_to_update.append(case_instance)
 
-        # Perform bulk update of case instances, including risk fields
+        # Compute and apply risk details (e.g., risk, risk_points) for the whole chunk
+        with profile_stage("risk"):
+            for case_instance, risk_details in zip(
+                cases_to_update, calculate_risk_for_case_instances(cases_to_update)
+            ):
+                for key, value in risk_details.items():
+                    setattr(case_instance, key, value)
+
+        # Copy city, zone and region of the residential pincode for the whole chunk
+        set_case_geography(cases_to_update)
+        set_case_search_text(cases_to_update)
+
+        # Perform bulk update of case instances, including risk and geography fields
         if cases_to_update:
             update_fields: List[str] = [
                 field
@@ -574,10 +767,14 @@ class UpdateAllocationFileCaseDetails(Utils):
                 "missing_required_error_message",
                 "risk",
                 "risk_points",
+                "dpd_as_of_date",
+                *CASE_GEOGRAPHY_FIELDS,
+                "search_text",
             ]
             CaseManagementCaseModel.objects.bulk_update(
                 cases_to_update, fields=update_fields
             )
+            sync_case_search_grams(cases_to_update)
 
         return error_record_data
 
@@ -661,7 +858,7 @@ class UpdateAllocationFileCaseDetails(Utils):
             field_name (str): The name of the field being validated.
             value (Any): The raw value to validate.
             expected_type (Type): The expected Python type for the field (e.g., str, int, Decimal).
-            constraints (Dict[str, Any]): Validation constraints (e.g., max_length, is_email, return_instance).
+            constraints (Dict[str, Any]): Validation constraints (e.g., max_length, is_email, lookup_field).
 
         Returns:
             Tuple[bool, Any]: A tuple containing:
@@ -730,14 +927,9 @@ class UpdateAllocationFileCaseDetails(Utils):
                     converted_value: datetime.date = value
                 else:
                     return False, None
-            elif "return_instance" in constraints:
-                try:
-                    instance: Any = constraints["return_instance"](
-                        value, **constraints["kwargs"]
-                    )
-                    return True, instance
-                except ObjectDoesNotExist:
-                    return False, None
+            elif "lookup_field" in constraints:
+                # Resolved from the maps preloaded in `preload_lookup_instances`
+                return self.lookup_resolver.resolve(db_field=field_name, value=value)
             else:
                 return False, None
 
@@ -1,6 +1,12 @@
-from typing import Any, Callable, Dict, List, Optional
-from core_utils.activity_monitoring.enums import ActivityMonitoringMethodTypeEnumChoices
+from typing import Any, Callable, Dict, List, Optional, Union
+from core_utils.activity_monitoring.enums import (
+    ActivityMonitoringBackGroundActivityEnum,
+    ActivityMonitoringMethodTypeEnumChoices,
+)
+from core_utils.utils.db_utils.background_jobs import BackgroundJobHandlerMixin
+from core_utils.utils.db_utils.performance_profiler import profile_stage
 from core_utils.utils.enums import core_utils_list_enum_keys
+from core_utils.utils.file_utils.artifact import FileArtifact, StreamingFileArtifact
 from core_utils.utils.generics.serializers.mixins import CoreGenericBaseHandler
 from store.configurations.loan_config.models import (
     LoanConfigurationsProcessModel,
@@ -42,6 +48,7 @@ class ReUploadAllocationFileHandler(
     ReUploadAllocationFilePayloadValidator,
     AllocationFileHeaderValidator,
     SaveReUploadAllocationFileCaseData,
+    BackgroundJobHandlerMixin,
     CoreGenericBaseHandler,
     AllocationFileExcelUtils,
 ):
@@ -69,7 +76,7 @@ class ReUploadAllocationFileHandler(
     product_instance: LoanConfigurationsProductsModel
     allocation_file_instance: AllocationFileModel
     product_assignment_instance: LoanConfigurationsProductAssignmentModel
-    file_data: List[Dict[str, str]]
+    file_artifact: Union[FileArtifact, StreamingFileArtifact]
     header_data: List[Dict[str, str]]
     template_header_data: List[Dict[str, str]]
     template_required_header_data: List[Dict[str, str]]
@@ -99,12 +106,17 @@ class ReUploadAllocationFileHandler(
     _activity_type: str = "UPLOAD_ALLOCATION_FILE_ACTVITY_LOG"
     _method: str = ActivityMonitoringMethodTypeEnumChoices.UPDATE.value
 
+    # Background job metadata
+    background_job_title: str = (
+        ActivityMonitoringBackGroundActivityEnum.ALLOCATION_FILE.value
+    )
+    background_job_primary_key_field: str = "allocation_file_id"
+
     def set_init_values(self):
         """
         Initialize key values from `self.data`.
         Expected fields: file_url, allocation_file_id.
         """
-        print("self.data", self.data)
         self.file_url = self.data.get("file_url")
         self.allocation_file_id = self.data.get("allocation_file_id")
         # Example value: 'AXIS_CREDIT_CARD_19_09_2025'
@@ -119,13 +131,14 @@ class ReUploadAllocationFileHandler(
         5. Template header validation
         6. Loan account number validations
 
+        When the reupload is deferred to the background job worker, only the
+        file-level validations run in the request; the worker runs every step.
+
         Returns:
             Error message dict if validation fails,
             otherwise None.
         """
-        print(1)
         self.set_init_values()
-        print(2)
 
         # List of validation methods executed sequentially
         validation_methods: List[Callable] = [
@@ -136,15 +149,17 @@ class ReUploadAllocationFileHandler(
             self.template_excel_headers,
             self.upload_allocation_loan_acc_no_validation,
         ]
+        if self.is_background_job_deferred():
+            # The file is downloaded and validated by the background job worker
+            validation_methods: List[Callable] = [self.file_validations]
 
-        print(3)
         # Run validations and capture error message if any
-        error_message: Optional[Dict[str, str]] = (
-            self.is_validation_list_of_methods_valid(
-                validation_methods=validation_methods
+        with profile_stage("validation"):
+            error_message: Optional[Dict[str, str]] = (
+                self.is_validation_list_of_methods_valid(
+                    validation_methods=validation_methods
+                )
             )
-        )
-        print("error_message", error_message)
 
         if error_message:
             # Return formatted error response
@@ -158,35 +173,54 @@ class ReUploadAllocationFileHandler(
         - Update record counts (valid, error, total).
         - Update allocation status if all records are valid.
         - Persist changes to the database.
+
+        Enqueues a background job instead when the reupload is deferred to the worker.
         """
-        # Save allocation file cases and get error/valid data
-        error_data: tuple[List[dict[str, Any]], List[dict[str, Any]]] = (
-            self.update_allocation_file_cases_details()
+        if self.is_background_job_deferred():
+            self.enqueue_background_job(primary_key=self.allocation_file_id)
+            return
+
+        try:
+            self.process_allocation_file()
+        finally:
+            # Release the downloaded file (removes the temporary copy of streamed files),
+            # also when a step fails
+            self.file_artifact.close()
+
+    def process_allocation_file(self):
+        """
+        Runs the workflow steps of `create()`.
+        """
+        # Save allocation file cases and get the error Excel file
+        self.report_background_job_progress(
+            description="Updating case details", percentage=20
         )
-        print("update_allocation_file_cases_details")
+        with profile_stage("update_case_details"):
+            error_file_path: Optional[str] = self.update_allocation_file_cases_details()
 
         # Generate error Excel file and update allocation file instance
-        excel_url: str = self.get_data_to_excel_url(error_data=error_data)
-        print("a")
+        self.report_background_job_progress(
+            description="Uploading error file", percentage=85
+        )
+        with profile_stage("storage_upload"):
+            excel_url: str = self.get_data_to_excel_url(error_file_path=error_file_path)
         self.allocation_file_instance.latest_error_file_url = excel_url
 
         # Count valid records
-        self.allocation_file_instance.no_of_valid_records = (
-            self.case_management_queryset.filter(
+        self.report_background_job_progress(
+            description="Counting valid and error records", percentage=95
+        )
+        with profile_stage("counts"):
+            self.allocation_file_instance.no_of_valid_records = self.case_management_queryset.filter(
                 allocation_file=self.allocation_file_instance,
                 field_mapping_status=CaseManagementFieldStatusEnumChoices.SAVED.value,
             ).count()
-        )
-        print("b")
 
-        # Count error records
-        self.allocation_file_instance.no_of_error_records = (
-            self.case_management_queryset.filter(
+            # Count error records
+            self.allocation_file_instance.no_of_error_records = self.case_management_queryset.filter(
                 allocation_file=self.allocation_file_instance,
                 field_mapping_status=CaseManagementFieldStatusEnumChoices.ERROR.value,
             ).count()
-        )
-        print("c")
 
         # Update allocation status if all records are valid
         if (
@@ -196,7 +230,6 @@ class ReUploadAllocationFileHandler(
             self.allocation_file_instance.allocation_status = (
                 AllocationStatusEnum.INPROCESS.value
             )
-        print("d")
 
         # Save allocation file instance with updated metadata
 
@@ -204,8 +237,11 @@ class ReUploadAllocationFileHandler(
         self.data["error_file_url"] = (
             self.allocation_file_instance.latest_error_file_url
         )
+        # Every foreign-key value that could not be resolved, per field
+        self.data["unresolved_lookup_values"] = self.unresolved_lookup_values
         self.data["allocation_file_id"] = str(self.allocation_file_instance.pk)
 
         # Update created_by field for audit logging
         self.update_core_generic_updated_by(instance=self.allocation_file_instance)
-        self.allocation_file_instance.save()
+        with profile_stage("save_file"):
+            self.allocation_file_instance.save()
@@ -1,7 +1,12 @@
-import time
-from typing import Any, Callable, Dict, List, Optional, Tuple
-from core_utils.activity_monitoring.enums import ActivityMonitoringMethodTypeEnumChoices
+from typing import Any, Callable, Dict, List, Optional, Union
+from core_utils.activity_monitoring.enums import (
+    ActivityMonitoringBackGroundActivityEnum,
+    ActivityMonitoringMethodTypeEnumChoices,
+)
+from core_utils.utils.db_utils.background_jobs import BackgroundJobHandlerMixin
+from core_utils.utils.db_utils.performance_profiler import profile_stage
 from core_utils.utils.enums import core_utils_list_enum_keys
+from core_utils.utils.file_utils.artifact import FileArtifact, StreamingFileArtifact
 from core_utils.utils.generics.serializers.mixins import CoreGenericBaseHandler
 from store.configurations.loan_config.models import (
     LoanConfigurationsProcessModel,
@@ -43,6 +48,7 @@ class UploadAllocationFileHandler(
     AllocationFileHeaderValidator,
     UploadAllocationFilePayloadValidator,
     SaveAllocationFileCaseData,
+    BackgroundJobHandlerMixin,
     CoreGenericBaseHandler,
     AllocationFileExcelUtils,
 ):
@@ -53,6 +59,7 @@ class UploadAllocationFileHandler(
         - AllocationFileHeaderValidator: Validates file headers.
         - UploadAllocationFilePayloadValidator: Validates request payload.
         - SaveAllocationFileCaseData: Saves allocation file and related cases.
+        - BackgroundJobHandlerMixin: Defers the upload to the background job worker.
         - CoreGenericBaseHandler: Provides generic create/update handlers.
         - AllocationFileExcelUtils: Excel/CSV parsing utilities.
 
@@ -68,7 +75,8 @@ class UploadAllocationFileHandler(
         product_title (str): Title of product linked to the file.
         process_title (str): Title of process linked to the file.
         headers (List[str]): Extracted header fields.
-        file_data (List[Dict[str, str]]): Raw file data.
+        file_artifact (Union[FileArtifact, StreamingFileArtifact]): Single downloaded copy of the file,
+            streamed from disk in row chunks for large files.
         validated_data (List[Dict[str, str]]): Validated data after processing.
         error_data (List[Dict[str, Any]]): Records containing errors.
         loan_account_numbers_list (List[Dict[str, Any]]): List of loan account numbers extracted from file.
@@ -87,7 +95,7 @@ class UploadAllocationFileHandler(
     product_instance: LoanConfigurationsProductsModel
     allocation_file_instance: AllocationFileModel
     product_assignment_instance: LoanConfigurationsProductAssignmentModel
-    file_data: List[Dict[str, str]]
+    file_artifact: Union[FileArtifact, StreamingFileArtifact]
     header_data: List[Dict[str, str]]
     template_header_data: List[Dict[str, str]]
     template_required_header_data: List[Dict[str, str]]
@@ -117,12 +125,17 @@ class UploadAllocationFileHandler(
     _activity_type: str = "UPLOAD_ALLOCATION_FILE_ACTVITY_LOG"
     _method: str = ActivityMonitoringMethodTypeEnumChoices.CREATE.value
 
+    # Background job metadata
+    background_job_title: str = (
+        ActivityMonitoringBackGroundActivityEnum.ALLOCATION_FILE.value
+    )
+    background_job_primary_key_field: str = "allocation_file_id"
+
     def set_init_values(self):
         """
         Initializes basic values from incoming data payload.
         Extracts file_url and file_name from request data.
         """
-        print("self.data", self.data)
         self.file_url = self.data.get("file_url")
         self.file_name = self.data.get("file_name")
         # Example: 'AXIS_CREDIT_CARD_19_09_2025'
@@ -131,6 +144,9 @@ class UploadAllocationFileHandler(
         """
         Executes all validation steps required before creating allocation file.
 
+        When the upload is deferred to the background job worker, only the payload
+        checks run in the request; the worker runs every step.
+
         Steps:
             1. Extract Excel/CSV data.
             2. Perform file validations.
@@ -143,9 +159,7 @@ class UploadAllocationFileHandler(
             Optional[Dict[str, str]]: Error message dict if any validation fails,
                                       otherwise None.
         """
-        print(1)
         self.set_init_values()
-        print(2)
 
         # List of validation methods to execute in sequence
         validation_methods: List[Callable] = [
@@ -156,15 +170,17 @@ class UploadAllocationFileHandler(
             self.template_excel_headers,
             self.upload_allocation_loan_acc_no_validation,
         ]
-        print(3)
+        if self.is_background_job_deferred():
+            # The file is downloaded and validated by the background job worker
+            validation_methods: List[Callable] = [self.file_validations]
 
         # Execute validations and check for error
-        error_message: Optional[Dict[str, str]] = (
-            self.is_validation_list_of_methods_valid(
-                validation_methods=validation_methods
+        with profile_stage("validation"):
+            error_message: Optional[Dict[str, str]] = (
+                self.is_validation_list_of_methods_valid(
+                    validation_methods=validation_methods
+                )
             )
-        )
-        print("error_message", error_message)
 
         # If any validation failed, return formatted error response
         if error_message:
@@ -174,6 +190,8 @@ class UploadAllocationFileHandler(
         """
         Persists allocation file and related case data.
 
+        Enqueues a background job instead when the upload is deferred to the worker.
+
         Workflow:
             1. Save allocation file and case details.
             2. Update case details linked to allocation file.
@@ -181,56 +199,58 @@ class UploadAllocationFileHandler(
             4. Update allocation file record with counts and statuses.
             5. Save final record and update creator info.
         """
+        if self.is_background_job_deferred():
+            self.enqueue_background_job()
+            return
+
+        try:
+            self.process_allocation_file()
+        finally:
+            # Release the downloaded file (removes the temporary copy of streamed files),
+            # also when a step fails
+            self.file_artifact.close()
+
+    def process_allocation_file(self):
+        """
+        Runs the workflow steps of `create()`.
+        """
         # Step 1: Save allocation file and related case details
-        start_time: time.time = time.time()
-        self.save_allocation_file_and_case_details()
-        print(
-            f"save_allocation_file_and_case_details execution time: {time.time() - start_time:.2f} seconds"
-        )
+        self.report_background_job_progress(description="Creating cases", percentage=10)
+        with profile_stage("create_cases"):
+            self.save_allocation_file_and_case_details()
 
-        # Step 2: Update case details, returns (valid_data, error_data)
-        start_time: time.time = time.time()
-        error_data: Tuple[List[dict[str, Any]], List[dict[str, Any]]] = (
-            self.update_allocation_file_cases_details()
-        )
-        print(
-            f"update_allocation_file_cases_details execution time: {time.time() - start_time:.2f} seconds"
+        # Step 2: Update case details, returns the error Excel file path
+        self.report_background_job_progress(
+            description="Updating case details", percentage=20
         )
+        with profile_stage("update_case_details"):
+            error_file_path: Optional[str] = self.update_allocation_file_cases_details()
 
         # Step 3: Generate error Excel and update file URL
-        start_time: time.time = time.time()
-        excel_url: str = self.get_data_to_excel_url(error_data=error_data)
-        print(
-            f"get_data_to_excel_url execution time: {time.time() - start_time:.2f} seconds"
+        self.report_background_job_progress(
+            description="Uploading error file", percentage=85
         )
+        with profile_stage("storage_upload"):
+            excel_url: str = self.get_data_to_excel_url(error_file_path=error_file_path)
         self.allocation_file_instance.latest_error_file_url = excel_url
 
         # Step 4: Count valid records
-        start_time: time.time = time.time()
-        self.allocation_file_instance.no_of_valid_records = (
-            self.case_management_queryset.filter(
+        self.report_background_job_progress(
+            description="Counting valid and error records", percentage=95
+        )
+        with profile_stage("counts"):
+            self.allocation_file_instance.no_of_valid_records = self.case_management_queryset.filter(
                 allocation_file=self.allocation_file_instance,
                 field_mapping_status=CaseManagementFieldStatusEnumChoices.SAVED.value,
             ).count()
-        )
-        print(
-            f"Count valid records execution time: {time.time() - start_time:.2f} seconds"
-        )
 
-        # Step 5: Count error records
-        start_time: time.time = time.time()
-        self.allocation_file_instance.no_of_error_records = (
-            self.case_management_queryset.filter(
+            # Step 5: Count error records
+            self.allocation_file_instance.no_of_error_records = self.case_management_queryset.filter(
                 allocation_file=self.allocation_file_instance,
                 field_mapping_status=CaseManagementFieldStatusEnumChoices.ERROR.value,
             ).count()
-        )
-        print(
-            f"Count error records execution time: {time.time() - start_time:.2f} seconds"
-        )
 
         # Step 6: Check if all records are valid and update status
-        start_time: time.time = time.time()
         if (
             self.allocation_file_instance.no_of_total_records
             == self.allocation_file_instance.no_of_valid_records
@@ -238,33 +258,21 @@ class UploadAllocationFileHandler(
             self.allocation_file_instance.allocation_status = (
                 AllocationStatusEnum.INPROCESS.value
             )
-        print(
-            f"Check and update allocation status execution time: {time.time() - start_time:.2f} seconds"
-        )
 
         # Step 7: Save allocation file record
-        start_time: time.time = time.time()
-        self.allocation_file_instance.save()
+        with profile_stage("save_file"):
+            self.allocation_file_instance.save()
         self.data["allocation_file_id"] = str(self.allocation_file_instance.pk)
-        print(
-            f"Save allocation file record execution time: {time.time() - start_time:.2f} seconds"
-        )
 
         # Step 8: Store error file URL in response data
-        start_time: time.time = time.time()
         self.data["error_file_url"] = (
             self.allocation_file_instance.latest_error_file_url
         )
-        print(
-            f"Store error file URL execution time: {time.time() - start_time:.2f} seconds"
-        )
+        # Every foreign-key value that could not be resolved, per field
+        self.data["unresolved_lookup_values"] = self.unresolved_lookup_values
 
         # Step 9: Update created_by field for audit trail
-        start_time: time.time = time.time()
         self.update_core_generic_created_by(instance=self.allocation_file_instance)
-        print(
-            f"update_core_generic_created_by execution time: {time.time() - start_time:.2f} seconds"
-        )
 
     # def create(self):
     #     """
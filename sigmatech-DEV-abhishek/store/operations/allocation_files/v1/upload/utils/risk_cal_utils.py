@@ -1,10 +1,30 @@
+import math
 from datetime import date
 from decimal import Decimal
-from typing import Dict, Any
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from django.db.models.query import QuerySet
+from pandas.core.frame import DataFrame
 
 from store.operations.case_management.enums import RiskTypesEnum
 from store.operations.case_management.models import CaseManagementCaseModel
 
+# Case fields read by the risk calculation
+RISK_CALCULATION_FIELDS: Tuple[str, ...] = (
+    "pos_value",
+    "total_loan_amount",
+    "last_payment_date",
+    "number_of_emi_paid",
+    "tenure",
+    "penalty_amount",
+    "late_payment_fee",
+    "late_payment_charges",
+    "minimum_due_amount",
+)
+
 
 def calculate_outstanding_ratio_points(case_instance: CaseManagementCaseModel) -> int:
     """
@@ -165,3 +185,340 @@ def calculate_risk_enum_for_case_instance(
         return {"risk": RiskTypesEnum.MEDIUM.value, "risk_points": total_points}
     else:
         return {"risk": RiskTypesEnum.LOW.value, "risk_points": total_points}
+
+
+# ? Batch risk engine
+# Amounts are compared as integer cents and ratios as cross-multiplications, so
+# thresholds give exactly the same result as the Decimal arithmetic above. Rows
+# holding values that cannot be represented that way (more than 2 decimal places,
+# out of range) are scored with the scalar functions.
+
+RISK_AMOUNT_FIELDS: Tuple[str, ...] = (
+    "pos_value",
+    "total_loan_amount",
+    "penalty_amount",
+    "late_payment_fee",
+    "late_payment_charges",
+    "minimum_due_amount",
+)
+RISK_COUNT_FIELDS: Tuple[str, ...] = ("number_of_emi_paid", "tenure")
+
+# Bounds keeping 100 * value within int64 (DecimalField(max_digits=15) is below both)
+_MAX_EXACT_CENTS: int = 10**15
+_MAX_EXACT_COUNT: int = 2**60
+
+
+def _is_null(value: Any) -> bool:
+    return (
+        value is None
+        or value is pd.NaT
+        or (isinstance(value, float) and math.isnan(value))
+    )
+
+
+def _amount_to_cents(value: Any) -> int:
+    cents: Decimal = Decimal(value).scaleb(2)
+    if cents != cents.to_integral_value() or abs(cents) >= _MAX_EXACT_CENTS:
+        raise ValueError(f"{value} is not an exact amount in cents")
+    return int(cents)
+
+
+def _count_to_int(value: Any) -> int:
+    # Integer columns with missing values come out of pandas as floats
+    if isinstance(value, float) and value.is_integer():
+        value: int = int(value)
+    count: int = int(value)
+    if count != value or abs(count) >= _MAX_EXACT_COUNT:
+        raise ValueError(f"{value} is not an exact count")
+    return count
+
+
+def _date_to_ordinal(value: Any) -> int:
+    return value.toordinal()
+
+
+def _convert_column(
+    values: Sequence[Any], convert: Callable[[Any], int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts one column to int64.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Converted values (0 where null or invalid),
+            null mask and invalid mask.
+    """
+    row_count: int = len(values)
+    converted: np.ndarray = np.zeros(row_count, dtype=np.int64)
+    is_null: np.ndarray = np.zeros(row_count, dtype=bool)
+    is_invalid: np.ndarray = np.zeros(row_count, dtype=bool)
+    for idx, value in enumerate(values):
+        if _is_null(value):
+            is_null[idx] = True
+            continue
+        try:
+            converted[idx] = convert(value)
+        except (ArithmeticError, TypeError, ValueError, AttributeError):
+            is_invalid[idx] = True
+    return converted, is_null, is_invalid
+
+
+def _convert_amount_column(
+    values: Sequence[Any],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts one amount column to int64 cents as a whole: `pd.to_numeric`, then
+    the rounded `100 * amount` kept where it is exact (converting back gives the
+    same float, which holds for the up to 15 significant digits of the amount
+    fields). Only the cells failing that go through `_amount_to_cents`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Converted values (0 where null or invalid),
+            null mask and invalid mask.
+    """
+    series: pd.Series = pd.Series(values, dtype=object)
+    is_null: np.ndarray = series.isna().to_numpy(dtype=bool)
+    amounts: np.ndarray = pd.to_numeric(series, errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+    with np.errstate(invalid="ignore"):
+        cents: np.ndarray = np.round(amounts * 100)
+        is_exact: np.ndarray = (
+            np.isfinite(cents)
+            & (np.abs(cents) < _MAX_EXACT_CENTS)
+            & (cents / 100 == amounts)
+        )
+    converted: np.ndarray = np.where(is_exact, cents, 0).astype(np.int64)
+
+    # ? per-cell fallback, for the cells the whole-column conversion rejected
+    is_invalid: np.ndarray = ~is_null & ~is_exact
+    for idx in np.flatnonzero(is_invalid):
+        try:
+            converted[idx] = _amount_to_cents(series.iat[idx])
+            is_invalid[idx] = False
+        except (ArithmeticError, TypeError, ValueError, AttributeError):
+            pass
+    return converted, is_null, is_invalid
+
+
+def calculate_risk_for_columns(
+    columns: Dict[str, Sequence[Any]], today: Optional[date] = None
+) -> Tuple[List[Optional[str]], List[int]]:
+    """
+    Scores a batch of cases given column-wise values of `RISK_CALCULATION_FIELDS`.
+
+    Identical to `calculate_risk_enum_for_case_instance` applied row by row.
+
+    Args:
+        columns (Dict[str, Sequence[Any]]): Values of every `RISK_CALCULATION_FIELDS` field, same length.
+        today (Optional[date]): Reference date for payment recency, defaults to today.
+
+    Returns:
+        Tuple[List[Optional[str]], List[int]]: `risk` and `risk_points` of every row.
+    """
+    today: date = today or date.today()
+    row_count: int = len(columns[RISK_CALCULATION_FIELDS[0]])
+
+    values: Dict[str, np.ndarray] = {}
+    is_null: Dict[str, np.ndarray] = {}
+    needs_scalar: np.ndarray = np.zeros(row_count, dtype=bool)
+    for field in RISK_CALCULATION_FIELDS:
+        if field in RISK_AMOUNT_FIELDS:
+            values[field], is_null[field], is_invalid = _convert_amount_column(
+                values=columns[field]
+            )
+        elif field in RISK_COUNT_FIELDS:
+            values[field], is_null[field], is_invalid = _convert_column(
+                values=columns[field], convert=_count_to_int
+            )
+        else:
+            values[field], is_null[field], is_invalid = _convert_column(
+                values=columns[field], convert=_date_to_ordinal
+            )
+        needs_scalar |= is_invalid
+
+    pos: np.ndarray = values["pos_value"]
+    total: np.ndarray = values["total_loan_amount"]
+
+    # Outstanding ratio, pos / total >= pct  <=>  100 * pos >= pct * total (total > 0)
+    has_pos_ratio: np.ndarray = (
+        ~is_null["total_loan_amount"] & (total > 0) & ~is_null["pos_value"]
+    )
+    pos_ratio_ge: Dict[int, np.ndarray] = {
+        pct: has_pos_ratio & (100 * pos >= pct * total) for pct in (30, 50, 70, 90)
+    }
+    outstanding_points: np.ndarray = np.select(
+        [pos_ratio_ge[90], pos_ratio_ge[70], pos_ratio_ge[50], pos_ratio_ge[30]],
+        [8, 6, 4, 2],
+        0,
+    )
+
+    # Payment recency, 999 days without a last payment date
+    recency_days: np.ndarray = np.where(
+        is_null["last_payment_date"],
+        999,
+        today.toordinal() - values["last_payment_date"],
+    )
+    recency_points: np.ndarray = np.select(
+        [
+            recency_days == 0,
+            (recency_days >= 1) & (recency_days <= 15),
+            (recency_days >= 16) & (recency_days <= 30),
+            (recency_days >= 31) & (recency_days <= 60),
+            recency_days > 60,
+        ],
+        [0, 1, 3, 4, 6],
+        0,
+    )
+
+    # Early-tenure stress, paid ratio is 0 without tenure/paid EMIs
+    paid: np.ndarray = values["number_of_emi_paid"]
+    tenure: np.ndarray = values["tenure"]
+    has_paid_ratio: np.ndarray = (
+        ~is_null["tenure"] & (tenure > 0) & ~is_null["number_of_emi_paid"]
+    )
+    paid_lt_25: np.ndarray = ~has_paid_ratio | (4 * paid < tenure)
+    paid_lt_50: np.ndarray = ~has_paid_ratio | (2 * paid < tenure)
+    tenure_points: np.ndarray = np.select(
+        [
+            paid_lt_25 & pos_ratio_ge[70],
+            paid_lt_50 & pos_ratio_ge[70],
+            paid_lt_25,
+            paid_lt_50,
+        ],
+        [4, 3, 2, 1],
+        0,
+    )
+
+    # Penalty / minimum due pressure
+    penalty_sum: np.ndarray = (
+        values["penalty_amount"]
+        + values["late_payment_fee"]
+        + values["late_payment_charges"]
+    )
+    penalty_points: np.ndarray = np.where(
+        (penalty_sum > 0)
+        | (~is_null["minimum_due_amount"] & (values["minimum_due_amount"] > 0)),
+        2,
+        0,
+    )
+
+    all_fields_null: np.ndarray = np.logical_and.reduce(
+        [is_null[field] for field in RISK_CALCULATION_FIELDS]
+    )
+    risk_points: np.ndarray = np.where(
+        all_fields_null,
+        0,
+        outstanding_points + recency_points + tenure_points + penalty_points,
+    )
+    risk: np.ndarray = np.full(row_count, RiskTypesEnum.LOW.value, dtype=object)
+    risk[risk_points >= 4] = RiskTypesEnum.MEDIUM.value
+    risk[risk_points >= 8] = RiskTypesEnum.HIGH.value
+    risk[risk_points >= 12] = RiskTypesEnum.CRITICAL.value
+    risk[all_fields_null] = None
+
+    risk_list: List[Optional[str]] = risk.tolist()
+    risk_points_list: List[int] = risk_points.tolist()
+    for idx in np.flatnonzero(needs_scalar):
+        case_values: SimpleNamespace = SimpleNamespace(
+            **{
+                field: None if _is_null(columns[field][idx]) else columns[field][idx]
+                for field in RISK_CALCULATION_FIELDS
+            }
+        )
+        risk_details: Dict[str, Any] = calculate_risk_enum_for_case_instance(
+            case_values
+        )
+        risk_list[idx] = risk_details["risk"]
+        risk_points_list[idx] = risk_details["risk_points"]
+
+    return risk_list, risk_points_list
+
+
+def calculate_risk_for_case_instances(
+    case_instances: Iterable[CaseManagementCaseModel], today: Optional[date] = None
+) -> List[Dict[str, Any]]:
+    """
+    Batch version of `calculate_risk_enum_for_case_instance`.
+
+    Args:
+        case_instances (Iterable[CaseManagementCaseModel]): Cases to score.
+        today (Optional[date]): Reference date for payment recency, defaults to today.
+
+    Returns:
+        List[Dict[str, Any]]: `{"risk", "risk_points"}` of every case, in order.
+    """
+    case_instances: List[CaseManagementCaseModel] = list(case_instances)
+    if not case_instances:
+        return []
+
+    risk: List[Optional[str]]
+    risk_points: List[int]
+    risk, risk_points = calculate_risk_for_columns(
+        columns={
+            field: [getattr(case_instance, field) for case_instance in case_instances]
+            for field in RISK_CALCULATION_FIELDS
+        },
+        today=today,
+    )
+    return [
+        {"risk": case_risk, "risk_points": case_risk_points}
+        for case_risk, case_risk_points in zip(risk, risk_points)
+    ]
+
+
+def calculate_risk_for_dataframe(
+    df: DataFrame, today: Optional[date] = None
+) -> DataFrame:
+    """
+    Scores every row of a DataFrame whose columns are case field names.
+
+    Args:
+        df (DataFrame): Case values, columns named after `RISK_CALCULATION_FIELDS`.
+        today (Optional[date]): Reference date for payment recency, defaults to today.
+
+    Returns:
+        DataFrame: `risk` and `risk_points` columns, with the index of `df`.
+    """
+    risk: List[Optional[str]]
+    risk_points: List[int]
+    risk, risk_points = calculate_risk_for_columns(
+        columns={
+            field: df[field].tolist() if field in df.columns else [None] * len(df)
+            for field in RISK_CALCULATION_FIELDS
+        },
+        today=today,
+    )
+    return pd.DataFrame(
+        {"risk": pd.Series(risk, dtype=object), "risk_points": risk_points}
+    ).set_index(df.index)
+
+
+def calculate_risk_for_queryset(
+    queryset: QuerySet[CaseManagementCaseModel], today: Optional[date] = None
+) -> DataFrame:
+    """
+    Scores the cases of a queryset, reading only the risk fields.
+
+    Args:
+        queryset (QuerySet[CaseManagementCaseModel]): Cases to score.
+        today (Optional[date]): Reference date for payment recency, defaults to today.
+
+    Returns:
+        DataFrame: `risk` and `risk_points` columns, indexed by case primary key.
+    """
+    rows: List[Tuple[Any, ...]] = list(
+        queryset.values_list("pk", *RISK_CALCULATION_FIELDS)
+    )
+    row_values: List[Tuple[Any, ...]] = list(zip(*rows)) or [
+        () for _ in range(len(RISK_CALCULATION_FIELDS) + 1)
+    ]
+
+    risk: List[Optional[str]]
+    risk_points: List[int]
+    risk, risk_points = calculate_risk_for_columns(
+        columns=dict(zip(RISK_CALCULATION_FIELDS, row_values[1:])), today=today
+    )
+    return pd.DataFrame(
+        {"risk": pd.Series(risk, dtype=object), "risk_points": risk_points},
+        index=pd.Index(row_values[0], name="pk"),
+    )
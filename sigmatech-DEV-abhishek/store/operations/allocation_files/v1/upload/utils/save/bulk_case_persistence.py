@@ -0,0 +1,181 @@
+import logging
+from typing import Any, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Field
+from django.db.models.options import Options
+
+from core.settings import logger
+from store.operations.allocation_files.models import AllocationFileModel
+from store.operations.case_management.enums import CaseManagementFieldStatusEnumChoices
+from store.operations.case_management.models import CaseManagementCaseModel
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+
+def _iter_batches(values: List[Any], batch_size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(values), batch_size):
+        yield values[start : start + batch_size]
+
+
+def build_allocation_case_instances(
+    allocation_file_instance: AllocationFileModel, loan_account_numbers: List[str]
+) -> List[CaseManagementCaseModel]:
+    """
+    Builds unsaved case instances for the given loan account numbers. Every case
+    starts with ERROR field mapping status until its row is validated.
+
+    Args:
+        allocation_file_instance (AllocationFileModel): Allocation file the cases belong to.
+        loan_account_numbers (List[str]): Loan account numbers of the cases.
+
+    Returns:
+        List[CaseManagementCaseModel]: Unsaved case instances.
+    """
+    return [
+        CaseManagementCaseModel(
+            allocation_file=allocation_file_instance,
+            loan_account_number=loan_account_number,
+            field_mapping_status=CaseManagementFieldStatusEnumChoices.ERROR.value,
+        )
+        for loan_account_number in loan_account_numbers
+    ]
+
+
+def bulk_create_allocation_cases(
+    allocation_file_instance: AllocationFileModel,
+    loan_account_numbers: List[str],
+    batch_size: int,
+) -> int:
+    """
+    Creates the allocation cases with one `bulk_create` per batch. Rows whose
+    (loan_account_number, allocation_file) pair already exists are skipped.
+
+    Args:
+        allocation_file_instance (AllocationFileModel): Allocation file the cases belong to.
+        loan_account_numbers (List[str]): Loan account numbers of the cases.
+        batch_size (int): Number of rows inserted per statement.
+
+    Returns:
+        int: Number of case rows sent to the database.
+    """
+    created_count: int = 0
+    for batch in _iter_batches(values=loan_account_numbers, batch_size=batch_size):
+        CaseManagementCaseModel.objects.bulk_create(
+            build_allocation_case_instances(
+                allocation_file_instance=allocation_file_instance,
+                loan_account_numbers=batch,
+            ),
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        created_count += len(batch)
+    return created_count
+
+
+def copy_create_allocation_cases(
+    allocation_file_instance: AllocationFileModel,
+    loan_account_numbers: List[str],
+    batch_size: int,
+) -> int:
+    """
+    Postgres fast path: streams the cases into a temporary staging table with
+    COPY and merges them into CASE_MANAGEMENT_TABLE with a single
+    INSERT ... SELECT, skipping (loan_account_number, allocation_file) pairs that
+    already exist.
+
+    Field values (including model defaults such as ids and audit timestamps) are
+    produced by Django, so rows are identical to those created through the ORM.
+
+    Args:
+        allocation_file_instance (AllocationFileModel): Allocation file the cases belong to.
+        loan_account_numbers (List[str]): Loan account numbers of the cases.
+        batch_size (int): Number of instances built in memory at a time.
+
+    Returns:
+        int: Number of case rows inserted.
+    """
+    meta: Options = CaseManagementCaseModel._meta
+    fields: List[Field] = list(meta.concrete_fields)
+    column_sql: str = ", ".join(
+        connection.ops.quote_name(field.column) for field in fields
+    )
+    table_name: str = connection.ops.quote_name(meta.db_table)
+    staging_table_name: str = connection.ops.quote_name(f"{meta.db_table}_STAGING")
+    conflict_column_sql: str = ", ".join(
+        connection.ops.quote_name(meta.get_field(field_name).column)
+        for field_name in ("loan_account_number", "allocation_file")
+    )
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {staging_table_name} "
+            f"(LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        with cursor.copy(
+            f"COPY {staging_table_name} ({column_sql}) FROM STDIN"
+        ) as copy:
+            for batch in _iter_batches(
+                values=loan_account_numbers, batch_size=batch_size
+            ):
+                for instance in build_allocation_case_instances(
+                    allocation_file_instance=allocation_file_instance,
+                    loan_account_numbers=batch,
+                ):
+                    copy.write_row(
+                        [
+                            field.get_db_prep_save(
+                                field.pre_save(instance, add=True), connection
+                            )
+                            for field in fields
+                        ]
+                    )
+
+        cursor.execute(
+            f"INSERT INTO {table_name} ({column_sql}) "
+            f"SELECT {column_sql} FROM {staging_table_name} "
+            f"ON CONFLICT ({conflict_column_sql}) DO NOTHING"
+        )
+        return cursor.rowcount
+
+
+def persist_allocation_cases(
+    allocation_file_instance: AllocationFileModel,
+    loan_account_numbers: List[str],
+    batch_size: Optional[int] = None,
+) -> int:
+    """
+    Persists the initial case rows of an allocation file.
+
+    Uses COPY + staging table merge on Postgres when `ALLOCATION_CASE_COPY_ENABLED`
+    is set, and batched `bulk_create` on every other backend (e.g. sqlite).
+
+    Args:
+        allocation_file_instance (AllocationFileModel): Allocation file the cases belong to.
+        loan_account_numbers (List[str]): Loan account numbers of the cases.
+        batch_size (Optional[int]): Rows per batch, defaults to `ALLOCATION_CASE_BULK_BATCH_SIZE`.
+
+    Returns:
+        int: Number of case rows persisted.
+    """
+    batch_size: int = batch_size or settings.ALLOCATION_CASE_BULK_BATCH_SIZE
+
+    if connection.vendor == "postgresql" and settings.ALLOCATION_CASE_COPY_ENABLED:
+        logger.info(
+            f"Copying {len(loan_account_numbers)} cases for allocation file {allocation_file_instance.pk}"
+        )
+        return copy_create_allocation_cases(
+            allocation_file_instance=allocation_file_instance,
+            loan_account_numbers=loan_account_numbers,
+            batch_size=batch_size,
+        )
+
+    logger.info(
+        f"Bulk creating {len(loan_account_numbers)} cases for allocation file {allocation_file_instance.pk} in batches of {batch_size}"
+    )
+    return bulk_create_allocation_cases(
+        allocation_file_instance=allocation_file_instance,
+        loan_account_numbers=loan_account_numbers,
+        batch_size=batch_size,
+    )
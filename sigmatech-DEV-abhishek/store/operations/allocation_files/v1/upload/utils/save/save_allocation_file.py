@@ -1,12 +1,13 @@
 from store.operations.allocation_files.models import AllocationFileModel
 from django.db import transaction
-from typing import Any, List
+from typing import Optional
 
 from store.operations.allocation_files.v1.upload.utils.common.save_case_details import (
     UpdateAllocationFileCaseDetails,
 )
-from store.operations.case_management.enums import CaseManagementFieldStatusEnumChoices
-from store.operations.case_management.models import CaseManagementCaseModel
+from store.operations.allocation_files.v1.upload.utils.save.bulk_case_persistence import (
+    persist_allocation_cases,
+)
 
 
 class SaveAllocationFileCaseData(UpdateAllocationFileCaseDetails):
@@ -30,7 +31,7 @@ class SaveAllocationFileCaseData(UpdateAllocationFileCaseDetails):
 
         Workflow:
             1. Create an AllocationFileModel instance.
-            2. Iterate through loan account numbers and create CaseManagementCaseModel instances.
+            2. Create CaseManagementCaseModel instances for all loan account numbers in batches.
             3. Ensure atomicity using `transaction.atomic()`.
 
         Returns:
@@ -47,64 +48,41 @@ class SaveAllocationFileCaseData(UpdateAllocationFileCaseDetails):
                 file_url=self.file_url,
                 initial_file_url=self.file_url,
                 product_assignment=self.product_assignment_instance,
-                no_of_total_records=len(self.file_data),
+                no_of_total_records=self.file_artifact.records_count,
             )
             self.logger.info(
                 f"Allocation file created: id={self.allocation_file_instance.id}"
             )
 
-            # Step 2: Prepare case management instances
+            # Step 2: Persist case management instances in batches
+            # (COPY + staging merge on Postgres, bulk_create elsewhere)
             self.logger.info(
                 f"Preparing to create {len(self.loan_account_numbers_list)} case management instances"
             )
-            case_management_instance_list: List[CaseManagementCaseModel] = []
-            for loan_account_number in self.loan_account_numbers_list:
-                self.logger.info(
-                    f"Creating case instance for loan_account_number: {loan_account_number}"
-                )
-                # Each case is initially created with ERROR status
-                instance: CaseManagementCaseModel = (
-                    CaseManagementCaseModel.objects.create(
-                        allocation_file=self.allocation_file_instance,
-                        loan_account_number=loan_account_number,
-                        field_mapping_status=CaseManagementFieldStatusEnumChoices.ERROR.value,
-                    )
-                )
-
-                # Note: instance is created immediately (not batched here),
-                # but still logged for traceability
-                self.logger.debug(
-                    f"Added case instance for {loan_account_number} -> {instance.pk} to batch"
-                )
-
-            # Step 3: Bulk operations could be added (currently logged only)
-            self.logger.info("Performing bulk create of case management instances")
-            self.logger.info(
-                f"Successfully created {len(case_management_instance_list)} case instances"
+            created_count: int = persist_allocation_cases(
+                allocation_file_instance=self.allocation_file_instance,
+                loan_account_numbers=self.loan_account_numbers_list,
             )
+            self.logger.info(f"Successfully created {created_count} case instances")
 
         self.logger.info("Completed save_allocation_file_and_case_details")
         return self.allocation_file_instance
 
-    def update_allocation_file_cases_details(
-        self,
-    ) -> tuple[List[dict[str, Any]], List[dict[str, Any]]]:
+    def update_allocation_file_cases_details(self) -> Optional[str]:
         """
         Updates case management details by invoking parent implementation.
 
         This processes uploaded file data and:
             - Validates each case record
             - Updates case status accordingly
-            - Separates valid and error records
+            - Writes the error records to the error Excel file
 
         Returns:
-            tuple[List[dict[str, Any]], List[dict[str, Any]]]:
-                - First list contains valid case data
-                - Second list contains error case data
+            Optional[str]: Path of the error Excel file, None when every record is valid.
         """
         self.logger.info("Starting update_allocation_file_cases_details")
 
         # Call the parent method to handle validation and case update logic
-        error_data = super().update_allocation_file_cases_details()
+        error_file_path: Optional[str] = super().update_allocation_file_cases_details()
 
-        return error_data
+        return error_file_path
@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Optional
 
 from store.operations.allocation_files.v1.upload.utils.common.save_case_details import (
     UpdateAllocationFileCaseDetails,
@@ -15,28 +15,24 @@ class SaveReUploadAllocationFileCaseData(UpdateAllocationFileCaseDetails):
     while adding logging and potential hooks for additional handling.
     """
 
-    def update_allocation_file_cases_details(
-        self,
-    ) -> tuple[List[dict[str, Any]], List[dict[str, Any]]]:
+    def update_allocation_file_cases_details(self) -> Optional[str]:
         """
         Updates case management details for a re-uploaded allocation file.
 
         This method:
           - Logs the update operation.
           - Delegates the main update logic to the parent class implementation.
-          - Ensures validated data and error data are properly returned.
+          - Returns the error Excel file written by it.
 
         Returns:
-            tuple[List[dict[str, Any]], List[dict[str, Any]]]:
-                A tuple containing:
-                  - Validated data (records successfully updated).
-                  - Error data (records with validation or mapping errors).
+            Optional[str]: Path of the error Excel file (records with validation or
+                mapping errors), None when every record is valid.
         """
         self.logger.info("Starting update_allocation_file_cases_details")
 
         # Call parent class's update method, which performs
         # validation and persistence of allocation file case data
-        error_data = super().update_allocation_file_cases_details()
+        error_file_path: Optional[str] = super().update_allocation_file_cases_details()
 
         # Return the result for further handling (e.g., error reporting, persistence)
-        return error_data
+        return error_file_path
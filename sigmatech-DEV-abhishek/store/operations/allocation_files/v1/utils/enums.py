@@ -5,3 +5,4 @@ class AllocationStatusEnum(EnumChoices):
     INPROCESS = "In Progress"
     EXPIRED = "Expired"
     COMPLETED = "Completed"
+    FAILED = "Failed"
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from store.operations.case_management.models import CaseManagementCaseModel
+from store.operations.case_management.v1.utils.case_geography import (
+    refresh_case_geography,
+)
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Fill the city, zone and region keys of cases from their residential "
+        "pincode, once after adding the keys or to repair them"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Cases updated per statement",
+        )
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only cases with a pincode and no city key",
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        queryset = CaseManagementCaseModel.objects.all()
+        if options["missing_only"]:
+            queryset = queryset.filter(
+                residential_pin_code__isnull=False, residential_city__isnull=True
+            )
+
+        updated_count: int = refresh_case_geography(
+            queryset=queryset, batch_size=options["batch_size"]
+        )
+        self.stdout.write(f"Filled the geography keys of {updated_count} cases")
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from store.operations.case_management.v1.utils.case_search import (
+    ensure_case_search_trigram_index,
+    rebuild_case_search_index,
+)
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Create the case search trigram index (Postgres) and recompute the search "
+        "text and grams of every case, once after deployment or to repair them"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Cases indexed per batch",
+        )
+        parser.add_argument(
+            "--index-only",
+            action="store_true",
+            help="Only create the trigram index",
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        if ensure_case_search_trigram_index():
+            self.stdout.write("Case search trigram index is ready")
+        if options["index_only"]:
+            return
+
+        indexed_count: int = rebuild_case_search_index(batch_size=options["batch_size"])
+        self.stdout.write(f"Indexed {indexed_count} cases for search")
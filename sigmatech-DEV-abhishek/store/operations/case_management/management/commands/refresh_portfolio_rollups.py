@@ -0,0 +1,37 @@
+from typing import Any, List
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from store.operations.allocation_files.models import AllocationFileModel
+from store.operations.case_management.v1.utils.portfolio_rollups import (
+    refresh_portfolio_rollups,
+)
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Rebuild the case portfolio rollups of every allocation file, once after "
+        "deployment or to repair them"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--allocation-file",
+            action="append",
+            default=[],
+            help="Allocation file id to rebuild, all files by default (repeatable)",
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        allocation_file_ids: List[Any] = options["allocation_file"] or list(
+            AllocationFileModel.objects.values_list("pk", flat=True)
+        )
+
+        rows_count: int = 0
+        for allocation_file_id in allocation_file_ids:
+            rows_count += refresh_portfolio_rollups(
+                allocation_file_ids=[allocation_file_id]
+            )
+        self.stdout.write(
+            f"Rebuilt {rows_count} rollup rows of {len(allocation_file_ids)} allocation files"
+        )
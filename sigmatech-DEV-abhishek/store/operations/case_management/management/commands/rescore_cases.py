@@ -0,0 +1,49 @@
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from store.operations.case_management.v1.utils.rescoring import rescore_cases
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Nightly recomputation of DPD, bucket and risk of every active case, "
+        "writing only the changed cases"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Cases per batch (CASE_RESCORING_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--date",
+            type=str,
+            default=None,
+            help="Reference date as YYYY-MM-DD, defaults to today",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Compute the changes without writing them",
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        today: Optional[date] = (
+            datetime.strptime(options["date"], "%Y-%m-%d").date()
+            if options["date"]
+            else None
+        )
+        result: Dict[str, Any] = rescore_cases(
+            batch_size=options["batch_size"],
+            today=today,
+            dry_run=options["dry_run"],
+        )
+        self.stdout.write(
+            f"Rescored {result['scanned_cases']} cases, {result['updated_cases']} changed"
+            f"{' (dry run)' if options['dry_run'] else ''} in {result['seconds']} seconds "
+            f"({result['cases_per_second']} cases/sec)"
+        )
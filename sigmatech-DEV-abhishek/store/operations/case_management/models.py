@@ -15,10 +15,13 @@ from store.operations.case_management.enums import (
 from store.configurations.loan_config.models import (
     LoanConfigurationsBucketModel,
     LoanConfigurationsMonthlyCycleModel,
+    LoanConfigurationsProductAssignmentModel,
 )
 from store.configurations.region_config.models import (
     RegionConfigurationCityModel,
     RegionConfigurationPincodeModel,
+    RegionConfigurationRegionModel,
+    RegionConfigurationZoneModel,
 )
 
 
@@ -494,6 +497,12 @@ class CaseManagementCaseModel(CoreGenericModel):
         null=True,
         db_column="CURRENT_DPD",
     )
+    # ? date `current_dpd` was last set (upload or nightly rescoring), used to roll it forward
+    dpd_as_of_date = models.DateField(
+        blank=True,
+        null=True,
+        db_column="DPD_AS_OF_DATE",
+    )
 
     allocation_type = models.CharField(
         max_length=50,
@@ -593,6 +602,35 @@ class CaseManagementCaseModel(CoreGenericModel):
         null=True,
         db_column="RESIDENTIAL_PIN_CODE",
     )
+    # ? city, zone and region of `residential_pin_code`, kept in sync on save, by the
+    # ? allocation upload and on region config changes (`case_geography` utils)
+    residential_city = models.ForeignKey(
+        RegionConfigurationCityModel,
+        on_delete=models.SET_NULL,
+        related_name="CaseManagementCaseModel_residential_city",
+        blank=True,
+        null=True,
+        editable=False,
+        db_column="RESIDENTIAL_CITY_ID",
+    )
+    residential_zone = models.ForeignKey(
+        RegionConfigurationZoneModel,
+        on_delete=models.SET_NULL,
+        related_name="CaseManagementCaseModel_residential_zone",
+        blank=True,
+        null=True,
+        editable=False,
+        db_column="RESIDENTIAL_ZONE_ID",
+    )
+    residential_region = models.ForeignKey(
+        RegionConfigurationRegionModel,
+        on_delete=models.SET_NULL,
+        related_name="CaseManagementCaseModel_residential_region",
+        blank=True,
+        null=True,
+        editable=False,
+        db_column="RESIDENTIAL_REGION_ID",
+    )
     residential_customer_state = models.CharField(
         max_length=100,
         blank=True,
@@ -670,9 +708,116 @@ class CaseManagementCaseModel(CoreGenericModel):
         db_column="CUSTOMER_OFFICE_COUNTRY",
     )
 
+    # ? normalized customer name, LAN and phone numbers, maintained by `case_search` utils
+    search_text = models.TextField(
+        blank=True,
+        null=True,
+        editable=False,
+        db_column="SEARCH_TEXT",
+    )
+
+    # ? residential pincode the geography keys were computed for
+    _geography_pin_code_id = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._geography_pin_code_id = instance.__dict__.get(
+            "residential_pin_code_id"
+        )
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if (
+            "residential_pin_code_id" in self.__dict__
+            and (update_fields is None or "residential_pin_code" in update_fields)
+            and (
+                self._state.adding
+                or self.residential_pin_code_id != self._geography_pin_code_id
+            )
+        ):
+            # ? keep the geography keys in sync with the residential pincode
+            geography = (
+                RegionConfigurationPincodeModel.objects.filter(
+                    pk=self.residential_pin_code_id
+                )
+                .values_list("city", "city__zone", "city__zone__region")
+                .first()
+                if self.residential_pin_code_id
+                else None
+            ) or (None, None, None)
+            (
+                self.residential_city_id,
+                self.residential_zone_id,
+                self.residential_region_id,
+            ) = geography
+            self._geography_pin_code_id = self.residential_pin_code_id
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "residential_city",
+                    "residential_zone",
+                    "residential_region",
+                }
+        return super().save(*args, **kwargs)
+
     class Meta:
         db_table = "CASE_MANAGEMENT_TABLE"
         unique_together = ("loan_account_number", "allocation_file")
+        # ? composite indexes of the `CaseAllocationFilter` combinations
+        indexes = [
+            models.Index(
+                fields=["-core_generic_created_at", "-id"], name="CASE_CREATED_AT_IDX"
+            ),
+            models.Index(
+                fields=["field_mapping_status", "risk"], name="CASE_STATUS_RISK_IDX"
+            ),
+            models.Index(
+                fields=["field_mapping_status", "current_dpd"],
+                name="CASE_STATUS_DPD_IDX",
+            ),
+            models.Index(
+                fields=["field_mapping_status", "due_date"],
+                name="CASE_STATUS_DUE_DATE_IDX",
+            ),
+            models.Index(
+                fields=["field_mapping_status", "minimum_due_amount"],
+                name="CASE_STATUS_MAD_IDX",
+            ),
+            models.Index(
+                fields=["allocation_file", "field_mapping_status"],
+                name="CASE_ALLOC_FILE_STATUS_IDX",
+            ),
+            models.Index(
+                fields=["bucket", "field_mapping_status"],
+                name="CASE_BUCKET_STATUS_IDX",
+            ),
+            models.Index(
+                fields=["residential_region", "residential_zone", "residential_city"],
+                name="CASE_GEOGRAPHY_IDX",
+            ),
+        ]
+
+
+class CaseManagementCaseSearchGramModel(CoreGenericModel):
+    """
+    N-gram index of `CaseManagementCaseModel.search_text`, used for case search
+    on databases without trigram indexes (sqlite).
+    """
+
+    id = models.BigAutoField(primary_key=True, db_column="CASE_SEARCH_GRAM_ID")
+    case = models.ForeignKey(
+        CaseManagementCaseModel,
+        on_delete=models.CASCADE,
+        related_name="CaseManagementCaseSearchGramModel_case",
+        db_column="CASE_ID",
+    )
+    gram = models.CharField(max_length=3, db_column="GRAM")
+
+    class Meta:
+        db_table = "CASE_MANAGEMENT_CASE_SEARCH_GRAM_TABLE"
+        unique_together = ("gram", "case")
 
 
 class CaseDispositionModel(CoreGenericModel):
@@ -837,3 +982,91 @@ class CaseManagementCaseAddressModel(CoreGenericModel):
 
     class Meta:
         db_table = "CASE_MANAGEMENT_CASE_ADDRESS_TABLE"
+
+
+class CasePortfolioRollupModel(CoreGenericModel):
+    """
+    Case count and amounts of an allocation file per product assignment, bucket,
+    risk, field mapping status and residential city/zone/region. Rebuilt per
+    allocation file by `portfolio_rollups` utils whenever its cases change, so
+    dashboards and lists sum these rows instead of aggregating the cases.
+    """
+
+    id = models.UUIDField(
+        unique=True,
+        primary_key=True,
+        default=uuid.uuid1,
+        db_column="CASE_PORTFOLIO_ROLLUP_ID",
+        editable=False,
+    )
+    allocation_file = models.ForeignKey(
+        AllocationFileModel,
+        on_delete=models.CASCADE,
+        related_name="CasePortfolioRollupModel_allocation_file",
+        db_column="ALLOCATION_FILE_ID",
+    )
+    product_assignment = models.ForeignKey(
+        LoanConfigurationsProductAssignmentModel,
+        on_delete=models.CASCADE,
+        related_name="CasePortfolioRollupModel_product_assignment",
+        blank=True,
+        null=True,
+        db_column="PRODUCT_ASSIGNMENT_ID",
+    )
+    bucket = models.ForeignKey(
+        LoanConfigurationsBucketModel,
+        on_delete=models.SET_NULL,
+        related_name="CasePortfolioRollupModel_bucket",
+        blank=True,
+        null=True,
+        db_column="BUCKET_ID",
+    )
+    risk = models.CharField(
+        max_length=32,
+        choices=RiskTypesEnum.choices(),
+        null=True,
+        blank=True,
+        db_column="RISK_TYPE",
+    )
+    field_mapping_status = models.CharField(
+        max_length=100,
+        choices=CaseManagementFieldStatusEnumChoices.choices(),
+        db_column="FIELD_MAPPING_STATUS",
+    )
+    residential_region = models.ForeignKey(
+        RegionConfigurationRegionModel,
+        on_delete=models.SET_NULL,
+        related_name="CasePortfolioRollupModel_residential_region",
+        blank=True,
+        null=True,
+        db_column="RESIDENTIAL_REGION_ID",
+    )
+    residential_zone = models.ForeignKey(
+        RegionConfigurationZoneModel,
+        on_delete=models.SET_NULL,
+        related_name="CasePortfolioRollupModel_residential_zone",
+        blank=True,
+        null=True,
+        db_column="RESIDENTIAL_ZONE_ID",
+    )
+    residential_city = models.ForeignKey(
+        RegionConfigurationCityModel,
+        on_delete=models.SET_NULL,
+        related_name="CasePortfolioRollupModel_residential_city",
+        blank=True,
+        null=True,
+        db_column="RESIDENTIAL_CITY_ID",
+    )
+    case_count = models.IntegerField(default=0, db_column="CASE_COUNT")
+    total_pos = models.DecimalField(
+        max_digits=20, decimal_places=2, default=0, db_column="TOTAL_POS"
+    )
+    total_outstanding = models.DecimalField(
+        max_digits=20, decimal_places=2, default=0, db_column="TOTAL_OUTSTANDING"
+    )
+    total_collectable_amount = models.DecimalField(
+        max_digits=20, decimal_places=2, default=0, db_column="TOTAL_COLLECTABLE_AMOUNT"
+    )
+
+    class Meta:
+        db_table = "CASE_PORTFOLIO_ROLLUP_TABLE"
@@ -1,4 +1,7 @@
 from core_utils.utils.generics.serializers.mixins import CoreGenericSerializerMixin
+from core_utils.utils.generics.serializers.generic_serializers import (
+    CoreGenericProjectedFieldsSerializerMixin,
+)
 import datetime
 from rest_framework import serializers
 from store.operations.case_management.models import CaseManagementCaseModel
@@ -11,7 +14,9 @@ CoreGenericGetAPIView
 
 
 class CaseAllocationModelSerializer(
-    CoreGenericSerializerMixin, serializers.ModelSerializer
+    CoreGenericProjectedFieldsSerializerMixin,
+    CoreGenericSerializerMixin,
+    serializers.ModelSerializer,
 ):
     allocation_file__product_assignment__process__title = serializers.CharField(
         read_only=True, source="allocation_file.product_assignment.process.title"
@@ -28,6 +33,7 @@ class CaseAllocationModelSerializer(
 
     contact_score = serializers.SerializerMethodField()
     current_dpd = serializers.SerializerMethodField()
+    bucket_name = serializers.SerializerMethodField()
     residential_pin_code__pincode__pincode = serializers.IntegerField(
         source="residential_pin_code.pincode.pincode", read_only=True
     )
@@ -53,6 +59,17 @@ class CaseAllocationModelSerializer(
         "minimum_due_amount",
     ]
 
+    # Case columns read by the fields that are not model fields, for the
+    # column projection of the list
+    manage_column_field_sources = {
+        "current_dpd": ["due_date", "current_dpd"],
+        "bucket_name": ["bucket_name"],
+        "contact_score": [],
+        "channel_recommendation_title": [],
+        "latest_disposition_title": [],
+        "best_disposition_title": [],
+    }
+
     class Meta:
         model = CaseManagementCaseModel
         fields = get_case_management_field_list(
@@ -77,12 +94,30 @@ class CaseAllocationModelSerializer(
         )
 
     def get_current_dpd(self, obj):
+        # Use the DB-side annotation if present (`annotate_case_dpd_and_bucket`)
+        if hasattr(obj, "computed_dpd"):
+            return obj.computed_dpd
         if obj.due_date:
             today = datetime.date.today()
             diff_days = (today - obj.due_date).days
             return diff_days if diff_days > 0 else 0
         return None
 
+    def get_bucket_name(self, obj):
+        # ? not a getattr default, `bucket_name` may be deferred
+        if hasattr(obj, "computed_bucket_name"):
+            return obj.computed_bucket_name
+        return obj.bucket_name
+
     def get_contact_score(self, obj):
         # Use annotated field if present, else default 0
         return getattr(obj, "contact_score", 0)
+
+
+class CasePortfolioRollupSummarySerializer(serializers.Serializer):
+    key = serializers.CharField(allow_null=True)
+    label = serializers.CharField(allow_null=True)
+    case_count = serializers.IntegerField()
+    total_pos = serializers.DecimalField(max_digits=20, decimal_places=2)
+    total_outstanding = serializers.DecimalField(max_digits=20, decimal_places=2)
+    total_collectable_amount = serializers.DecimalField(max_digits=20, decimal_places=2)
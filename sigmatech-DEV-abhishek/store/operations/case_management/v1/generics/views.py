@@ -1,17 +1,38 @@
 from rest_framework import generics, permissions
 from store.operations.case_management.models import (
     CaseManagementCaseModel,
+    CasePortfolioRollupModel,
 )
 from store.operations.case_management.v1.generics.serializers import (
     CaseAllocationModelSerializer,
+    CasePortfolioRollupSummarySerializer,
+)
+from store.operations.case_management.v1.utils.filters import (
+    CaseAllocationFilter,
+    CasePortfolioRollupFilter,
+    CaseSearchFilter,
+)
+from store.operations.case_management.v1.utils.portfolio_rollups import (
+    PORTFOLIO_ROLLUP_GROUP_BY,
+    get_portfolio_rollup_summary,
 )
-from store.operations.case_management.v1.utils.filters import CaseAllocationFilter
 from user_config.user_auth.utils.custom_authentication.custom_authentication import (
     CustomAuthentication,
 )
+from store.operations.case_management.v1.utils.case_annotations import (
+    CASE_ANNOTATED_ORDERING_FIELDS,
+    annotate_case_dpd_and_bucket,
+)
+from store.operations.case_management.v1.utils.case_search import CASE_SEARCH_FIELDS
 from django_filters.rest_framework import DjangoFilterBackend
-from core_utils.utils.generics.views.generic_views import CoreGenericListCreateAPIView
-from rest_framework import filters
+from core_utils.utils.generics.views.generic_views import (
+    CoreGenericGetAPIView,
+    CoreGenericListCreateAPIView,
+)
+from core_utils.utils.generics.views.pagination import (
+    CoreGenericKeysetPagination,
+    PaginationCountModeEnum,
+)
 from django.db.models import Value, IntegerField
 
 # from store.operations.case_management.v1.generics.views import get_descendant_users
@@ -25,15 +46,55 @@ class CaseallocationGenericAPIView(
     authentication_classes = [CustomAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     queryset = CaseManagementCaseModel.objects.all()
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
-    search_fields = ["customer_name", "loan_account_number"]
+    filter_backends = [DjangoFilterBackend, CaseSearchFilter]
+    search_fields = CASE_SEARCH_FIELDS
     filterset_class = CaseAllocationFilter
+    pagination_class = CoreGenericKeysetPagination
+    pagination_count_mode = PaginationCountModeEnum.APPROXIMATE.value
+    is_column_projection_enabled = True
+    query_budget = 6
 
     def get_queryset(self):
-        qs = super().get_queryset()
+        qs = annotate_case_dpd_and_bucket(super().get_queryset())
         return qs.annotate(
             contact_score=Value(0, output_field=IntegerField()),
         )
 
+    def get_ordering_dict(self):
+        # ? DPD and bucket are ordered on their annotations
+        ordering = super().get_ordering_dict()
+        field = ordering.lstrip("-")
+        if field in CASE_ANNOTATED_ORDERING_FIELDS:
+            return ordering.replace(field, CASE_ANNOTATED_ORDERING_FIELDS[field])
+        return ordering
+
     def get_serializer_class(self):
         return {"GET": CaseAllocationModelSerializer}.get(self.request.method)
+
+
+class CasePortfolioRollupAPIView(CoreGenericGetAPIView, generics.GenericAPIView):
+    """
+    Case count, total POS, total outstanding and collectable amount read from the
+    portfolio rollup rows, filtered with `CasePortfolioRollupFilter` and grouped
+    by the `group_by` query parameter (a `PORTFOLIO_ROLLUP_GROUP_BY` key), or
+    as a single total row without it.
+    """
+
+    authentication_classes = [CustomAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    queryset = CasePortfolioRollupModel.objects.all()
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = CasePortfolioRollupFilter
+
+    def get_serializer_class(self):
+        return CasePortfolioRollupSummarySerializer
+
+    def get_queryset(self):
+        group_by = self.request.query_params.get("group_by") or None
+        if group_by and group_by not in PORTFOLIO_ROLLUP_GROUP_BY:
+            raise ValueError(
+                f"Invalid group_by, expected one of {', '.join(PORTFOLIO_ROLLUP_GROUP_BY)}"
+            )
+        return get_portfolio_rollup_summary(
+            queryset=self.filter_queryset(super().get_queryset()), group_by=group_by
+        )
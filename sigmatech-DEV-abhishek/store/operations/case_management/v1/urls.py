@@ -9,7 +9,12 @@ generic_urlpatterns: List = [
         "case-allocation-file-api/",
         generic_views.CaseallocationGenericAPIView.as_view(),
         name="AllocatinFileGenericAPIView",
-    )
+    ),
+    path(
+        "case-portfolio-rollup-api/",
+        generic_views.CasePortfolioRollupAPIView.as_view(),
+        name="CasePortfolioRollupAPIView",
+    ),
 ]
 
 helper_list_urlpatterns: List = [
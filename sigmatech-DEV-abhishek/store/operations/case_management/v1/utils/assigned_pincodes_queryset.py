@@ -1,38 +1,46 @@
+from django.db.models.query import QuerySet
+
 from store.operations.case_management.models import CaseManagementCaseModel
 from user_config.accounts.api.v1.utils.user_reports_hierarichal_list import (
-    get_descendant_users,
+    get_descendant_users_queryset,
 )
+from user_config.accounts.models import UserDetailModel
 from user_config.user_auth.enums import UserRoleEnum
 from user_config.user_auth.models import UserModel
-from django.db.models.query import QuerySet
-from typing import List, Optional
 
 
-def get_all_pincodes_under_fo(user_queryset: QuerySet[UserModel]) -> List[str]:
+def get_visible_pincodes_queryset(user_instance: UserModel) -> QuerySet:
+    """
+    Pincodes assigned to the field officers under the user, as a subquery (the
+    recursive hierarchy CTE is a subquery of it). Nothing is cached: every
+    request reads the current `reports_to`, roles and assigned pincodes, so
+    there is nothing to invalidate when they change.
+
+    Args:
+        user_instance (UserModel): User whose visible pincodes are resolved.
+
+    Returns:
+        QuerySet: Primary keys of the visible pincodes.
+    """
+    field_officer_queryset: QuerySet[UserModel] = get_descendant_users_queryset(
+        user_instance=user_instance
+    ).filter(user_role__role=UserRoleEnum.FIELD_OFFICER.value)
 
-    assigned_pincodes_pk_list: List[str] = []
-    for user_instance in user_queryset:
-        assigned_pincodes_pk_list.extend(
-            user_instance.UserDetailModel_user.assigned_pincode.values_list(
-                "pk", flat=True
-            )
+    return (
+        UserDetailModel.objects.filter(
+            user__in=field_officer_queryset.values("pk"), assigned_pincode__isnull=False
         )
-    return assigned_pincodes_pk_list
+        .order_by()
+        .values("assigned_pincode")
+    )
 
 
 def case_management_filter_queryset(
     queryset: QuerySet[CaseManagementCaseModel], user_instance: UserModel
-):
-    descendant_users: List[UserModel] = get_descendant_users(
-        user_instance=user_instance
+) -> QuerySet[CaseManagementCaseModel]:
+    # Cases in the pincodes of the field officers under the user, in the same query
+    return queryset.filter(
+        residential_pin_code__in=get_visible_pincodes_queryset(
+            user_instance=user_instance
+        )
     )
-
-    assigned_pincode_list: Optional[List[str]] = []
-    for query in descendant_users:
-        if query.user_role.role == UserRoleEnum.FIELD_OFFICER.value:
-            assigned_pincode_list.extend(
-                query.UserDetailModel_user.assigned_pincode.values_list("pk", flat=True)
-            )
-
-    result = queryset.filter(residential_pin_code__pk__in=assigned_pincode_list)
-    return result
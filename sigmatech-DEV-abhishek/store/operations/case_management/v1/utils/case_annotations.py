@@ -0,0 +1,153 @@
+from datetime import date, timedelta
+from typing import List, Optional
+
+from django.db.models import (
+    Case,
+    CharField,
+    DateField,
+    F,
+    Func,
+    IntegerField,
+    Q,
+    UUIDField,
+    Value,
+    When,
+)
+from django.db.models.functions import Greatest
+from django.db.models.query import QuerySet
+
+from store.operations.case_management.models import CaseManagementCaseModel
+from store.operations.case_management.v1.utils.rescoring import BucketRangeResolver
+
+# List ordering on a case field -> annotation computed by `annotate_case_dpd_and_bucket()`
+CASE_ANNOTATED_ORDERING_FIELDS = {
+    "current_dpd": "computed_dpd",
+    "bucket_name": "computed_bucket_name",
+}
+
+
+class DaysSince(Func):
+    """
+    Whole days from a date expression to a reference date, negative when the
+    date is later.
+    """
+
+    output_field = IntegerField()
+
+    def __init__(self, expression, today: date, **extra):
+        super().__init__(Value(today, output_field=DateField()), expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        # ? MySQL DATEDIFF(today, date)
+        return super().as_sql(
+            compiler, connection, function="DATEDIFF", **extra_context
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        # ? date - date is a number of days
+        return super().as_sql(
+            compiler,
+            connection,
+            template="(%(expressions)s)",
+            arg_joiner=" - ",
+            **extra_context,
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template="CAST(julianday(%(expressions)s) AS INTEGER)",
+            arg_joiner=") - julianday(",
+            **extra_context,
+        )
+
+
+def annotate_case_dpd_and_bucket(
+    queryset: QuerySet[CaseManagementCaseModel], today: Optional[date] = None
+) -> QuerySet[CaseManagementCaseModel]:
+    """
+    Annotates the DPD and bucket of each case as of today, in SQL, so lists can
+    filter and order on them:
+
+    - `computed_dpd`: days past `due_date` (0 if not yet due), the stored
+      `current_dpd` (rolled nightly by rescoring) for cases without due date.
+    - `computed_bucket_id`/`computed_bucket_name`: active bucket whose range
+      contains `computed_dpd`, first created wins as in rescoring, the stored
+      bucket when no range matches.
+
+    Bucket ranges are stored as text ("31-60", "90+"), they are parsed once per
+    call by `BucketRangeResolver` into a CASE expression instead of a join.
+
+    Args:
+        queryset (QuerySet[CaseManagementCaseModel]): Cases to annotate.
+        today (Optional[date]): Reference date, defaults to today.
+
+    Returns:
+        QuerySet[CaseManagementCaseModel]: Annotated cases.
+    """
+    today: date = today or date.today()
+    queryset: QuerySet[CaseManagementCaseModel] = queryset.annotate(
+        computed_dpd=Case(
+            When(
+                due_date__isnull=False,
+                then=Greatest(DaysSince("due_date", today=today), Value(0)),
+            ),
+            default=F("current_dpd"),
+            output_field=IntegerField(),
+        )
+    )
+
+    bucket_ids: List[When] = []
+    bucket_names: List[When] = []
+    for lower, upper, bucket in BucketRangeResolver().ranges:
+        in_range: Q = Q(computed_dpd__gte=lower)
+        if upper is not None:
+            in_range &= Q(computed_dpd__lte=upper)
+        bucket_ids.append(When(in_range, then=Value(bucket.pk)))
+        bucket_names.append(When(in_range, then=Value(bucket.title)))
+
+    return queryset.annotate(
+        computed_bucket_id=Case(
+            *bucket_ids, default=F("bucket_id"), output_field=UUIDField()
+        ),
+        computed_bucket_name=Case(
+            *bucket_names, default=F("bucket_name"), output_field=CharField()
+        ),
+    )
+
+
+def get_case_dpd_range_q(
+    min_dpd: Optional[int] = None,
+    max_dpd: Optional[int] = None,
+    today: Optional[date] = None,
+) -> Q:
+    """
+    Condition equivalent to `min_dpd <= computed_dpd <= max_dpd` (see
+    `annotate_case_dpd_and_bucket()`), written on the stored `due_date` and
+    `current_dpd` so the (field_mapping_status, due_date/current_dpd) indexes
+    apply instead of evaluating the annotation on every row.
+
+    Args:
+        min_dpd (Optional[int]): Lowest DPD, unbounded if None.
+        max_dpd (Optional[int]): Highest DPD, unbounded if None.
+        today (Optional[date]): Reference date, defaults to today.
+
+    Returns:
+        Q: Condition on the case fields.
+    """
+    today: date = today or date.today()
+    with_due_date: Q = Q(due_date__isnull=False)
+    without_due_date: Q = Q(due_date__isnull=True)
+    if min_dpd is not None:
+        # ? computed_dpd is never below 0 for cases with a due date
+        if min_dpd > 0:
+            with_due_date &= Q(due_date__lte=today - timedelta(days=min_dpd))
+        without_due_date &= Q(current_dpd__gte=min_dpd)
+    if max_dpd is not None:
+        if max_dpd < 0:
+            with_due_date = Q(pk__in=[])
+        else:
+            with_due_date &= Q(due_date__gte=today - timedelta(days=max_dpd))
+        without_due_date &= Q(current_dpd__lte=max_dpd)
+    return with_due_date | without_due_date
@@ -0,0 +1,145 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.db.models.query import QuerySet
+
+from core.settings import logger
+from store.configurations.region_config.models import RegionConfigurationPincodeModel
+from store.operations.case_management.models import CaseManagementCaseModel
+from store.operations.case_management.v1.utils.portfolio_rollups import (
+    refresh_portfolio_rollups_for_cases,
+)
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+# Geography keys copied on the case from its residential pincode
+CASE_GEOGRAPHY_FIELDS: List[str] = [
+    "residential_city",
+    "residential_zone",
+    "residential_region",
+]
+
+# Lookup of each geography key from `RegionConfigurationPincodeModel`
+CASE_GEOGRAPHY_PINCODE_LOOKUPS: Dict[str, str] = {
+    "residential_city": "city",
+    "residential_zone": "city__zone",
+    "residential_region": "city__zone__region",
+}
+
+
+def get_pincode_geography_map(
+    pincode_ids: Iterable[Any],
+) -> Dict[Any, Tuple[Any, Any, Any]]:
+    """
+    Returns:
+        Dict[Any, Tuple[Any, Any, Any]]: (city id, zone id, region id) keyed by pincode id.
+    """
+    pincode_ids: List[Any] = [
+        pincode_id for pincode_id in set(pincode_ids) if pincode_id
+    ]
+    if not pincode_ids:
+        return {}
+    return {
+        row[0]: row[1:]
+        for row in RegionConfigurationPincodeModel.objects.filter(
+            pk__in=pincode_ids
+        ).values_list(
+            "pk",
+            *[CASE_GEOGRAPHY_PINCODE_LOOKUPS[field] for field in CASE_GEOGRAPHY_FIELDS],
+        )
+    }
+
+
+def set_case_geography(case_instances: List[CaseManagementCaseModel]) -> None:
+    """
+    Copies city, zone and region of the residential pincode on each case, in one
+    query for all the cases. Cases without pincode get empty keys.
+    """
+    geography_map: Dict[Any, Tuple[Any, Any, Any]] = get_pincode_geography_map(
+        case_instance.residential_pin_code_id for case_instance in case_instances
+    )
+    for case_instance in case_instances:
+        geography: Tuple[Any, ...] = geography_map.get(
+            case_instance.residential_pin_code_id, (None,) * len(CASE_GEOGRAPHY_FIELDS)
+        )
+        for field, value in zip(CASE_GEOGRAPHY_FIELDS, geography):
+            setattr(case_instance, f"{field}_id", value)
+
+
+def refresh_case_geography(
+    queryset: Optional[QuerySet[CaseManagementCaseModel]] = None,
+    batch_size: int = 5000,
+) -> int:
+    """
+    Recomputes the geography keys of cases from their residential pincode with
+    set-based UPDATEs, in primary key batches. Used for the backfill and when a
+    pincode, city or zone is moved.
+
+    Args:
+        queryset (Optional[QuerySet[CaseManagementCaseModel]]): Cases to refresh, all by default.
+        batch_size (int): Cases updated per statement.
+
+    Returns:
+        int: Number of cases updated.
+    """
+    queryset: QuerySet[CaseManagementCaseModel] = (
+        queryset if queryset is not None else CaseManagementCaseModel.objects.all()
+    )
+    pincode_queryset: QuerySet[RegionConfigurationPincodeModel] = (
+        RegionConfigurationPincodeModel.objects.filter(
+            pk=OuterRef("residential_pin_code")
+        )
+    )
+    updates: Dict[str, Subquery] = {
+        field: Subquery(
+            pincode_queryset.values(CASE_GEOGRAPHY_PINCODE_LOOKUPS[field])[:1]
+        )
+        for field in CASE_GEOGRAPHY_FIELDS
+    }
+
+    updated_count: int = 0
+    last_pk: Optional[Any] = None
+    while True:
+        batch_queryset: QuerySet[CaseManagementCaseModel] = queryset.order_by("pk")
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+        case_ids: List[Any] = list(
+            batch_queryset.values_list("pk", flat=True)[:batch_size]
+        )
+        if not case_ids:
+            break
+        last_pk: Any = case_ids[-1]
+
+        with transaction.atomic():
+            updated_count += CaseManagementCaseModel.objects.filter(
+                pk__in=case_ids
+            ).update(**updates)
+        logger.info(f"Refreshed the geography keys of {updated_count} cases")
+
+    return updated_count
+
+
+def refresh_case_geography_for_region_config(
+    pincode_ids: Iterable[Any] = (),
+    city_ids: Iterable[Any] = (),
+    zone_ids: Iterable[Any] = (),
+) -> int:
+    """
+    Refreshes the geography keys, and the portfolio rollups, of the cases under
+    moved pincodes, cities or zones.
+    """
+    pincode_ids, city_ids, zone_ids = list(pincode_ids), list(city_ids), list(zone_ids)
+    if not (pincode_ids or city_ids or zone_ids):
+        return 0
+    queryset: QuerySet[CaseManagementCaseModel] = (
+        CaseManagementCaseModel.objects.filter(
+            Q(residential_pin_code__in=pincode_ids)
+            | Q(residential_pin_code__city__in=city_ids)
+            | Q(residential_pin_code__city__zone__in=zone_ids)
+        )
+    )
+    updated_count: int = refresh_case_geography(queryset=queryset)
+    refresh_portfolio_rollups_for_cases(case_queryset=queryset)
+    return updated_count
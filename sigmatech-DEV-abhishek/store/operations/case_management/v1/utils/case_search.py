@@ -0,0 +1,237 @@
+import logging
+import re
+from typing import Any, List, Optional, Set
+
+from django.db import connections, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Count
+from django.db.models.query import QuerySet
+
+from core.settings import logger
+from store.operations.case_management.models import (
+    CaseManagementCaseModel,
+    CaseManagementCaseSearchGramModel,
+)
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+# Case fields searched, in `search_text` order
+CASE_SEARCH_FIELDS: List[str] = [
+    "customer_name",
+    "loan_account_number",
+    "primary_number",
+    "alternate_number_1",
+    "alternate_number_2",
+    "alternate_number_3",
+    "alternate_number_4",
+]
+
+# Fields indexed without spaces, so "98765 43210" and "+91-9876543210" match
+CASE_SEARCH_COMPACT_FIELDS: List[str] = [
+    "loan_account_number",
+    "primary_number",
+    "alternate_number_1",
+    "alternate_number_2",
+    "alternate_number_3",
+    "alternate_number_4",
+]
+
+# Separates the field values in `search_text`, never part of a normalized value
+CASE_SEARCH_SEPARATOR: str = "|"
+
+CASE_SEARCH_GRAM_SIZE: int = 3
+
+CASE_SEARCH_TRIGRAM_INDEX_NAME: str = "CASE_SEARCH_TEXT_TRGM_IDX"
+
+
+def normalize_search_value(value: Any, is_compact: bool = False) -> str:
+    """
+    Lower cased letters and digits separated by single spaces, without any space
+    for compact values. Stored values and searched terms go through the same
+    normalization.
+    """
+    if value is None:
+        return ""
+    value: str = re.sub(r"[^\w\s]|_", "", str(value).lower())
+    return "".join(value.split()) if is_compact else " ".join(value.split())
+
+
+def get_case_search_text(case_instance: CaseManagementCaseModel) -> Optional[str]:
+    values: List[str] = [
+        normalize_search_value(
+            getattr(case_instance, field),
+            is_compact=field in CASE_SEARCH_COMPACT_FIELDS,
+        )
+        for field in CASE_SEARCH_FIELDS
+    ]
+    return CASE_SEARCH_SEPARATOR.join(values) if any(values) else None
+
+
+def get_search_grams(search_text: Optional[str]) -> Set[str]:
+    """
+    Every substring of `CASE_SEARCH_GRAM_SIZE` characters of each value, plus the
+    shorter tails of the value, so any search term is found either through all its
+    grams or, when shorter than a gram, as the prefix of one of them.
+    """
+    grams: Set[str] = set()
+    for value in (search_text or "").split(CASE_SEARCH_SEPARATOR):
+        for idx in range(len(value)):
+            grams.add(value[idx : idx + CASE_SEARCH_GRAM_SIZE])
+    return grams
+
+
+def is_trigram_search_enabled(using: str = "default") -> bool:
+    # ? Postgres searches `search_text` through a pg_trgm index, others through the gram table
+    return connections[using].vendor == "postgresql"
+
+
+def set_case_search_text(case_instances: List[CaseManagementCaseModel]) -> None:
+    """
+    Sets `search_text` on each case, to be saved with the case (`update_fields`
+    must include "search_text"), followed by `sync_case_search_grams()`.
+    """
+    for case_instance in case_instances:
+        case_instance.search_text = get_case_search_text(case_instance=case_instance)
+
+
+def sync_case_search_grams(
+    case_instances: List[CaseManagementCaseModel], using: str = "default"
+) -> None:
+    """
+    Replaces the search grams of the cases with the grams of their current
+    `search_text`. Nothing to do when the database searches with trigrams.
+    """
+    if not case_instances or is_trigram_search_enabled(using=using):
+        return
+
+    gram_instances: List[CaseManagementCaseSearchGramModel] = [
+        CaseManagementCaseSearchGramModel(case_id=case_instance.pk, gram=gram)
+        for case_instance in case_instances
+        for gram in get_search_grams(search_text=case_instance.search_text)
+    ]
+    with transaction.atomic(using=using):
+        CaseManagementCaseSearchGramModel.objects.using(using).filter(
+            case__in=[case_instance.pk for case_instance in case_instances]
+        ).delete()
+        CaseManagementCaseSearchGramModel.objects.using(using).bulk_create(
+            gram_instances, batch_size=5000
+        )
+
+
+def search_cases(
+    queryset: QuerySet[CaseManagementCaseModel], term: str
+) -> QuerySet[CaseManagementCaseModel]:
+    """
+    Filters cases whose customer name, LAN or phone numbers contain the term,
+    through an index on both databases:
+
+    - Postgres: `LIKE '%term%'` on `search_text`, served by the pg_trgm GIN index.
+    - Others: cases holding every gram of the term in the gram table (a gram
+      prefix for terms shorter than a gram), confirmed on `search_text`.
+
+    Args:
+        queryset (QuerySet[CaseManagementCaseModel]): Cases to search.
+        term (str): Single search term.
+
+    Returns:
+        QuerySet[CaseManagementCaseModel]: Matching cases.
+    """
+    normalized_term: str = normalize_search_value(term)
+    if not normalized_term:
+        return queryset
+
+    if is_trigram_search_enabled(using=queryset.db):
+        return queryset.filter(search_text__contains=normalized_term)
+
+    gram_queryset: QuerySet[CaseManagementCaseSearchGramModel] = (
+        CaseManagementCaseSearchGramModel.objects.using(queryset.db)
+    )
+    if len(normalized_term) < CASE_SEARCH_GRAM_SIZE:
+        # ? range instead of LIKE so the (gram, case) index is used
+        return queryset.filter(
+            pk__in=gram_queryset.filter(
+                gram__gte=normalized_term, gram__lt=f"{normalized_term}\uffff"
+            ).values("case")
+        )
+
+    term_grams: Set[str] = {
+        normalized_term[idx : idx + CASE_SEARCH_GRAM_SIZE]
+        for idx in range(len(normalized_term) - CASE_SEARCH_GRAM_SIZE + 1)
+    }
+    return queryset.filter(
+        pk__in=gram_queryset.filter(gram__in=term_grams)
+        .values("case")
+        .annotate(gram_count=Count("gram"))
+        .filter(gram_count=len(term_grams))
+        .values("case"),
+        search_text__contains=normalized_term,
+    )
+
+
+def ensure_case_search_trigram_index(using: str = "default") -> bool:
+    """
+    Creates the pg_trgm extension and the GIN trigram index of `search_text` if
+    missing. Runs outside a transaction as the index is built concurrently.
+
+    Returns:
+        bool: True if the database searches with trigrams.
+    """
+    if not is_trigram_search_enabled(using=using):
+        return False
+    connection: BaseDatabaseWrapper = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} "
+            "USING gin ({column} gin_trgm_ops)".format(
+                index=connection.ops.quote_name(CASE_SEARCH_TRIGRAM_INDEX_NAME),
+                table=connection.ops.quote_name(CaseManagementCaseModel._meta.db_table),
+                column=connection.ops.quote_name(
+                    CaseManagementCaseModel._meta.get_field("search_text").column
+                ),
+            )
+        )
+    return True
+
+
+def rebuild_case_search_index(
+    queryset: Optional[QuerySet[CaseManagementCaseModel]] = None,
+    batch_size: int = 2000,
+) -> int:
+    """
+    Recomputes `search_text` and the search grams of cases, in primary key batches.
+
+    Args:
+        queryset (Optional[QuerySet[CaseManagementCaseModel]]): Cases to index, all by default.
+        batch_size (int): Cases per batch.
+
+    Returns:
+        int: Number of cases indexed.
+    """
+    queryset: QuerySet[CaseManagementCaseModel] = (
+        queryset if queryset is not None else CaseManagementCaseModel.objects.all()
+    ).only("pk", *CASE_SEARCH_FIELDS)
+
+    indexed_count: int = 0
+    last_pk: Optional[Any] = None
+    while True:
+        batch_queryset: QuerySet[CaseManagementCaseModel] = queryset.order_by("pk")
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+        case_instances: List[CaseManagementCaseModel] = list(
+            batch_queryset[:batch_size]
+        )
+        if not case_instances:
+            break
+        last_pk: Any = case_instances[-1].pk
+
+        set_case_search_text(case_instances=case_instances)
+        with transaction.atomic(using=queryset.db):
+            CaseManagementCaseModel.objects.using(queryset.db).bulk_update(
+                case_instances, fields=["search_text"]
+            )
+            sync_case_search_grams(case_instances=case_instances, using=queryset.db)
+        indexed_count += len(case_instances)
+        logger.info(f"Indexed {indexed_count} cases for search")
+
+    return indexed_count
@@ -1,5 +1,17 @@
+import math
+from decimal import Decimal
+from typing import Optional
+
 import django_filters
-from store.operations.case_management.models import CaseManagementCaseModel
+from rest_framework import filters
+from store.operations.case_management.models import (
+    CaseManagementCaseModel,
+    CasePortfolioRollupModel,
+)
+from store.operations.case_management.v1.utils.case_annotations import (
+    get_case_dpd_range_q,
+)
+from store.operations.case_management.v1.utils.case_search import search_cases
 
 
 class CaseAllocationFilter(django_filters.FilterSet):
@@ -10,20 +22,22 @@ class CaseAllocationFilter(django_filters.FilterSet):
     max_mad = django_filters.NumberFilter(
         field_name="minimum_due_amount", lookup_expr="lte"
     )
-    min_dpd = django_filters.NumberFilter(field_name="current_dpd", lookup_expr="gte")
-    max_dpd = django_filters.NumberFilter(field_name="current_dpd", lookup_expr="lte")
+    # ? DPD and bucket as of today, as annotated by `annotate_case_dpd_and_bucket()`
+    min_dpd = django_filters.NumberFilter(method="filter_dpd")
+    max_dpd = django_filters.NumberFilter(method="filter_dpd")
+    bucket = django_filters.UUIDFilter(field_name="computed_bucket_id")
 
     region_ids = django_filters.BaseInFilter(  # region UUIDs
-        field_name="residential_pin_code__city__zone__region__id", lookup_expr="in"
+        field_name="residential_region_id", lookup_expr="in"
     )
     city_ids = django_filters.BaseInFilter(  # city   UUIDs
-        field_name="residential_pin_code__city__id", lookup_expr="in"
+        field_name="residential_city_id", lookup_expr="in"
     )
     zone_ids = django_filters.BaseInFilter(  # zone UUIDs
-        field_name="residential_pin_code__city__zone__id", lookup_expr="in"
+        field_name="residential_zone_id", lookup_expr="in"
     )
     pincode_ids = django_filters.BaseInFilter(  # pincode UUIDs
-        field_name="residential_pin_code__id", lookup_expr="in"
+        field_name="residential_pin_code_id", lookup_expr="in"
     )
 
     # field_mapping_status
@@ -43,7 +57,9 @@ class CaseAllocationFilter(django_filters.FilterSet):
     product_ids = django_filters.BaseInFilter(
         field_name="allocation_file__product_assignment__product_id", lookup_expr="in"
     )
-    bucket_ids = django_filters.BaseInFilter(field_name="bucket_id", lookup_expr="in")
+    bucket_ids = django_filters.BaseInFilter(
+        field_name="computed_bucket_id", lookup_expr="in"
+    )
     cycle_ids = django_filters.BaseInFilter(
         field_name="allocation_file__cycle_id", lookup_expr="in"
     )
@@ -66,6 +82,19 @@ class CaseAllocationFilter(django_filters.FilterSet):
             pass
         return queryset
 
+    def filter_dpd(self, queryset: CaseManagementCaseModel, name: str, value: Decimal):
+        # ? both bounds in one condition on the stored fields, applied once
+        if name == "max_dpd" and self.form.cleaned_data.get("min_dpd") is not None:
+            return queryset
+        min_dpd: Optional[Decimal] = self.form.cleaned_data.get("min_dpd")
+        max_dpd: Optional[Decimal] = self.form.cleaned_data.get("max_dpd")
+        return queryset.filter(
+            get_case_dpd_range_q(
+                min_dpd=math.ceil(min_dpd) if min_dpd is not None else None,
+                max_dpd=math.floor(max_dpd) if max_dpd is not None else None,
+            )
+        )
+
     unassigned: django_filters = django_filters.BooleanFilter(
         method="filter_unassigned"
     )
@@ -84,3 +113,40 @@ class CaseAllocationFilter(django_filters.FilterSet):
     class Meta:
         model = CaseManagementCaseModel
         fields = ["status", "bucket"]
+
+
+class CasePortfolioRollupFilter(django_filters.FilterSet):
+    allocation_file_ids = django_filters.BaseInFilter(
+        field_name="allocation_file_id", lookup_expr="in"
+    )
+    product_assignment_ids = django_filters.BaseInFilter(
+        field_name="product_assignment_id", lookup_expr="in"
+    )
+    bucket_ids = django_filters.BaseInFilter(field_name="bucket_id", lookup_expr="in")
+    risk = django_filters.BaseInFilter(field_name="risk", lookup_expr="in")
+    region_ids = django_filters.BaseInFilter(
+        field_name="residential_region_id", lookup_expr="in"
+    )
+    zone_ids = django_filters.BaseInFilter(
+        field_name="residential_zone_id", lookup_expr="in"
+    )
+    city_ids = django_filters.BaseInFilter(
+        field_name="residential_city_id", lookup_expr="in"
+    )
+
+    class Meta:
+        model = CasePortfolioRollupModel
+        fields = ["field_mapping_status"]
+
+
+class CaseSearchFilter(filters.SearchFilter):
+    """
+    `search` over customer name, LAN and phone numbers through the case search
+    index (`case_search` utils) instead of `icontains` on each field. Every
+    term must match.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for term in self.get_search_terms(request):
+            queryset = search_cases(queryset=queryset, term=term)
+        return queryset
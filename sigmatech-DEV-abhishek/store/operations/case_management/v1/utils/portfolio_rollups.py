@@ -0,0 +1,205 @@
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Sum, Value
+from django.db.models.expressions import Combinable
+from django.db.models.functions import Coalesce
+from django.db.models.query import QuerySet
+
+from core.settings import logger
+from store.operations.allocation_files.models import AllocationFileModel
+from store.operations.case_management.models import (
+    CaseManagementCaseModel,
+    CasePortfolioRollupModel,
+)
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+# Rollup dimension -> case lookup it is grouped by
+PORTFOLIO_ROLLUP_DIMENSIONS: Dict[str, str] = {
+    "allocation_file": "allocation_file",
+    "product_assignment": "allocation_file__product_assignment",
+    "bucket": "bucket",
+    "risk": "risk",
+    "field_mapping_status": "field_mapping_status",
+    "residential_region": "residential_region",
+    "residential_zone": "residential_zone",
+    "residential_city": "residential_city",
+}
+
+# Case amounts adding up to the total outstanding of a case
+TOTAL_OUTSTANDING_FIELDS: List[str] = [
+    "pos_value",
+    "penalty_amount",
+    "late_payment_fee",
+    "late_payment_charges",
+]
+
+# `group_by` of the read API -> (rollup field, label lookup)
+PORTFOLIO_ROLLUP_GROUP_BY: Dict[str, Tuple[str, Optional[str]]] = {
+    "allocation_file": ("allocation_file", "allocation_file__title"),
+    "product_assignment": (
+        "product_assignment",
+        "product_assignment__product__title",
+    ),
+    "bucket": ("bucket", "bucket__title"),
+    "risk": ("risk", None),
+    "field_mapping_status": ("field_mapping_status", None),
+    "region": ("residential_region", "residential_region__title"),
+    "zone": ("residential_zone", "residential_zone__title"),
+    "city": ("residential_city", "residential_city__city_name"),
+}
+
+PORTFOLIO_ROLLUP_AMOUNT_FIELDS: List[str] = [
+    "total_pos",
+    "total_outstanding",
+    "total_collectable_amount",
+]
+
+
+def _amount(field: str) -> Combinable:
+    return Coalesce(
+        F(field),
+        Value(Decimal(0)),
+        output_field=DecimalField(max_digits=20, decimal_places=2),
+    )
+
+
+def get_case_rollup_rows(allocation_file_ids: List[Any]) -> QuerySet:
+    """
+    One GROUP BY over the cases of the allocation files, one row per combination
+    of `PORTFOLIO_ROLLUP_DIMENSIONS`.
+    """
+    total_outstanding: Combinable = _amount(TOTAL_OUTSTANDING_FIELDS[0])
+    for field in TOTAL_OUTSTANDING_FIELDS[1:]:
+        total_outstanding = total_outstanding + _amount(field)
+
+    return (
+        CaseManagementCaseModel.objects.filter(allocation_file__in=allocation_file_ids)
+        .values(*PORTFOLIO_ROLLUP_DIMENSIONS.values())
+        .annotate(
+            case_count=Count("pk"),
+            total_pos=Sum(_amount("pos_value")),
+            total_outstanding=Sum(total_outstanding),
+            total_collectable_amount=Sum(_amount("collectable_amount")),
+        )
+        .order_by()
+    )
+
+
+def refresh_portfolio_rollups(allocation_file_ids: Iterable[Any]) -> int:
+    """
+    Rebuilds the rollup rows of the given allocation files from their cases, to
+    be called after their cases are created, updated or rescored. Files are
+    locked while rebuilt so concurrent refreshes of a file do not interleave.
+
+    Args:
+        allocation_file_ids (Iterable[Any]): Allocation files whose cases changed.
+
+    Returns:
+        int: Number of rollup rows written.
+    """
+    allocation_file_ids: List[Any] = sorted(
+        {
+            allocation_file_id
+            for allocation_file_id in allocation_file_ids
+            if allocation_file_id
+        },
+        key=str,
+    )
+    if not allocation_file_ids:
+        return 0
+
+    attnames: Dict[str, str] = {
+        dimension: CasePortfolioRollupModel._meta.get_field(dimension).attname
+        for dimension in PORTFOLIO_ROLLUP_DIMENSIONS
+    }
+    with transaction.atomic():
+        list(
+            AllocationFileModel.objects.select_for_update()
+            .filter(pk__in=allocation_file_ids)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        rollup_instances: List[CasePortfolioRollupModel] = [
+            CasePortfolioRollupModel(
+                **{
+                    attnames[dimension]: row[lookup]
+                    for dimension, lookup in PORTFOLIO_ROLLUP_DIMENSIONS.items()
+                },
+                case_count=row["case_count"],
+                total_pos=row["total_pos"] or 0,
+                total_outstanding=row["total_outstanding"] or 0,
+                total_collectable_amount=row["total_collectable_amount"] or 0,
+            )
+            for row in get_case_rollup_rows(allocation_file_ids=allocation_file_ids)
+        ]
+        CasePortfolioRollupModel.objects.filter(
+            allocation_file__in=allocation_file_ids
+        ).delete()
+        CasePortfolioRollupModel.objects.bulk_create(rollup_instances, batch_size=1000)
+
+    logger.info(
+        f"Refreshed {len(rollup_instances)} portfolio rollup rows of "
+        f"{len(allocation_file_ids)} allocation files"
+    )
+    return len(rollup_instances)
+
+
+def refresh_portfolio_rollups_for_cases(
+    case_queryset: QuerySet[CaseManagementCaseModel],
+) -> int:
+    """
+    Refreshes the rollups of the allocation files the given cases belong to.
+    """
+    return refresh_portfolio_rollups(
+        allocation_file_ids=case_queryset.order_by()
+        .values_list("allocation_file", flat=True)
+        .distinct()
+    )
+
+
+def get_portfolio_rollup_summary(
+    queryset: QuerySet[CasePortfolioRollupModel], group_by: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Sums the rollup rows, per `PORTFOLIO_ROLLUP_GROUP_BY` level or in total.
+
+    Args:
+        queryset (QuerySet[CasePortfolioRollupModel]): Filtered rollup rows.
+        group_by (Optional[str]): Key of `PORTFOLIO_ROLLUP_GROUP_BY`, None for a single total row.
+
+    Returns:
+        List[Dict[str, Any]]: `key`, `label` and the summed count and amounts per group.
+    """
+    # ? summed under another name, annotations cannot shadow the rollup fields
+    totals: Dict[str, Any] = {
+        f"sum_{field}": Coalesce(
+            Sum(field),
+            Value(Decimal(0)),
+            output_field=DecimalField(max_digits=20, decimal_places=2),
+        )
+        for field in PORTFOLIO_ROLLUP_AMOUNT_FIELDS
+    }
+    totals["sum_case_count"] = Coalesce(Sum("case_count"), Value(0))
+
+    def to_summary(row: Dict[str, Any]) -> Dict[str, Any]:
+        return {total[len("sum_") :]: row[total] for total in totals}
+
+    if not group_by:
+        return [
+            {"key": None, "label": None, **to_summary(queryset.aggregate(**totals))}
+        ]
+
+    field, label_lookup = PORTFOLIO_ROLLUP_GROUP_BY[group_by]
+    lookups: List[str] = [field, label_lookup] if label_lookup else [field]
+    return [
+        {
+            "key": row[field],
+            "label": row[label_lookup] if label_lookup else row[field],
+            **to_summary(row),
+        }
+        for row in queryset.values(*lookups).annotate(**totals).order_by(*lookups)
+    ]
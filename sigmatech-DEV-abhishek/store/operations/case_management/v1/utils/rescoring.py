@@ -0,0 +1,336 @@
+import logging
+import re
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+from core.settings import logger
+from core_utils.utils.enums import CoreUtilsStatusEnum
+from store.configurations.loan_config.models import LoanConfigurationsBucketModel
+from store.operations.allocation_files.v1.upload.utils.risk_cal_utils import (
+    RISK_CALCULATION_FIELDS,
+    calculate_risk_for_columns,
+)
+from store.operations.allocation_files.v1.utils.enums import AllocationStatusEnum
+from store.operations.case_management.enums import CaseManagementFieldStatusEnumChoices
+from store.operations.case_management.models import CaseManagementCaseModel
+from store.operations.case_management.v1.utils.portfolio_rollups import (
+    refresh_portfolio_rollups,
+)
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+# Case fields loaded for rescoring
+RESCORING_FIELDS: Tuple[str, ...] = (
+    *RISK_CALCULATION_FIELDS,
+    "due_date",
+    "current_dpd",
+    "dpd_as_of_date",
+    "risk",
+    "risk_points",
+    "bucket",
+    "bucket_name",
+    "allocation_file",
+)
+
+# Case fields written back for changed cases
+RESCORING_UPDATE_FIELDS: List[str] = [
+    "current_dpd",
+    "dpd_as_of_date",
+    "risk",
+    "risk_points",
+    "bucket",
+    "bucket_name",
+]
+
+
+def parse_bucket_range(value: Optional[str]) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Parses a `BucketRangeModel` value/label into inclusive DPD bounds.
+
+    Supported formats: "31-60", "31 to 60", "90+", ">90", ">=91", "0".
+
+    Returns:
+        Optional[Tuple[int, Optional[int]]]: (lower, upper) bounds, upper is None when
+            unbounded, or None if the value is not a range.
+    """
+    text: str = re.sub(r"\s*(dpd|days?)\s*", " ", (value or "").lower()).strip()
+
+    match: Optional[re.Match] = re.fullmatch(r"(\d+)\s*(?:-|–|to)\s*(\d+)", text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+
+    match = re.fullmatch(r"(\d+)\s*\+|(?:>=|above)\s*(\d+)", text)
+    if match:
+        return int(match.group(1) or match.group(2)), None
+
+    match = re.fullmatch(r">\s*(\d+)", text)
+    if match:
+        return int(match.group(1)) + 1, None
+
+    match = re.fullmatch(r"\d+", text)
+    if match:
+        return int(text), int(text)
+    return None
+
+
+class BucketRangeResolver:
+    """
+    Maps DPD values to the active `LoanConfigurationsBucketModel` whose
+    `BucketRangeModel` contains them. The first bucket created wins when
+    ranges overlap.
+
+    Attributes:
+        ranges (List[Tuple[int, Optional[int], LoanConfigurationsBucketModel]]): Parsed bucket ranges.
+    """
+
+    ranges: List[Tuple[int, Optional[int], LoanConfigurationsBucketModel]]
+
+    def __init__(self):
+        self.ranges = []
+        for bucket in (
+            LoanConfigurationsBucketModel.objects.filter(
+                status=CoreUtilsStatusEnum.ACTIVATED.value, range__isnull=False
+            )
+            .select_related("range")
+            .order_by("core_generic_created_at")
+        ):
+            bounds: Optional[Tuple[int, Optional[int]]] = parse_bucket_range(
+                bucket.range.value
+            ) or parse_bucket_range(bucket.range.label)
+            if not bounds:
+                logger.warning(
+                    f"Bucket {bucket.title} has an unparsable range {bucket.range.value!r}"
+                )
+                continue
+            self.ranges.append((*bounds, bucket))
+
+    def resolve(
+        self, dpd: np.ndarray, has_dpd: np.ndarray
+    ) -> List[Optional[LoanConfigurationsBucketModel]]:
+        """
+        Args:
+            dpd (np.ndarray): DPD of each case.
+            has_dpd (np.ndarray): False where the case has no DPD.
+
+        Returns:
+            List[Optional[LoanConfigurationsBucketModel]]: Bucket of each case, None if no range matches.
+        """
+        buckets: List[Optional[LoanConfigurationsBucketModel]] = [None] * len(dpd)
+        unresolved: np.ndarray = has_dpd.copy()
+        for lower, upper, bucket in self.ranges:
+            in_range: np.ndarray = unresolved & (dpd >= lower)
+            if upper is not None:
+                in_range &= dpd <= upper
+            for idx in np.flatnonzero(in_range):
+                buckets[idx] = bucket
+            unresolved &= ~in_range
+        return buckets
+
+
+def get_active_cases_queryset() -> QuerySet[CaseManagementCaseModel]:
+    """
+    Saved cases of allocation files that are neither expired nor completed.
+    """
+    return CaseManagementCaseModel.objects.filter(
+        field_mapping_status=CaseManagementFieldStatusEnumChoices.SAVED.value
+    ).exclude(
+        allocation_file__allocation_status__in=[
+            AllocationStatusEnum.EXPIRED.value,
+            AllocationStatusEnum.COMPLETED.value,
+        ]
+    )
+
+
+def _to_ordinals(values: List[Optional[date]]) -> Tuple[np.ndarray, np.ndarray]:
+    has_value: np.ndarray = np.array(
+        [value is not None for value in values], dtype=bool
+    )
+    ordinals: np.ndarray = np.array(
+        [value.toordinal() if value is not None else 0 for value in values],
+        dtype=np.int64,
+    )
+    return ordinals, has_value
+
+
+def rescore_case_batch(
+    case_instances: List[CaseManagementCaseModel],
+    bucket_resolver: BucketRangeResolver,
+    today: date,
+) -> List[CaseManagementCaseModel]:
+    """
+    Recomputes DPD, bucket and risk of a batch of cases.
+
+    DPD rules:
+        - With a due date: days past the due date (0 if not yet due), as shown by the case list.
+        - Otherwise a positive `current_dpd` is rolled forward by the days elapsed since
+          `dpd_as_of_date` (upload date of the allocation file when never set).
+
+    Args:
+        case_instances (List[CaseManagementCaseModel]): Cases loaded with `RESCORING_FIELDS`
+            and the `allocation_file_created_at` annotation.
+        bucket_resolver (BucketRangeResolver): Bucket ranges.
+        today (date): Reference date.
+
+    Returns:
+        List[CaseManagementCaseModel]: Cases with at least one changed field, updated in place.
+    """
+    today_ordinal: int = today.toordinal()
+
+    due_ordinal, has_due = _to_ordinals([case.due_date for case in case_instances])
+    as_of_ordinal, _ = _to_ordinals(
+        [
+            case.dpd_as_of_date
+            or (
+                timezone.localdate(case.allocation_file_created_at)
+                if case.allocation_file_created_at
+                else today
+            )
+            for case in case_instances
+        ]
+    )
+    has_current: np.ndarray = np.array(
+        [case.current_dpd is not None for case in case_instances], dtype=bool
+    )
+    current_dpd: np.ndarray = np.array(
+        [case.current_dpd or 0 for case in case_instances], dtype=np.int64
+    )
+
+    is_rolled: np.ndarray = ~has_due & has_current & (current_dpd > 0)
+    dpd: np.ndarray = np.where(
+        has_due,
+        np.maximum(today_ordinal - due_ordinal, 0),
+        np.where(
+            is_rolled,
+            current_dpd + np.maximum(today_ordinal - as_of_ordinal, 0),
+            current_dpd,
+        ),
+    )
+    has_dpd: np.ndarray = has_due | has_current
+
+    buckets: List[Optional[LoanConfigurationsBucketModel]] = bucket_resolver.resolve(
+        dpd=dpd, has_dpd=has_dpd
+    )
+    risk: List[Optional[str]]
+    risk_points: List[int]
+    risk, risk_points = calculate_risk_for_columns(
+        columns={
+            field: [getattr(case, field) for case in case_instances]
+            for field in RISK_CALCULATION_FIELDS
+        },
+        today=today,
+    )
+
+    changed_cases: List[CaseManagementCaseModel] = []
+    for idx, case in enumerate(case_instances):
+        new_values: Dict[str, Any] = {
+            "risk": risk[idx],
+            "risk_points": risk_points[idx],
+        }
+        if has_dpd[idx] and case.current_dpd != int(dpd[idx]):
+            new_values["current_dpd"] = int(dpd[idx])
+            new_values["dpd_as_of_date"] = today
+        if buckets[idx] is not None and case.bucket_id != buckets[idx].pk:
+            new_values["bucket"] = buckets[idx]
+            new_values["bucket_name"] = buckets[idx].title
+
+        is_changed: bool = False
+        for key, value in new_values.items():
+            if key == "bucket" or getattr(case, key) != value:
+                setattr(case, key, value)
+                is_changed: bool = True
+        if is_changed:
+            changed_cases.append(case)
+
+    return changed_cases
+
+
+def rescore_cases(
+    queryset: Optional[QuerySet[CaseManagementCaseModel]] = None,
+    batch_size: Optional[int] = None,
+    today: Optional[date] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Rescores cases in keyset-paginated batches: one SELECT of the rescoring
+    fields and, for changed cases only, one `bulk_update` per batch. The portfolio
+    rollups of the allocation files with changed cases are rebuilt at the end.
+
+    Args:
+        queryset (Optional[QuerySet[CaseManagementCaseModel]]): Cases to rescore,
+            defaults to `get_active_cases_queryset()`.
+        batch_size (Optional[int]): Cases per batch, defaults to `CASE_RESCORING_BATCH_SIZE`.
+        today (Optional[date]): Reference date, defaults to today.
+        dry_run (bool): Compute the changes without writing them.
+
+    Returns:
+        Dict[str, Any]: Scanned and updated case counts, duration and throughput.
+    """
+    batch_size: int = batch_size or settings.CASE_RESCORING_BATCH_SIZE
+    today: date = today or date.today()
+    queryset: QuerySet[CaseManagementCaseModel] = (
+        (queryset if queryset is not None else get_active_cases_queryset())
+        .only(*RESCORING_FIELDS)
+        .annotate(
+            allocation_file_created_at=F("allocation_file__core_generic_created_at")
+        )
+        .order_by("pk")
+    )
+    bucket_resolver: BucketRangeResolver = BucketRangeResolver()
+
+    scanned_count: int = 0
+    updated_count: int = 0
+    last_pk: Optional[Any] = None
+    changed_allocation_file_ids: Set[Any] = set()
+    start_time: float = time.perf_counter()
+
+    while True:
+        batch_queryset: QuerySet[CaseManagementCaseModel] = (
+            queryset.filter(pk__gt=last_pk) if last_pk is not None else queryset
+        )
+        case_instances: List[CaseManagementCaseModel] = list(
+            batch_queryset[:batch_size]
+        )
+        if not case_instances:
+            break
+        last_pk: Any = case_instances[-1].pk
+
+        changed_cases: List[CaseManagementCaseModel] = rescore_case_batch(
+            case_instances=case_instances,
+            bucket_resolver=bucket_resolver,
+            today=today,
+        )
+        if changed_cases and not dry_run:
+            with transaction.atomic():
+                CaseManagementCaseModel.objects.bulk_update(
+                    changed_cases, fields=RESCORING_UPDATE_FIELDS
+                )
+            changed_allocation_file_ids.update(
+                case_instance.allocation_file_id for case_instance in changed_cases
+            )
+
+        scanned_count += len(case_instances)
+        updated_count += len(changed_cases)
+        elapsed: float = time.perf_counter() - start_time
+        logger.info(
+            f"Rescored {scanned_count} cases ({updated_count} changed), "
+            f"{scanned_count / elapsed if elapsed else scanned_count:.0f} cases/sec"
+        )
+
+    # ? bucket and risk changes move amounts between rollup rows
+    refresh_portfolio_rollups(allocation_file_ids=changed_allocation_file_ids)
+
+    elapsed: float = time.perf_counter() - start_time
+    return {
+        "scanned_cases": scanned_count,
+        "updated_cases": updated_count,
+        "seconds": round(elapsed, 2),
+        "cases_per_second": round(scanned_count / elapsed, 2) if elapsed else 0,
+    }
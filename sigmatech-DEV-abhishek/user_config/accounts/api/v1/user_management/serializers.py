@@ -13,11 +13,7 @@ from user_config.accounts.api.v1.utils.handlers.user_reassignment_handler import
     UserManagementUserReAssignmentHandler,
 )
 from user_config.accounts.api.v1.utils.user_table_field_utils import (
-    get_user_instance_assigned_area_queryset,
-    get_user_instance_assigned_city_queryset,
-    get_user_instance_assigned_pincode_queryset,
-    get_user_instance_assigned_region_queryset,
-    get_user_instance_assigned_zone_queryset,
+    UserAssignmentResolver,
 )
 from user_config.user_auth.models import UserModel
 from core_utils.utils.generics.serializers.mixins import CoreGenericSerializerMixin
@@ -28,6 +24,7 @@ from store.configurations.region_config.models import (
     RegionConfigurationRegionModel,
     RegionConfigurationZoneModel,
 )
+from django.db.models import Manager
 from django.db.models.query import QuerySet
 from core_utils.utils.enums import CoreUtilsStatusEnum
 
@@ -129,37 +126,54 @@ class UserManagementUserUpdateModelSerializer(
 
 
 class UserManagementUserModelSerializerMethodFields:
+    # ? set by `UserManagementUserListSerializer` for the whole page
+    user_assignment_resolver: Optional[UserAssignmentResolver] = None
+
+    def get_user_assignment_resolver(self, obj: UserModel) -> UserAssignmentResolver:
+        if (
+            self.user_assignment_resolver is None
+            or obj not in self.user_assignment_resolver
+        ):
+            self.user_assignment_resolver = UserAssignmentResolver(user_instances=[obj])
+        return self.user_assignment_resolver
+
     def get_assigned_region(self, obj: UserModel) -> Optional[str]:
         return ", ".join(
-            get_user_instance_assigned_region_queryset(user_instance=obj).values_list(
-                "title", flat=True
-            )
+            self.get_user_assignment_resolver(obj).get_assigned(obj, level="region")
         )
 
     def get_assigned_zone(self, obj: UserModel) -> Optional[str]:
         return ", ".join(
-            get_user_instance_assigned_zone_queryset(user_instance=obj).values_list(
-                "title", flat=True
-            )
+            self.get_user_assignment_resolver(obj).get_assigned(obj, level="zone")
         )
 
     def get_assigned_city(self, obj: UserModel) -> List[str]:
-        return get_user_instance_assigned_city_queryset(user_instance=obj).values_list(
-            "city_name", flat=True
-        )
+        return self.get_user_assignment_resolver(obj).get_assigned(obj, level="city")
 
     def get_assigned_pincode(self, obj: UserModel) -> List[str]:
-        return get_user_instance_assigned_pincode_queryset(
-            user_instance=obj
-        ).values_list("pincode__pincode", flat=True)
+        return self.get_user_assignment_resolver(obj).get_assigned(obj, level="pincode")
 
     def get_assigned_area(self, obj: UserModel) -> List[str]:
-        return get_user_instance_assigned_area_queryset(user_instance=obj).values_list(
-            "title", flat=True
-        )
+        return self.get_user_assignment_resolver(obj).get_assigned(obj, level="area")
 
     def get_has_reporting_users(self, obj: UserModel) -> bool:
-        return obj.UserModel_reports_to.all().exists()
+        return self.get_user_assignment_resolver(obj).has_reporting_users(obj)
+
+
+class UserManagementUserListSerializer(serializers.ListSerializer):
+    """
+    Resolves the region assignments and reporting users of the whole page in a
+    constant number of queries before serializing each user.
+    """
+
+    def to_representation(self, data) -> List:
+        user_instances: List[UserModel] = list(
+            data.all() if isinstance(data, (Manager, QuerySet)) else data
+        )
+        self.child.user_assignment_resolver = UserAssignmentResolver(
+            user_instances=user_instances
+        )
+        return [self.child.to_representation(item) for item in user_instances]
 
 
 class UserManagementUserListModelSerializer(
@@ -192,6 +206,7 @@ class UserManagementUserListModelSerializer(
             "has_reporting_users",
             "product_assignment_name",
         ]
+        list_serializer_class = UserManagementUserListSerializer
 
     def get_product_assignment_name(self, obj):
         # Extract the annotated "assignment" values from the prefetch
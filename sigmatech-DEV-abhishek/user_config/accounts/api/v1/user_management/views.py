@@ -32,10 +32,11 @@ class UserManagementUserGenericAPIView(
     filter_backends = [filters.SearchFilter]
     permission_classes = [permissions.IsAuthenticated]
     search_fields = ["username", "email", "login_id", "user_role__title"]
+    query_budget = 11
 
     def get_queryset(self):
         return user_management_table_filter_queryset(
-            queryset=self.queryset.all(),
+            queryset=self.queryset.select_related("user_role"),
             user_instance=self.request.user,
             params=self.request.GET.dict(),
         )
@@ -57,6 +58,7 @@ class UserManagementUserDetailsGenericAPIView(
     permission_classes = [permissions.IsAuthenticated]
     many = False
     pk_scope = "KWARGS"
+    query_budget = 11
 
     def get_serializer_class(self):
         return {
@@ -1,10 +1,11 @@
-from typing import Dict, List
+from typing import Dict
+from django.db.models import Q
 from django.db.models.query import QuerySet
 
 from user_config.user_auth.models import UserModel, UserRoleModel
 from user_config.user_auth.enums import UserRoleEnum
 from user_config.accounts.api.v1.utils.user_reports_hierarichal_list import (
-    get_descendant_users,
+    get_descendant_users_queryset,
 )
 
 
@@ -125,17 +126,12 @@ def get_user_reports_to_queryset(
     if user_role_instance.role in [UserRoleEnum.ADMIN.value]:
         return queryset.exclude(user_role__role=UserRoleEnum.ADMIN.value)
 
-    # Get all descendant users (direct & indirect reports)
-    descendant_users_list: List[UserModel] = get_descendant_users(
+    # Get all descendant users (direct & indirect reports) as a subquery
+    descendant_users_queryset: QuerySet[UserModel] = get_descendant_users_queryset(
         user_instance=user_instance
     )
-    include_current_user_list: List[str] = []
+    user_filter: Q = Q(pk__in=descendant_users_queryset.values("pk"))
     if include_current_user:
-        include_current_user_list: List[str] = [user_instance.pk]
+        user_filter |= Q(pk=user_instance.pk)
 
-    return queryset.filter(
-        pk__in=[
-            *[query.pk for query in descendant_users_list],
-            *include_current_user_list,
-        ]
-    )
+    return queryset.filter(user_filter)
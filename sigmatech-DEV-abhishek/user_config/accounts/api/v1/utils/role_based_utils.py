@@ -4,7 +4,7 @@ from user_config.accounts.api.v1.utils.user_role_hierarichal_list import (
 from user_config.user_auth.models import UserModel, UserRoleModel
 from typing import List, Any
 from user_config.accounts.api.v1.utils.user_reports_hierarichal_list import (
-    get_descendant_users,
+    get_descendant_users_queryset,
 )
 
 
@@ -21,15 +21,15 @@ def list_of_has_permission_roles(user_role_instance: UserRoleModel, key: str = "
 def list_of_user_id_under_user_instance(
     user_instance: UserModel, key: str = "pk", include_current_user: bool = True
 ) -> List[str]:
-    user_queryset_list: List[UserModel] = get_descendant_users(
+    user_key_list: List[Any] = get_descendant_users_queryset(
         user_instance=user_instance
-    )
+    ).values_list(key, flat=True)
     if include_current_user:
         return [
-            *[str(getattr(query, key)) for query in user_queryset_list],
+            *[str(value) for value in user_key_list],
             str(getattr(user_instance, key)),
         ]
-    return [str(getattr(query, key)) for query in user_queryset_list]
+    return [str(value) for value in user_key_list]
 
 
 def has_user_permission_to_role(
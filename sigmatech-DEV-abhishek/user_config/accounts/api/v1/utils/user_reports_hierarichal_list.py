@@ -1,10 +1,123 @@
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.db.models.query import QuerySet, RawQuerySet
+
 from core_utils.utils.global_variables import (
     STATUS_ACTIVATED_GLOBAL_FILTERSET,
     USER_MODEL_EXCLUDE_ADMIN_ROLE_FILTERSET,
 )
 from user_config.user_auth.enums import UserRoleEnum
 from user_config.user_auth.models import UserModel
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Tuple
+
+# Guards the recursive queries against a `reports_to` cycle
+USER_HIERARCHY_MAX_DEPTH: int = 100
+
+
+def _get_user_hierarchy_columns() -> Tuple[str, str, str]:
+    """
+    Returns:
+        Tuple[str, str, str]: Quoted table, primary key and `reports_to` column names of UserModel.
+    """
+    quote_name: Callable[[str], str] = connection.ops.quote_name
+    return (
+        quote_name(UserModel._meta.db_table),
+        quote_name(UserModel._meta.pk.column),
+        quote_name(UserModel._meta.get_field("reports_to").column),
+    )
+
+
+def _get_user_pk_param(user_instance: UserModel) -> Any:
+    # UUIDs are stored as text on sqlite, as uuid on Postgres
+    return UserModel._meta.pk.get_db_prep_value(user_instance.pk, connection)
+
+
+def _descendant_users_cte() -> str:
+    """
+    Recursive CTE `user_hierarchy(id, depth)` of every user reporting, directly
+    or indirectly, to the user passed as parameter. Each level is one lookup on
+    the indexed `reports_to` column.
+    """
+    table, pk_column, reports_to_column = _get_user_hierarchy_columns()
+    return (
+        "WITH RECURSIVE user_hierarchy(id, depth) AS ("
+        f"SELECT {pk_column}, 1 FROM {table} WHERE {reports_to_column} = %s "
+        "UNION "
+        f"SELECT child.{pk_column}, user_hierarchy.depth + 1 FROM {table} child "
+        f"INNER JOIN user_hierarchy ON child.{reports_to_column} = user_hierarchy.id "
+        f"WHERE user_hierarchy.depth < {USER_HIERARCHY_MAX_DEPTH}"
+        ")"
+    )
+
+
+def _ancestor_users_cte() -> str:
+    """
+    Recursive CTE `user_hierarchy(id, parent_id, depth)` walking up the
+    `reports_to` chain of the user passed as parameter (depth 0).
+    """
+    table, pk_column, reports_to_column = _get_user_hierarchy_columns()
+    return (
+        "WITH RECURSIVE user_hierarchy(id, parent_id, depth) AS ("
+        f"SELECT {pk_column}, {reports_to_column}, 0 FROM {table} WHERE {pk_column} = %s "
+        "UNION "
+        f"SELECT parent.{pk_column}, parent.{reports_to_column}, user_hierarchy.depth + 1 "
+        f"FROM {table} parent "
+        f"INNER JOIN user_hierarchy ON parent.{pk_column} = user_hierarchy.parent_id "
+        f"WHERE user_hierarchy.depth < {USER_HIERARCHY_MAX_DEPTH}"
+        ")"
+    )
+
+
+def get_descendant_users_queryset(user_instance: UserModel) -> QuerySet[UserModel]:
+    """
+    Lazy queryset of all descendant users (direct and indirect reports) of the
+    given user, resolved by the database in a single query. Being a queryset,
+    it can be further filtered or used as a subquery (`pk__in=...`).
+
+    Args:
+        user_instance (UserModel):
+            The user instance whose subordinates need to be fetched.
+
+    Returns:
+        QuerySet[UserModel]:
+            Users under the given user in the reporting hierarchy; for admins,
+            every activated non-admin user.
+    """
+    if user_instance.user_role.role == UserRoleEnum.ADMIN.value:
+        return UserModel.objects.filter(**STATUS_ACTIVATED_GLOBAL_FILTERSET).exclude(
+            **USER_MODEL_EXCLUDE_ADMIN_ROLE_FILTERSET
+        )
+
+    return UserModel.objects.filter(
+        pk__in=RawSQL(
+            f"{_descendant_users_cte()} SELECT id FROM user_hierarchy",
+            (_get_user_pk_param(user_instance),),
+        )
+    )
+
+
+def get_ancestor_users_queryset(user_instance: UserModel) -> RawQuerySet:
+    """
+    All ancestor users (managers, supervisors, etc.) of the given user,
+    nearest first, resolved by the database in a single query.
+
+    Args:
+        user_instance (UserModel):
+            The user instance whose ancestors need to be fetched.
+
+    Returns:
+        RawQuerySet:
+            UserModel instances above the given user in the reporting hierarchy.
+    """
+    table, pk_column, _ = _get_user_hierarchy_columns()
+    return UserModel.objects.raw(
+        f"{_ancestor_users_cte()} "
+        f"SELECT {table}.* FROM {table} "
+        f"INNER JOIN user_hierarchy ON {table}.{pk_column} = user_hierarchy.id "
+        "WHERE user_hierarchy.depth > 0 "
+        "ORDER BY user_hierarchy.depth",
+        (_get_user_pk_param(user_instance),),
+    )
 
 
 def get_ancestor_users(
@@ -12,33 +125,24 @@ def get_ancestor_users(
     user_hierarchy: Optional[List[UserModel]] = None,
 ) -> List[UserModel]:
     """
-    Recursively retrieves all ancestor users (managers, supervisors, etc.)
+    Retrieves all ancestor users (managers, supervisors, etc.)
     above the given user instance in the reporting hierarchy.
 
     Args:
         user_instance (UserModel):
             The user instance whose ancestors need to be fetched.
         user_hierarchy (Optional[List[UserModel]], default=None):
-            Accumulator used to collect ancestor users during recursion.
+            Existing list the ancestor users are appended to.
 
     Returns:
         List[UserModel]:
             A list of UserModel instances representing all users above
-            the given user in the reporting hierarchy.
+            the given user in the reporting hierarchy, nearest first.
     """
-    # Initialize accumulator only once
     if user_hierarchy is None:
         user_hierarchy: List = []
 
-    # Get the immediate manager/supervisor of the user
-    parent: Optional[UserModel] = user_instance.reports_to
-
-    # If a manager exists, add to the hierarchy and recurse further up
-    if parent:
-        user_hierarchy.append(parent)
-        return get_ancestor_users(parent, user_hierarchy)
-
-    # Base case: no more parents → return accumulated hierarchy
+    user_hierarchy.extend(get_ancestor_users_queryset(user_instance=user_instance))
     return user_hierarchy
 
 
@@ -47,37 +151,22 @@ def get_descendant_users(
     user_hierarchy: Optional[List[UserModel]] = None,
 ) -> List[UserModel]:
     """
-    Recursively retrieves all descendant users (direct and indirect reports)
+    Retrieves all descendant users (direct and indirect reports)
     under the given user instance.
 
     Args:
         user_instance (UserModel):
             The user instance whose subordinates need to be fetched.
         user_hierarchy (Optional[List[UserModel]], default=None):
-            Accumulator used to collect subordinate users during recursion.
+            Existing list the subordinate users are appended to.
 
     Returns:
         List[UserModel]:
             A list of UserModel instances representing all users under
             the given user in the reporting hierarchy.
     """
-    # Initialize accumulator only once
-    if user_instance.user_role.role == UserRoleEnum.ADMIN.value:
-        return list(
-            UserModel.objects.filter(**STATUS_ACTIVATED_GLOBAL_FILTERSET).exclude(
-                **USER_MODEL_EXCLUDE_ADMIN_ROLE_FILTERSET
-            )
-        )
     if user_hierarchy is None:
         user_hierarchy: List = []
 
-    # Get all direct reports of the current user
-    children: List[UserModel] = list(user_instance.UserModel_reports_to.all())
-
-    # If there are direct reports, collect them and recurse for each
-    for child in children:
-        user_hierarchy.append(child)
-        get_descendant_users(child, user_hierarchy)
-
-    # Base case: no more children → return accumulated hierarchy
+    user_hierarchy.extend(get_descendant_users_queryset(user_instance=user_instance))
     return user_hierarchy
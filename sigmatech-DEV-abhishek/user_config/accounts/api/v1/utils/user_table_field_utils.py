@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Iterable, List, Set, Tuple
 from django.db.models.query import QuerySet
 
 from store.configurations.region_config.models import (
@@ -8,6 +8,7 @@ from store.configurations.region_config.models import (
     RegionConfigurationRegionModel,
     RegionConfigurationZoneModel,
 )
+from user_config.accounts.models import UserDetailModel
 from user_config.user_auth.models import UserModel
 from user_config.user_auth.enums import UserRoleEnum
 
@@ -258,3 +259,144 @@ def get_user_instance_assigned_area_queryset(
         return user_instance.UserDetailModel_user.assigned_area.all()
 
     return RegionConfigurationAreaModel.objects.none()
+
+
+# Region levels implied by each `UserDetailModel` assignment, as lookup paths from
+# `UserDetailModel`, from the assigned level up to the region
+USER_ASSIGNMENT_LEVEL_PATHS: Dict[str, Dict[str, str]] = {
+    "assigned_region": {"region": "assigned_region"},
+    "assigned_zone": {
+        "zone": "assigned_zone",
+        "region": "assigned_zone__region",
+    },
+    "assigned_city": {
+        "city": "assigned_city",
+        "zone": "assigned_city__zone",
+        "region": "assigned_city__zone__region",
+    },
+    "assigned_pincode": {
+        "pincode": "assigned_pincode",
+        "city": "assigned_pincode__city",
+        "zone": "assigned_pincode__city__zone",
+        "region": "assigned_pincode__city__zone__region",
+    },
+    "assigned_area": {
+        "area": "assigned_area",
+        "pincode": "assigned_area__pincode",
+        "city": "assigned_area__pincode__city",
+        "zone": "assigned_area__pincode__city__zone",
+        "region": "assigned_area__pincode__city__zone__region",
+    },
+}
+
+# Field displayed for each region level
+USER_ASSIGNMENT_LEVEL_LABEL_FIELDS: Dict[str, str] = {
+    "region": "title",
+    "zone": "title",
+    "city": "city_name",
+    "pincode": "pincode__pincode",
+    "area": "title",
+}
+
+# Assignments each role is resolved from, as in the `get_user_instance_assigned_*_queryset` helpers
+USER_ROLE_ASSIGNMENT_FIELDS: Dict[str, List[str]] = {
+    UserRoleEnum.SR_MANAGER.value: ["assigned_region"],
+    UserRoleEnum.MANAGER.value: ["assigned_zone"],
+    UserRoleEnum.SUPERVISOR.value: [
+        "assigned_city",
+        "assigned_pincode",
+        "assigned_area",
+    ],
+    UserRoleEnum.FIELD_OFFICER.value: [
+        "assigned_city",
+        "assigned_pincode",
+        "assigned_area",
+    ],
+}
+
+
+class UserAssignmentResolver:
+    """
+    Batch equivalent of the `get_user_instance_assigned_*_queryset` helpers and
+    of the reporting users check, for a page of users.
+
+    Loads, in one query per assignment field used by the roles on the page plus
+    one query for the reporting users, every assigned region level of every user.
+
+    Attributes:
+        user_ids (Set[str]): Users the resolver was built for.
+        assignments (Dict[Tuple[str, str], List[str]]): Assigned labels keyed by (user id, level).
+        reporting_user_ids (Set[str]): Users that at least one user reports to.
+    """
+
+    user_ids: Set[str]
+    assignments: Dict[Tuple[str, str], List[str]]
+    reporting_user_ids: Set[str]
+
+    def __init__(self, user_instances: Iterable[UserModel]):
+        user_instances: List[UserModel] = list(user_instances)
+        self.user_ids = {str(user_instance.pk) for user_instance in user_instances}
+        self.assignments = {}
+
+        # ? group users by the assignment fields their role is resolved from
+        assignment_user_ids: Dict[str, List[str]] = {}
+        for user_instance in user_instances:
+            for assignment_field in USER_ROLE_ASSIGNMENT_FIELDS.get(
+                user_instance.user_role.role if user_instance.user_role else None, []
+            ):
+                assignment_user_ids.setdefault(assignment_field, []).append(
+                    user_instance.pk
+                )
+
+        seen: Set[Tuple[str, str, str]] = set()
+        for assignment_field, user_ids in assignment_user_ids.items():
+            level_paths: Dict[str, str] = USER_ASSIGNMENT_LEVEL_PATHS[assignment_field]
+            value_fields: List[str] = ["pk"]
+            for level, path in level_paths.items():
+                value_fields.extend(
+                    [
+                        f"{path}__pk",
+                        f"{path}__{USER_ASSIGNMENT_LEVEL_LABEL_FIELDS[level]}",
+                    ]
+                )
+
+            for row in (
+                UserDetailModel.objects.filter(
+                    pk__in=user_ids, **{f"{assignment_field}__isnull": False}
+                )
+                .values_list(*value_fields)
+                .order_by(f"{assignment_field}__core_generic_created_at")
+            ):
+                user_id: str = str(row[0])
+                for idx, level in enumerate(level_paths):
+                    level_pk, label = row[1 + 2 * idx], row[2 + 2 * idx]
+                    if level_pk is None or (user_id, level, level_pk) in seen:
+                        continue
+                    seen.add((user_id, level, level_pk))
+                    self.assignments.setdefault((user_id, level), []).append(label)
+
+        self.reporting_user_ids = {
+            str(reports_to_id)
+            for reports_to_id in UserModel.objects.filter(
+                reports_to__in=[user_instance.pk for user_instance in user_instances]
+            )
+            .values_list("reports_to", flat=True)
+            .distinct()
+        }
+
+    def __contains__(self, user_instance: UserModel) -> bool:
+        return str(user_instance.pk) in self.user_ids
+
+    def get_assigned(self, user_instance: UserModel, level: str) -> List[str]:
+        """
+        Args:
+            user_instance (UserModel): A user the resolver was built for.
+            level (str): One of region, zone, city, pincode or area.
+
+        Returns:
+            List[str]: Labels of the assigned `level` entries of the user.
+        """
+        return self.assignments.get((str(user_instance.pk), level), [])
+
+    def has_reporting_users(self, user_instance: UserModel) -> bool:
+        return str(user_instance.pk) in self.reporting_user_ids
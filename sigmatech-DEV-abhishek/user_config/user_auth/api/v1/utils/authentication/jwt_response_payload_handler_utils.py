@@ -11,8 +11,10 @@ from rest_framework.request import Request
 from core.settings import logger
 from core_utils.activity_monitoring.enums import ActivityMonitoringMethodTypeEnumChoices
 from core_utils.activity_monitoring.models import ActivityMonitoringLogModel
+from core_utils.utils.db_utils.activity_log_buffer import activity_log_buffer
 from core_utils.utils.db_utils.activity_monitoring import activity_monitoring_logger
 from user_config.user_auth.models import BlackListTokenModel, LoginAnalyticsModel
+from user_config.user_auth.utils.token_state import invalidate_token_state
 
 # ? ? Configuring logger with the app name "JWTSettings"
 logger = logging.LoggerAdapter(logger, {"app_name": "JWTSettings"})
@@ -124,9 +126,15 @@ class UserLoginCreateUtils:
             # ? If re-login is requested, deactivate existing tokens
             if self.request.data.get("re_login", False):
                 if not DISABLE_MULTI_LOGIN:
+                    deactivated_tokens: List[str] = list(
+                        active_blacklist_token_instances.values_list("token", flat=True)
+                    )
                     tokens_updated: int = active_blacklist_token_instances.update(
                         is_login=False, is_delete=True
                     )
+                    transaction.on_commit(
+                        lambda: invalidate_token_state(*deactivated_tokens)
+                    )
                     logger.info(f"Tokens Deactivated: {tokens_updated}")
 
             # ? Create new blacklist token entry
@@ -146,10 +154,10 @@ class UserLoginCreateUtils:
                 )
             )
 
-            activity_log_instance.description = (
-                f"{self.user_instance.username} logged in successfully"
+            activity_log_buffer.update(
+                activity_log_instance,
+                description=f"{self.user_instance.username} logged in successfully",
             )
-            activity_log_instance.save()
             logger.info(f"New Blacklist Token Created: {latest_blacklist_token}")
 
             # ? Record user login analytics
@@ -3,13 +3,14 @@ from typing import Dict, Optional, Union
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
 from django.db import transaction
+from django.db.models.query import QuerySet
 
 from core_utils.utils.format_validator import (
     is_format_validator_email,
     is_valid_password,
 )
 from core_utils.utils.generics.serializers.mixins import CoreGenericBaseHandler
-from core_utils.utils.jwt_token_utils import decode_jwt, encode_jwt
+from core_utils.utils.jwt_token_utils import decode_jwt, encode_jwt, get_token_digest
 from user_config.user_auth.api.v1.utils.constants import (
     FAILED_TO_RESET_PASSWORD_ERROR_MESSAGE,
     INCORRECT_CREDENTIALS_ERROR_MESSAGE,
@@ -22,6 +23,7 @@ from user_config.user_auth.models import BlackListTokenModel
 from user_config.user_auth.utils.email_templates.forgot_password_email_templates import (
     forgot_password_send_email,
 )
+from user_config.user_auth.utils.token_state import invalidate_token_state
 
 
 class UserAuthUserForgotPasswordHandler(CoreGenericBaseHandler):
@@ -138,15 +140,19 @@ class UserAuthUserResetPasswordHandler(CoreGenericBaseHandler):
             return self.set_error_message(
                 error_message=PASSWORD_VALIDATION_ERROR_MESSAGE
             )
-        if not BlackListTokenModel.objects.filter(token=self.data["token"]).exists():
+        token_queryset: QuerySet[BlackListTokenModel] = (
+            BlackListTokenModel.objects.filter(
+                token_digest=get_token_digest(token=self.data["token"]),
+                token=self.data["token"],
+            )
+        )
+        if not token_queryset.exists():
             self.context["logger"].warning("Token not found in database.")
             return self.set_error_message(
                 error_message=FAILED_TO_RESET_PASSWORD_ERROR_MESSAGE
             )
 
-        if not BlackListTokenModel.objects.filter(
-            token__iexact=self.data["token"], is_login=True
-        ).exists():
+        if not token_queryset.filter(is_login=True).exists():
             self.context["logger"].warning("Token expired or already used.")
             return self.set_error_message(
                 error_message=INVALID_PASSWORD_LINK_OR_EXPIRED_ERROR_MESSAGE
@@ -193,8 +199,14 @@ class UserAuthUserResetPasswordHandler(CoreGenericBaseHandler):
                 )
 
                 BlackListTokenModel.objects.filter(
-                    token=self.data["token"], is_delete=False, is_login=True
+                    token_digest=get_token_digest(token=self.data["token"]),
+                    token=self.data["token"],
+                    is_delete=False,
+                    is_login=True,
                 ).update(is_delete=True, is_login=False)
+                transaction.on_commit(
+                    lambda token=self.data["token"]: invalidate_token_state(token)
+                )
                 self.context["logger"].info(
                     f"Token {self.data['token']} marked as used."
                 )
@@ -4,10 +4,12 @@ from core_utils.utils.generics.serializers.mixins import CoreGenericBaseHandler
 from user_config.user_auth.api.v1.utils.constants import (
     USER_LOGOUT_INCORRECT_USER_ERROR_MESSAGE,
 )
+from core_utils.utils.jwt_token_utils import get_token_digest
 from user_config.user_auth.models import BlackListTokenModel
 from user_config.user_auth.utils.custom_authentication.validations import (
     ExtractAuthenticationDetails,
 )
+from user_config.user_auth.utils.token_state import invalidate_token_state
 
 
 class UserAuthUserModelLogoutHandler(CoreGenericBaseHandler):
@@ -43,6 +45,7 @@ class UserAuthUserModelLogoutHandler(CoreGenericBaseHandler):
 
         # Check if the token exists for the logged-in, non-deleted user
         if not self.queryset.filter(
+            token_digest=get_token_digest(token=user_token),
             token=user_token,
             user=self.request.user,
             is_login=True,
@@ -66,6 +69,7 @@ class UserAuthUserModelLogoutHandler(CoreGenericBaseHandler):
             with transaction.atomic():
                 # Update token status to reflect logout
                 self.queryset.filter(
+                    token_digest=get_token_digest(token=self.data["token"]),
                     token=self.data["token"],
                     user=self.request.user,
                     is_login=True,
@@ -75,8 +79,13 @@ class UserAuthUserModelLogoutHandler(CoreGenericBaseHandler):
                     is_delete=True,
                 )
                 instance: BlackListTokenModel = self.queryset.filter(
+                    token_digest=get_token_digest(token=self.data["token"]),
                     token=self.data["token"],
                 ).last()
+                # ? drop the cached "logged in" state of the token
+                transaction.on_commit(
+                    lambda token=self.data["token"]: invalidate_token_state(token)
+                )
                 # Remove token from response data
                 self.data.pop("token")
                 self.set_toast_message_value(value=self.request.user.username)
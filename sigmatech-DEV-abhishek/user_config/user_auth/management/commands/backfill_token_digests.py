@@ -0,0 +1,51 @@
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from core_utils.utils.jwt_token_utils import get_token_digest
+from user_config.user_auth.models import BlackListTokenModel
+
+
+class Command(BaseCommand):
+    help: str = (
+        "Fill JWT_TOKEN_DIGEST of stored tokens saved before the digest existed, "
+        "tokens without a digest fail authentication"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Tokens updated per batch",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Include logged out tokens",
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        queryset = BlackListTokenModel.objects.filter(token_digest__isnull=True)
+        if not options["all"]:
+            queryset = queryset.filter(is_login=True)
+
+        updated_count: int = 0
+        while True:
+            token_instances: List[BlackListTokenModel] = list(
+                queryset.only("pk", "token")[: options["batch_size"]]
+            )
+            if not token_instances:
+                break
+            for token_instance in token_instances:
+                token_instance.token_digest = get_token_digest(
+                    token=token_instance.token
+                )
+            with transaction.atomic():
+                BlackListTokenModel.objects.bulk_update(
+                    token_instances, fields=["token_digest"]
+                )
+            updated_count += len(token_instances)
+
+        self.stdout.write(f"Filled the digest of {updated_count} tokens")
@@ -11,6 +11,7 @@ from django.contrib.auth.models import (
 from django.db import models, transaction
 
 from core_utils.utils.generics.generic_models import CoreGenericModel
+from core_utils.utils.jwt_token_utils import get_token_digest
 from user_config.user_auth.enums import UserRoleEnum
 
 
@@ -154,6 +155,13 @@ class BlackListTokenModel(CoreGenericModel):
         editable=False,
     )
     token = models.TextField(db_column="JWT_TOKEN")
+    token_digest = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        editable=False,
+        db_column="JWT_TOKEN_DIGEST",
+    )
     user = models.ForeignKey(
         UserModel,
         on_delete=models.CASCADE,
@@ -163,8 +171,24 @@ class BlackListTokenModel(CoreGenericModel):
     is_login = models.BooleanField(default=False, db_column="IS_LOGIN")
     is_delete = models.BooleanField(default=False, db_column="IS_DELETE")
 
+    def save(self, *args, **kwargs):
+        # ? keep the indexed digest in sync with the token
+        self.token_digest = get_token_digest(token=self.token)
+        if (
+            kwargs.get("update_fields") is not None
+            and "token" in kwargs["update_fields"]
+        ):
+            kwargs["update_fields"] = {*kwargs["update_fields"], "token_digest"}
+        return super().save(*args, **kwargs)
+
     class Meta:
         db_table = "USER_BLACK_LIST_TOKEN_TABLE"
+        indexes = [
+            models.Index(
+                fields=["token_digest", "is_login"],
+                name="BLACK_LIST_TOKEN_DIGEST_IDX",
+            ),
+        ]
 
 
 class LoginAnalyticsModel(CoreGenericModel):
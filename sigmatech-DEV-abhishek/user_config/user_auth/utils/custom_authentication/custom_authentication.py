@@ -1,11 +1,8 @@
-from rest_framework_jwt.authentication import (
-    JSONWebTokenAuthentication,
-    get_authorization_header,
-)
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 import logging
 from core.settings import logger
 from rest_framework.request import Request
-from typing import List
+from typing import Dict, Optional
 from user_config.user_auth.utils.custom_authentication.validations import (
     CustomAuthenticationValidator,
 )
@@ -20,10 +17,11 @@ class CustomAuthentication(JSONWebTokenAuthentication):
     logger = logging.LoggerAdapter(logger, {"app_name": "CustomAuthentication"})
 
     www_authenticate_realm: str = "api"
+    # ? payload decoded while validating the token, reused by `authenticate`
+    token_payload: Optional[Dict] = None
 
     def get_token_from_request(self, request: Request):
 
-        auth: List = get_authorization_header(request).split()
         custom_validator: CustomAuthenticationValidator = CustomAuthenticationValidator(
             request=request
         )
@@ -31,4 +29,11 @@ class CustomAuthentication(JSONWebTokenAuthentication):
 
         if validator:
             raise exceptions.AuthenticationFailed(validator)
-        return auth[1]
+        self.token_payload = custom_validator.payload
+        return custom_validator.authentication_details.jwt_token
+
+    def jwt_decode_token(self, token) -> Dict:
+        # ? the token is decoded once per request, by the validator
+        if self.token_payload:
+            return self.token_payload
+        return super().jwt_decode_token(token)
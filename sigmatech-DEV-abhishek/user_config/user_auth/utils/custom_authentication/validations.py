@@ -2,14 +2,14 @@ from rest_framework.request import Request
 from rest_framework_jwt.authentication import (
     get_authorization_header,
 )
-from typing import List, ByteString, Union, Callable
+from typing import Dict, List, ByteString, Union, Callable
 from rest_framework_jwt.settings import api_settings
 from django.utils.encoding import smart_str
 import logging
 from core.settings import logger
 from django.conf import settings
-from user_config.user_auth.models import BlackListTokenModel
 from core_utils.utils.jwt_token_utils import JwtTokenUtils
+from user_config.user_auth.utils.token_state import is_token_active
 
 DISABLE_MULTI_LOGIN: List = getattr(settings, "DISABLE_MULTI_LOGIN", True)
 
@@ -48,6 +48,7 @@ class ExtractAuthenticationDetails:
 class CustomAuthenticationValidator:
     request: Request
     authentication_details: ExtractAuthenticationDetails
+    jwt_token_util: JwtTokenUtils
     logger = logging.LoggerAdapter(
         logger, {"app_name": "CustomAuthenticationValidator"}
     )
@@ -55,6 +56,16 @@ class CustomAuthenticationValidator:
     def __init__(self, request: Request):
         self.request = request
         self.authentication_details = ExtractAuthenticationDetails(request=request)
+        self.jwt_token_util = JwtTokenUtils(
+            jwt_token=self.authentication_details.jwt_token
+        )
+
+    @property
+    def payload(self) -> Dict:
+        """
+        Payload of the token, decoded once by `token_validator`.
+        """
+        return self.jwt_token_util.decrypt_jwt_token()
 
     def auth_headers_length_validator(self) -> Union[str, None]:
         if not self.authentication_details.jwt_token:
@@ -88,19 +99,13 @@ class CustomAuthenticationValidator:
             if isinstance(self.authentication_details.jwt_token, bytes)
             else self.authentication_details.jwt_token
         )
-        blacklist_token_queryset = BlackListTokenModel.objects.filter(
-            token=jwt_token, is_login=True
-        )
-        if not blacklist_token_queryset.exists():
+        if not is_token_active(token=jwt_token, expires_at=self.payload.get("exp")):
             error_message: str = "Signature has expired"
             self.logger.error(error_message)
             return error_message
 
     def token_validator(self) -> Union[str, None]:
-        jwt_token_util: JwtTokenUtils = JwtTokenUtils(
-            jwt_token=self.authentication_details.jwt_token
-        )
-        if jwt_token_util.is_token_expired():
+        if self.jwt_token_util.is_token_expired():
             return "jwt token expired"
 
     def validator(self) -> str:
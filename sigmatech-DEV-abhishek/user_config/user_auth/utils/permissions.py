@@ -0,0 +1,19 @@
+from rest_framework import permissions
+from rest_framework.request import Request
+
+from user_config.user_auth.enums import UserRoleEnum
+
+
+class IsAdminRolePermission(permissions.BasePermission):
+    """
+    Allows the users with the ADMIN role only.
+    """
+
+    def has_permission(self, request: Request, view) -> bool:
+        user_role = getattr(request.user, "user_role", None)
+        return bool(
+            request.user
+            and request.user.is_authenticated
+            and user_role
+            and user_role.role == UserRoleEnum.ADMIN.value
+        )
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple, Union
+
+from django.conf import settings
+
+from core.settings import logger
+from core_utils.utils.jwt_token_utils import get_token_digest
+from user_config.user_auth.models import BlackListTokenModel
+
+logger = logging.LoggerAdapter(logger, {"app_name": __name__})
+
+
+class TokenStateCache:
+    """
+    In-process cache of token validation results keyed by token digest.
+
+    An entry is reused until the earliest of its TTL and the token expiry, so a
+    logout done through another process is seen at most `ttl` seconds later;
+    logouts in this process invalidate the entry immediately.
+
+    Attributes:
+        ttl (int): Seconds an entry is reused.
+        max_size (int): Entries kept, the least recently used are evicted first.
+    """
+
+    ttl: int
+    max_size: int
+
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[bool, float]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, token_digest: str) -> Optional[bool]:
+        """
+        Returns:
+            Optional[bool]: Cached validation result, None if missing or stale.
+        """
+        with self._lock:
+            entry: Optional[Tuple[bool, float]] = self._entries.get(token_digest)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[token_digest]
+                return None
+            self._entries.move_to_end(token_digest)
+            return entry[0]
+
+    def set(
+        self, token_digest: str, is_active: bool, expires_in: Optional[float] = None
+    ) -> None:
+        """
+        Args:
+            token_digest (str): Digest of the token.
+            is_active (bool): Validation result.
+            expires_in (Optional[float]): Seconds until the token expires, caps the TTL.
+        """
+        if self.ttl <= 0:
+            return
+        ttl: float = self.ttl if expires_in is None else min(self.ttl, expires_in)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[token_digest] = (is_active, time.monotonic() + ttl)
+            self._entries.move_to_end(token_digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token_digests: Iterable[str]) -> None:
+        with self._lock:
+            for token_digest in token_digests:
+                self._entries.pop(token_digest, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_state_cache: TokenStateCache = TokenStateCache(
+    ttl=settings.TOKEN_STATE_CACHE_TTL, max_size=settings.TOKEN_STATE_CACHE_MAX_SIZE
+)
+
+
+def _to_str_token(token: Union[str, bytes]) -> str:
+    return token.decode("utf-8") if isinstance(token, bytes) else token
+
+
+def is_token_active(
+    token: Union[str, bytes], expires_at: Optional[float] = None
+) -> bool:
+    """
+    Checks that the token belongs to an active login (`is_login=True`), through
+    the in-process cache and then the indexed token digest.
+
+    Args:
+        token (Union[str, bytes]): JWT token.
+        expires_at (Optional[float]): Token `exp` timestamp, caps how long the result is cached.
+
+    Returns:
+        bool: True if the token is logged in.
+    """
+    token_digest: str = get_token_digest(token=token)
+    is_active: Optional[bool] = token_state_cache.get(token_digest=token_digest)
+    if is_active is not None:
+        return is_active
+
+    token: str = _to_str_token(token)
+    # ? the token is compared as well, on the single row found through the digest index
+    is_active: bool = BlackListTokenModel.objects.filter(
+        token_digest=token_digest, token=token, is_login=True
+    ).exists()
+    token_state_cache.set(
+        token_digest=token_digest,
+        is_active=is_active,
+        expires_in=expires_at - time.time() if expires_at else None,
+    )
+    return is_active
+
+
+def invalidate_token_state(*tokens: Union[str, bytes]) -> None:
+    """
+    Drops the cached validation result of the given tokens, to be called
+    whenever tokens are logged out.
+    """
+    token_state_cache.invalidate(
+        token_digests=[get_token_digest(token=token) for token in tokens if token]
+    )
+    logger.info(f"Invalidated token state of {len(tokens)} tokens")